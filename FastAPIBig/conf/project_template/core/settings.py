@@ -23,3 +23,120 @@ ALLOWED_HOSTS = []
 
 # Default to SQLite if the user doesn't configure a database
 DATABASE_URL = f"sqlite+aiosqlite:///{BASE_DIR}/db.sqlite3"
+
+# Run each request in a single database transaction: every ORM call shares one
+# session and the transaction is committed once, before the response is sent.
+ATOMIC_REQUESTS = True
+
+# Read replicas: read-only ORM operations are spread over these databases, by
+# "round_robin" or "least_connections". After a write, the client keeps reading
+# from the primary for DATABASE_READ_YOUR_WRITES seconds.
+DATABASE_REPLICA_URLS = []
+DATABASE_REPLICA_POLICY = "round_robin"
+DATABASE_READ_YOUR_WRITES = 5
+
+# Connection pool of every engine (see FastAPIBig.orm.base.pool). Set "pgbouncer"
+# to True behind PgBouncer in transaction mode to disable prepared statements.
+DATABASE_POOL = {
+    # "pool_size": 5,
+    # "max_overflow": 10,
+    # "pool_timeout": 30,
+    # "pool_recycle": 1800,
+    # "pool_pre_ping": True,
+    # "pgbouncer": False,
+}
+
+# Query instrumentation: log a summary of the queries of each request, flagging
+# statements repeated DATABASE_N_PLUS_ONE_THRESHOLD times (N+1 patterns); in
+# DEBUG mode the stats are also sent as X-DB-* response headers. Queries slower
+# than DATABASE_SLOW_QUERY_MS are logged (None disables the slow-query log).
+DATABASE_INSTRUMENTATION = DEBUG
+DATABASE_N_PLUS_ONE_THRESHOLD = 5
+DATABASE_SLOW_QUERY_MS = 200
+
+# Additional databases, each with its own engine and pool. Entries accept URL,
+# REPLICA_URLS, REPLICA_POLICY, READ_YOUR_WRITES and POOL; the "default"
+# database is configured by the DATABASE_* settings above.
+DATABASES = {
+    # "events": {"URL": f"sqlite+aiosqlite:///{BASE_DIR}/events.sqlite3"},
+}
+
+# Assign models to databases by module prefix, e.g. every model of an app.
+# A model can also declare `__database__ = "events"`.
+DATABASE_ROUTES = {
+    # "apps.events": "events",
+}
+
+# Internal endpoint returning the live pool stats of each database (None disables it).
+DATABASE_POOL_STATS_PATH = None
+
+# Prebuilt statements of the ORM's hot queries (get by primary key, first,
+# exists, count, validation checks) and querysets, cached by query shape with
+# their values bound (see FastAPIBig.orm.base.statements).
+STATEMENT_CACHE = {
+    "maxsize": 1024,
+    "enabled": True,
+}
+
+# Internal endpoint returning the hit rates of the statement cache (None disables it).
+STATEMENT_CACHE_STATS_PATH = None
+
+# Batch loader of `ORM.load` (and of `get` on models or views with `batch_get`):
+# lookups by primary key made within "window" seconds (0: the same event loop
+# iteration) run as one IN query, up to "max_batch" keys. With "memo", each
+# request reuses the records it already loaded (see FastAPIBig.orm.base.batching).
+BATCH_LOADER = {
+    "window": 0,
+    "max_batch": 1000,
+    "memo": True,
+}
+
+# Internal endpoint returning the counters of the batch loader (None disables it).
+BATCH_LOADER_STATS_PATH = None
+
+# Default backend of the HTTP response cache of the views declaring `cache`
+# (see FastAPIBig.views.apis.caching): "memory", an in-process LRU, or "redis",
+# shared by the workers, e.g. {"backend": "redis", "url": "redis://localhost:6379/0"}.
+RESPONSE_CACHE = {
+    "backend": "memory",
+    "maxsize": 1024,
+}
+
+# Internal endpoint returning the hit rates of the response cache (None disables it).
+RESPONSE_CACHE_STATS_PATH = None
+
+# Prometheus endpoint of the route metrics (None disables it). With several
+# workers, set METRICS_DIR to a directory shared by them so every scrape
+# reports the metrics of all workers.
+METRICS_PATH = "/metrics"
+METRICS_DIR = None
+METRICS_FLUSH_INTERVAL = 5
+
+# Internal endpoint returning, per route of the views enabling `coalesce`, the
+# ratio of requests that shared the result of an identical request in flight
+# (see FastAPIBig.views.apis.coalescing). None disables it.
+COALESCING_STATS_PATH = None
+
+# Background hooks of the operations (on_create, on_get, ...): at most
+# "concurrency" run at a time and "queue_size" more wait for a slot. When the
+# queue is full, "policy" either blocks the request ("block"), discards the hook
+# ("drop") or queues it anyway ("spill"). Pending hooks get "shutdown_timeout"
+# seconds to finish when the server stops.
+BACKGROUND_TASKS = {
+    "concurrency": 100,
+    "queue_size": 1000,
+    "policy": "block",
+    "shutdown_timeout": 30,
+}
+
+# Internal endpoint returning the counters of the background hooks (None disables it).
+BACKGROUND_TASKS_STATS_PATH = None
+
+# Pools running the functions and hooks decorated with @offload (see
+# FastAPIBig.views.apis.offload). None sizes the process pool to the number of
+# CPUs and the thread pool to the ThreadPoolExecutor default.
+OFFLOAD_EXECUTORS = {
+    "process_workers": None,
+    "thread_workers": None,
+    "start_method": "spawn",
+}
@@ -1,8 +1,62 @@
 from FastAPIBig.orm.base.base_model import ORMSession
 from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
+from FastAPIBig.orm.base.routing import DEFAULT_DATABASE
 from FastAPIBig.conf.settings import get_project_settings, get_declarative_base
 
 settings = get_project_settings()
 Base = get_declarative_base()
-db_manager = DataBaseSessionManager(settings.DATABASE_URL)
-ORMSession.initialize(db_manager)
+
+
+def get_database_configs(settings) -> dict:
+    """
+    Returns the configuration of every database, keyed by alias.
+
+    Databases are declared in the `DATABASES` setting, e.g.:
+
+        DATABASES = {
+            "default": {"URL": "postgresql+asyncpg://.../core"},
+            "events": {"URL": "postgresql+asyncpg://.../events", "POOL": {"pool_size": 20}},
+        }
+
+    Each entry accepts `URL`, `REPLICA_URLS`, `REPLICA_POLICY`, `READ_YOUR_WRITES`,
+    `POOL` and `SLOW_QUERY_MS`. Missing keys of the "default" database fall back to the flat
+    `DATABASE_URL`, `DATABASE_REPLICA_URLS`, ... settings, so projects without
+    `DATABASES` keep working unchanged.
+
+    Raises:
+        KeyError: If a database has no URL.
+    """
+    databases = dict(getattr(settings, "DATABASES", None) or {})
+    databases[DEFAULT_DATABASE] = {
+        "URL": getattr(settings, "DATABASE_URL", None),
+        "REPLICA_URLS": getattr(settings, "DATABASE_REPLICA_URLS", None),
+        "REPLICA_POLICY": getattr(settings, "DATABASE_REPLICA_POLICY", "round_robin"),
+        "READ_YOUR_WRITES": getattr(settings, "DATABASE_READ_YOUR_WRITES", 0),
+        "POOL": getattr(settings, "DATABASE_POOL", None),
+        **databases.get(DEFAULT_DATABASE, {}),
+    }
+    for alias, config in databases.items():
+        if not config.get("URL"):
+            raise KeyError(f"Database '{alias}' has no URL.")
+    return databases
+
+
+db_managers = {
+    alias: DataBaseSessionManager(
+        config["URL"],
+        replica_urls=config.get("REPLICA_URLS"),
+        replica_policy=config.get("REPLICA_POLICY", "round_robin"),
+        read_your_writes=config.get("READ_YOUR_WRITES", 0),
+        pool=config.get("POOL"),
+        slow_query_ms=config.get(
+            "SLOW_QUERY_MS", getattr(settings, "DATABASE_SLOW_QUERY_MS", None)
+        ),
+    )
+    for alias, config in get_database_configs(settings).items()
+}
+db_manager = db_managers[DEFAULT_DATABASE]
+ORMSession.initialize(
+    db_manager,
+    databases=db_managers,
+    routes=getattr(settings, "DATABASE_ROUTES", None),
+)
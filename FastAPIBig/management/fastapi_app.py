@@ -2,11 +2,29 @@ import os
 import inspect
 import importlib
 import sys
+import contextlib
 
 from fastapi import FastAPI
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from fastapi.responses import PlainTextResponse
+
 from FastAPIBig.views.apis.base import BaseAPI
+from FastAPIBig.views.apis.metrics import registry as metrics_registry
+from FastAPIBig.views.apis.caching import configure_backend, stats as response_cache_stats
+from FastAPIBig.views.apis.coalescing import stats as coalescing_stats
+from FastAPIBig.views.apis.tasks import supervisor
+from FastAPIBig.views.apis.offload import executors
+from FastAPIBig.management import settings, db_managers, Base
+from FastAPIBig.orm.base.metadata import register_models
+from FastAPIBig.orm.base.statements import statement_cache
+from FastAPIBig.orm.base import batching
+from FastAPIBig.management.middlewares import (
+    BatchLoadMemoMiddleware,
+    UnitOfWorkMiddleware,
+    ReadReplicaMiddleware,
+    QueryInstrumentationMiddleware,
+)
 
 
 def is_locally_defined(cls):
@@ -36,6 +54,37 @@ def is_locally_defined(cls):
     )
 
 
+def add_lifespan_hooks(app: FastAPI, startup=None, shutdown=None):
+    """
+    Runs async callbacks when the application starts and shuts down.
+
+    The application's lifespan is wrapped rather than relying on `on_startup`
+    and `on_shutdown` handlers, so the callbacks also run when `core.app`
+    defines its own lifespan. Hooks added later start first and stop last.
+
+    Args:
+        app (FastAPI): The application.
+        startup (Callable[[], Awaitable], optional): The coroutine function
+            awaited on startup.
+        shutdown (Callable[[], Awaitable], optional): The coroutine function
+            awaited on shutdown.
+    """
+    lifespan = app.router.lifespan_context
+
+    @contextlib.asynccontextmanager
+    async def wrapped_lifespan(app_):
+        if startup is not None:
+            await startup()
+        try:
+            async with lifespan(app_) as state:
+                yield state
+        finally:
+            if shutdown is not None:
+                await shutdown()
+
+    app.router.lifespan_context = wrapped_lifespan
+
+
 def get_app():
     """
     Initializes and configures a FastAPI application instance.
@@ -49,6 +98,15 @@ def get_app():
 
     Functionality:
         - Dynamically imports and adds middlewares from the `core.middlewares` module.
+        - Adds the `UnitOfWorkMiddleware` when `ATOMIC_REQUESTS` is enabled in settings,
+          so each request shares one database session and commits once.
+        - Adds the `ReadReplicaMiddleware` when `DATABASE_REPLICA_URLS` is set, so
+          clients read their own writes from the primary.
+        - Configures the batch loader of `ORM.load` from `BATCH_LOADER`, adding the
+          `BatchLoadMemoMiddleware` unless its "memo" is False, and exposes its
+          counters at `BATCH_LOADER_STATS_PATH`, if set.
+        - Adds the `QueryInstrumentationMiddleware` when `DATABASE_INSTRUMENTATION` is
+          enabled, reporting the queries of each request (as headers in DEBUG mode).
         - Dynamically imports and registers routes and API endpoints:
             - Feature-based structure: Scans the `apps` directory for subdirectories,
               and imports routes from `apps.<feature>.routes`.
@@ -56,6 +114,22 @@ def get_app():
               and imports routes from `apps.routes.<route_file>`.
         - Automatically includes routers defined in modules or subclasses of `BaseAPI`
           with the `include_router` attribute set to `True`.
+        - Exposes the connection pool stats at `DATABASE_POOL_STATS_PATH`, if set.
+        - Sizes the ORM statement cache from `STATEMENT_CACHE`, and exposes its hit
+          rates at `STATEMENT_CACHE_STATS_PATH`, if set.
+        - Configures the default backend of the HTTP response cache from
+          `RESPONSE_CACHE`, closing it on shutdown, and exposes its hit rates at
+          `RESPONSE_CACHE_STATS_PATH`, if set.
+        - Exposes the route metrics in the Prometheus text format at `METRICS_PATH`,
+          if set, merging the workers sharing `METRICS_DIR`, to which a background
+          task of the lifespan writes this worker's metrics.
+        - Exposes the coalescing ratio of the routes at `COALESCING_STATS_PATH`, if set.
+        - Configures the supervisor of the operation hooks from `BACKGROUND_TASKS`,
+          draining it on shutdown, and exposes its stats at
+          `BACKGROUND_TASKS_STATS_PATH`, if set.
+        - Sizes the pools of the `offload` decorator from `OFFLOAD_EXECUTORS`, and
+          ties their lifecycle to the application's lifespan.
+        - Precomputes the metadata of every model mapped by the project's `Base`.
 
     Notes:
         - Middlewares are added only if they are subclasses of `BaseHTTPMiddleware`
@@ -82,6 +156,32 @@ def get_app():
 
     add_middlewares()
 
+    if getattr(settings, "ATOMIC_REQUESTS", False):
+        app.add_middleware(UnitOfWorkMiddleware, db_managers=list(db_managers.values()))
+
+    # Added last so it wraps the unit of work and sees its writes. The routing
+    # state is shared by all databases; the longest read-your-writes window wins.
+    replicated = [m for m in db_managers.values() if m._replica_sessionmakers]
+    if replicated:
+        app.add_middleware(
+            ReadReplicaMiddleware,
+            db_manager=max(replicated, key=lambda m: m.read_your_writes),
+        )
+
+    batch_loader = dict(getattr(settings, "BATCH_LOADER", None) or {})
+    memo = batch_loader.pop("memo", True)
+    batching.configure(**batch_loader)
+    if memo:
+        app.add_middleware(BatchLoadMemoMiddleware)
+
+    # Outermost, so the commit of the unit of work is counted too.
+    if getattr(settings, "DATABASE_INSTRUMENTATION", False):
+        app.add_middleware(
+            QueryInstrumentationMiddleware,
+            n_plus_one_threshold=getattr(settings, "DATABASE_N_PLUS_ONE_THRESHOLD", 5),
+            headers=getattr(settings, "DEBUG", False),
+        )
+
     apps_dir = os.path.join(os.getcwd(), "apps")
 
     def import_and_register_routes(module_name: str, prefix: str):
@@ -116,6 +216,102 @@ def get_app():
                 module_name = f"apps.routes.{route_file[:-3]}"
                 import_and_register_routes(module_name, prefix=f"/{route_file[:-3]}")
 
+    pool_stats_path = getattr(settings, "DATABASE_POOL_STATS_PATH", None)
+    if pool_stats_path:
+
+        async def pool_stats():
+            return {
+                alias: manager.pool_stats() for alias, manager in db_managers.items()
+            }
+
+        app.add_api_route(
+            pool_stats_path, pool_stats, methods=["GET"], include_in_schema=False
+        )
+
+    statement_cache.configure(**(getattr(settings, "STATEMENT_CACHE", None) or {}))
+    statement_stats_path = getattr(settings, "STATEMENT_CACHE_STATS_PATH", None)
+    if statement_stats_path:
+
+        async def statement_stats():
+            return statement_cache.stats()
+
+        app.add_api_route(
+            statement_stats_path, statement_stats, methods=["GET"], include_in_schema=False
+        )
+
+    response_cache = configure_backend(**(getattr(settings, "RESPONSE_CACHE", None) or {}))
+    add_lifespan_hooks(app, shutdown=response_cache.close)
+    response_stats_path = getattr(settings, "RESPONSE_CACHE_STATS_PATH", None)
+    if response_stats_path:
+
+        async def response_stats():
+            return response_cache_stats.as_dict()
+
+        app.add_api_route(
+            response_stats_path, response_stats, methods=["GET"], include_in_schema=False
+        )
+
+    batch_stats_path = getattr(settings, "BATCH_LOADER_STATS_PATH", None)
+    if batch_stats_path:
+
+        async def batch_stats():
+            return batching.stats.as_dict()
+
+        app.add_api_route(
+            batch_stats_path, batch_stats, methods=["GET"], include_in_schema=False
+        )
+
+    metrics_path = getattr(settings, "METRICS_PATH", None)
+    if metrics_path:
+        metrics_registry.configure(
+            directory=getattr(settings, "METRICS_DIR", None),
+            flush_interval=getattr(settings, "METRICS_FLUSH_INTERVAL", 5.0),
+        )
+        add_lifespan_hooks(
+            app, startup=metrics_registry.start, shutdown=metrics_registry.stop
+        )
+
+        async def metrics():
+            return PlainTextResponse(
+                metrics_registry.render(), media_type="text/plain; version=0.0.4"
+            )
+
+        app.add_api_route(metrics_path, metrics, methods=["GET"], include_in_schema=False)
+
+    coalescing_stats_path = getattr(settings, "COALESCING_STATS_PATH", None)
+    if coalescing_stats_path:
+
+        async def coalescing():
+            return coalescing_stats()
+
+        app.add_api_route(
+            coalescing_stats_path, coalescing, methods=["GET"], include_in_schema=False
+        )
+
+    supervisor.configure(**(getattr(settings, "BACKGROUND_TASKS", None) or {}))
+    add_lifespan_hooks(app, shutdown=supervisor.drain)
+
+    # Added after the supervisor, so pending hooks can still offload while draining.
+    executors.configure(**(getattr(settings, "OFFLOAD_EXECUTORS", None) or {}))
+
+    async def start_executors():
+        executors.start()
+
+    add_lifespan_hooks(app, startup=start_executors, shutdown=executors.aclose)
+
+    tasks_stats_path = getattr(settings, "BACKGROUND_TASKS_STATS_PATH", None)
+    if tasks_stats_path:
+
+        async def tasks_stats():
+            return supervisor.stats()
+
+        app.add_api_route(
+            tasks_stats_path, tasks_stats, methods=["GET"], include_in_schema=False
+        )
+
+    # All models are imported by now: precompute their metadata once.
+    register_models(Base)
+
     return app
 
 
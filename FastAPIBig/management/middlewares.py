@@ -0,0 +1,224 @@
+import contextlib
+import json
+import logging
+import time
+from http.cookies import SimpleCookie
+from typing import Iterable, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from FastAPIBig.orm.base.batching import memo_scope
+from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
+from FastAPIBig.orm.base.instrumentation import track_queries
+
+query_logger = logging.getLogger("FastAPIBig.queries")
+
+
+class UnitOfWorkMiddleware:
+    """
+    UnitOfWorkMiddleware opens one unit of work per HTTP request.
+
+    Every ORM call made while handling the request reuses the same session and
+    connection, and the transaction is committed once. The commit happens right
+    before the response starts, so a failing commit still turns into an error
+    response instead of a success the client has already received. Error
+    responses (status >= 400) and unhandled exceptions roll the transaction back.
+
+    With several databases, one unit of work is opened on each of them and they
+    are committed one after the other. This is not a two-phase commit: if a later
+    commit fails, the earlier ones are not undone.
+
+    Attributes:
+        app (ASGIApp): The wrapped ASGI application.
+        db_managers (List[DataBaseSessionManager]): The session managers providing the sessions.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        db_manager: Optional[DataBaseSessionManager] = None,
+        db_managers: Optional[Iterable[DataBaseSessionManager]] = None,
+    ):
+        self.app = app
+        self.db_managers = list(db_managers or [db_manager])
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with contextlib.AsyncExitStack() as stack:
+            sessions = [
+                await stack.enter_async_context(db_manager.unit_of_work())
+                for db_manager in self.db_managers
+            ]
+            response_started = False
+
+            async def send_wrapper(message: Message):
+                nonlocal response_started
+                if message["type"] == "http.response.start" and not response_started:
+                    response_started = True
+                    for db_manager, session in zip(self.db_managers, sessions):
+                        if message["status"] < 400:
+                            await db_manager.commit_transaction(session)
+                        else:
+                            session.info.pop("on_commit", None)
+                            await session.rollback()
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+class ReadReplicaMiddleware:
+    """
+    ReadReplicaMiddleware keeps the reads of a request on the primary database when
+    they could otherwise miss the client's own recent writes.
+
+    Once a request commits a write, its remaining reads use the primary, and the
+    response sets a cookie pinning the client to the primary for
+    `db_manager.read_your_writes` seconds, which covers the replication lag.
+
+    Attributes:
+        app (ASGIApp): The wrapped ASGI application.
+        db_manager (DataBaseSessionManager): The session manager routing the reads.
+        cookie_name (str): The name of the pinning cookie.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        db_manager: DataBaseSessionManager,
+        cookie_name: str = "fastapibig_primary",
+    ):
+        self.app = app
+        self.db_manager = db_manager
+        self.cookie_name = cookie_name
+
+    def _is_pinned(self, scope: Scope) -> bool:
+        """Tells whether the request carries an unexpired pinning cookie."""
+        for name, value in scope.get("headers", []):
+            if name == b"cookie":
+                morsel = SimpleCookie(value.decode("latin-1")).get(self.cookie_name)
+                if morsel is not None:
+                    try:
+                        return float(morsel.value) > time.time()
+                    except ValueError:
+                        return False
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        window = self.db_manager.read_your_writes
+        with self.db_manager.routing_scope(pinned=self._is_pinned(scope)) as state:
+
+            async def send_wrapper(message: Message):
+                if (
+                    message["type"] == "http.response.start"
+                    and state["wrote"]
+                    and window
+                    and message["status"] < 400
+                ):
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "set-cookie",
+                        f"{self.cookie_name}={time.time() + window:.3f}; "
+                        f"Max-Age={int(window) or 1}; Path=/; HttpOnly; SameSite=Lax",
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+class BatchLoadMemoMiddleware:
+    """
+    BatchLoadMemoMiddleware gives each HTTP request a memo of the records loaded
+    by primary key (see `ORM.load`), so loading one again during the request does
+    not query the database. Writes through the ORM drop the records they change.
+
+    Attributes:
+        app (ASGIApp): The wrapped ASGI application.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with memo_scope():
+            await self.app(scope, receive, send)
+
+
+def endpoint_label(scope: Scope) -> str:
+    """
+    Describes the view handling a request, e.g. "GET /users/ (UserAPI.list)".
+
+    The endpoint is only known once the request has been routed; before that
+    the label is just the method and path.
+    """
+    label = f"{scope.get('method', '')} {scope.get('path', '')}"
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return label
+    owner = getattr(endpoint, "__self__", None)
+    name = getattr(endpoint, "__name__", type(endpoint).__name__)
+    view = f"{type(owner).__name__}.{name}" if owner is not None else name
+    return f"{label} ({view})"
+
+
+class QueryInstrumentationMiddleware:
+    """
+    QueryInstrumentationMiddleware tracks the SQL statements executed per request.
+
+    The number of queries, the database time, the rows and the N+1 suspects of
+    each request are logged as a structured summary on the "FastAPIBig.queries"
+    logger: at DEBUG level, or WARNING when an N+1 pattern is detected. With
+    `headers` enabled (in DEBUG mode) they are also sent as `X-DB-*` and
+    `Server-Timing` response headers.
+
+    Attributes:
+        app (ASGIApp): The wrapped ASGI application.
+        n_plus_one_threshold (int): How many executions of the same statement in a
+            request flag it as an N+1 pattern.
+        headers (bool): Whether to add the query stats to the response headers.
+    """
+
+    def __init__(
+        self, app: ASGIApp, n_plus_one_threshold: int = 5, headers: bool = False
+    ):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.headers = headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(
+            lambda: endpoint_label(scope), self.n_plus_one_threshold
+        ) as stats:
+
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start" and self.headers:
+                    headers = MutableHeaders(scope=message)
+                    for name, value in stats.headers().items():
+                        headers.append(name, value)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                summary = stats.summary()
+                query_logger.log(
+                    logging.WARNING if summary["n_plus_one"] else logging.DEBUG,
+                    "Queries: %s",
+                    json.dumps(summary),
+                    extra={"query_summary": summary},
+                )
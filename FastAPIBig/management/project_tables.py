@@ -1,6 +1,7 @@
 import os
 
-from FastAPIBig.management import db_manager, Base
+from FastAPIBig.management import db_managers, Base
+from FastAPIBig.orm.base.base_model import ORMSession
 
 def import_models():
     """
@@ -50,5 +51,14 @@ def import_models():
 
 
 async def create_project_tables():
+    """
+    Creates the tables of every model on the database it is routed to.
+
+    Raises:
+        Exception: If a model is routed to a database missing from `DATABASES`.
+    """
     import_models()
-    await db_manager.create_all_tables(Base)
+    for alias, tables in ORMSession._router.tables_by_database(Base).items():
+        if alias not in db_managers:
+            raise Exception(f"Database '{alias}' is not configured in DATABASES.")
+        await db_managers[alias].create_all_tables(Base, tables=tables)
@@ -1,10 +1,43 @@
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, inspect
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    delete,
+    and_,
+    or_,
+    exists,
+    literal_column,
+    cast,
+    null,
+    union_all,
+    bindparam,
+)
 from sqlalchemy.orm import DeclarativeBase
-from typing import AsyncIterator, Optional, Type, Any
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.session import make_transient_to_detached
+import asyncio
+import contextlib
+import itertools
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Type, Any
 from sqlalchemy.sql.functions import count
 from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
+from FastAPIBig.orm.base.routing import DEFAULT_DATABASE, DatabaseRouter
+from FastAPIBig.orm.base.metadata import ModelMetadata, get_model_metadata
+from FastAPIBig.orm.base.batching import current_memo, forget, loader_for
+from FastAPIBig.orm.base.batching import stats as loader_stats
+from FastAPIBig.orm.base.cache import enable_model_cache, get_model_cache
+from FastAPIBig.orm.base.loading import build_loader_options, split_related
+from FastAPIBig.orm.base.lookups import compile_lookup, split_lookup
+from FastAPIBig.orm.base.queryset import QuerySet, bind_filters, compile_condition
+from FastAPIBig.orm.base.statements import statement_cache
+from FastAPIBig.orm.base.pagination import (
+    Page,
+    encode_cursor,
+    decode_cursor,
+    coerce_cursor_value,
+)
 
 
 class ORMSession:
@@ -16,21 +49,49 @@ class ORMSession:
         _db_manager (Optional[DataBaseSessionManager]): A class-level attribute that holds
             the reference to the database session manager. It must be initialized before
             using the session-related methods.
+        _db_managers (Dict[str, DataBaseSessionManager]): The session managers of every
+            configured database, keyed by alias ("default" is `_db_manager`).
+        _router (DatabaseRouter): Resolves the database alias of each model.
 
     Methods:
-        initialize(cls, db_manager: DataBaseSessionManager):
+        initialize(cls, db_manager: DataBaseSessionManager, databases: Dict[str, DataBaseSessionManager] = None, routes: Dict[str, str] = None):
             Initializes the ORMSession class with a database session manager instance.
             This method must be called before attempting to access a database session.
 
-        _async_session(cls) -> AsyncIterator[AsyncSession]:
+        database_for(cls, model: type) -> str:
+            Returns the alias of the database a model is stored in.
+
+        _async_session(cls, database: str = None) -> AsyncIterator[AsyncSession]:
             Provides an asynchronous context manager for accessing a database session.
             Raises an exception if the session manager is not initialized.
+
+        _async_read_session(cls, database: str = None, shared: bool = True) -> AsyncIterator[AsyncSession]:
+            Provides a session for read-only operations, routed to a replica when possible.
+
+        _commit(cls, session: AsyncSession, database: str = None, on_commit: Callable = None):
+            Commits a session, deferring to the unit of work when one is active.
+
+        unit_of_work(cls, database: str = None) -> AsyncIterator[AsyncSession]:
+            Shares one session and transaction between all ORM calls in the block.
+
+        atomic(cls, database: str = None) -> AsyncIterator[AsyncSession]:
+            Runs a block of ORM calls atomically.
+
+        on_commit(cls, callback: Callable[[], Awaitable], database: str = None):
+            Awaits a callback once the writes of the current unit of work commit.
     """
 
     _db_manager: Optional["DataBaseSessionManager"] = None
+    _db_managers: Dict[str, "DataBaseSessionManager"] = {}
+    _router: DatabaseRouter = DatabaseRouter()
 
     @classmethod
-    def initialize(cls, db_manager: "DataBaseSessionManager"):
+    def initialize(
+        cls,
+        db_manager: "DataBaseSessionManager",
+        databases: Optional[Dict[str, "DataBaseSessionManager"]] = None,
+        routes: Optional[Dict[str, str]] = None,
+    ):
         """
         Initializes the class with a database session manager.
 
@@ -40,17 +101,60 @@ class ORMSession:
         Args:
             db_manager (DataBaseSessionManager): An instance of the database session manager
                 that will be used for database operations.
+            databases (Dict[str, DataBaseSessionManager], optional): The session managers of
+                additional databases, keyed by alias.
+            routes (Dict[str, str], optional): Database aliases keyed by module prefix,
+                assigning whole apps to a database (see `FastAPIBig.orm.base.routing`).
         """
         cls._db_manager = db_manager
+        cls._db_managers = {**(databases or {}), DEFAULT_DATABASE: db_manager}
+        cls._router = DatabaseRouter(routes)
 
     @classmethod
-    async def _async_session(cls) -> AsyncIterator[AsyncSession]:
+    def database_for(cls, model: type) -> str:
         """
-        Creates an asynchronous session for database operations.
+        Returns the alias of the database a model is stored in.
 
-        This method is a coroutine that yields an `AsyncSession` object, which can be used
-        to interact with the database asynchronously. It ensures that the session is properly
-        managed and closed after use.
+        Args:
+            model (type): The mapped class.
+
+        Returns:
+            str: The database alias.
+        """
+        return cls._router.database_for(model)
+
+    @classmethod
+    def _get_db_manager(cls, database: str = None) -> "DataBaseSessionManager":
+        """
+        Returns the database session manager.
+
+        Args:
+            database (str, optional): The database alias. Defaults to "default".
+
+        Raises:
+            Exception: If the `_db_manager` is not initialized for the Base class,
+                or the database is not configured.
+        """
+        if cls._db_manager is None:
+            raise Exception("DataBaseSessionManager is not initialized for Base.")
+        if database is None or database == DEFAULT_DATABASE:
+            return cls._db_manager
+        try:
+            return cls._db_managers[database]
+        except KeyError:
+            raise Exception(f"Database '{database}' is not configured in DATABASES.")
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def _async_session(cls, database: str = None) -> AsyncIterator[AsyncSession]:
+        """
+        Provides an asynchronous session for database operations.
+
+        Inside a unit of work (see `unit_of_work`) the session bound to the current
+        request is reused; otherwise a new session is opened and closed on exit.
+
+        Args:
+            database (str, optional): The database alias. Defaults to "default".
 
         Raises:
             Exception: If the `_db_manager` is not initialized for the Base class.
@@ -58,11 +162,101 @@ class ORMSession:
         Yields:
             AsyncIterator[AsyncSession]: An asynchronous session for database operations.
         """
-        if cls._db_manager is None:
-            raise Exception("DataBaseSessionManager is not initialized for Base.")
-        async with cls._db_manager.async_session() as session:
+        async with cls._get_db_manager(database).session() as session:
+            yield session
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def _async_read_session(
+        cls, database: str = None, shared: bool = True
+    ) -> AsyncIterator[AsyncSession]:
+        """
+        Provides an asynchronous session for read-only operations.
+
+        When read replicas are configured the session is bound to one of them,
+        unless the current unit of work or client has written recently, in which
+        case reads stay on the primary (see `DataBaseSessionManager.read_session`).
+
+        Args:
+            database (str, optional): The database alias. Defaults to "default".
+            shared (bool, optional): Whether the session of the current unit of work
+                may be reused. Defaults to True.
+
+        Yields:
+            AsyncIterator[AsyncSession]: An asynchronous session for read-only operations.
+        """
+        async with cls._get_db_manager(database).read_session(shared) as session:
             yield session
 
+    @classmethod
+    async def _commit(
+        cls, session: AsyncSession, database: str = None, on_commit: Callable = None
+    ):
+        """
+        Commits the changes made through a session.
+
+        Inside a unit of work the session is only flushed and the commit happens
+        once, when the unit of work exits.
+
+        Args:
+            session (AsyncSession): The session to commit.
+            database (str, optional): The database alias. Defaults to "default".
+            on_commit (Callable, optional): Called once the changes are committed,
+                e.g. to invalidate the caches holding the written records.
+        """
+        await cls._get_db_manager(database).commit(session, on_commit)
+
+    @classmethod
+    def unit_of_work(cls, database: str = None):
+        """
+        Binds one session and transaction to the current context.
+
+        Every ORM call made inside the block reuses the same session and the
+        transaction is committed once on exit (rolled back on error).
+
+        Example:
+            async with ORM.unit_of_work():
+                user = await user_orm.create(name="john")
+                await post_orm.create(title="hello", user_id=user.id)
+
+        Args:
+            database (str, optional): The database alias. Defaults to "default".
+
+        Returns:
+            AsyncContextManager[AsyncSession]: The unit of work context manager.
+        """
+        return cls._get_db_manager(database).unit_of_work()
+
+    @classmethod
+    def atomic(cls, database: str = None):
+        """
+        Runs a block of ORM calls atomically.
+
+        Inside a unit of work the block runs in a savepoint and can fail on its own
+        without aborting the request transaction; otherwise it opens a new unit of
+        work committed on exit.
+
+        Args:
+            database (str, optional): The database alias. Defaults to "default".
+
+        Returns:
+            AsyncContextManager[AsyncSession]: The atomic block context manager.
+        """
+        return cls._get_db_manager(database).atomic()
+
+    @classmethod
+    async def on_commit(cls, callback: Callable[[], Awaitable], database: str = None):
+        """
+        Awaits a callback once the writes of the current unit of work are committed,
+        e.g. to invalidate a cache only when the new data is visible to other
+        connections. Outside a unit of work the callback is awaited right away.
+
+        Args:
+            callback (Callable[[], Awaitable]): The coroutine function to await.
+            database (str, optional): The database alias. Defaults to "default".
+        """
+        await cls._get_db_manager(database).on_commit(callback)
+
 
 class ORM(ORMSession):
     """
@@ -70,8 +264,9 @@ class ORM(ORMSession):
     It includes methods for common CRUD operations, query execution, and validation.
 
     Methods:
-        __init__(model: Type["DeclarativeBase"]):
-            Initialize the ORM instance with a specific model.
+        __init__(model: Type["DeclarativeBase"], cache_ttl: float = None, cache_size: int = None, batch_get: bool = None):
+            Initialize the ORM instance with a specific model, optionally caching
+            or batching `get`.
 
         create(**kwargs):
             Create a new record in the database.
@@ -79,6 +274,12 @@ class ORM(ORMSession):
         get(pk: int):
             Retrieve a record by its primary key (ID).
 
+        load(pk):
+            Retrieve a record by its primary key, batched with the concurrent lookups.
+
+        load_many(pks: list):
+            Retrieve records by primary key, batched with the concurrent lookups.
+
         update(pk: int, **kwargs):
             Update a record by its primary key (ID) with the provided fields.
 
@@ -88,15 +289,37 @@ class ORM(ORMSession):
         save(model=None):
             Save changes to the database for the given model instance. Ensures no duplicate sessions.
 
-        all():
+        bulk_create(items: list[dict], batch_size: int = 1000):
+            Create many records with multi-row inserts.
+
+        bulk_update(items: list[dict], batch_size: int = 1000):
+            Update many records by primary key.
+
+        bulk_delete(pks: list, batch_size: int = 1000):
+            Delete many records by primary key.
+
+        all(order_by: list[str] = None):
             Retrieve all records of the model.
 
-        filter(**filters):
-            Retrieve records that match the specified filter criteria.
+        filter(order_by: list[str] = None, **filters):
+            Retrieve records that match the specified filter criteria (with lookups such as `age__gte`).
 
         first(**filters):
             Retrieve the first record that matches the specified filter criteria.
 
+        query() -> QuerySet:
+            Start a lazy, chainable query (filters with lookups and Q expressions,
+            ordering, limit/offset, projection, prefetching).
+
+        stream(chunk_size: int = 1000, order_by: list[str] = None, own_session: bool = False, **filters):
+            Iterate over the records that match the filters using a server-side cursor.
+
+        paginate(page_size: int, cursor: str = None, ordering: str = None, **filters):
+            Retrieve a page of records using keyset (cursor) pagination.
+
+        paginate_offset(page_size: int, cursor: str = None, ordering: str = None, **filters):
+            Retrieve a page of records using offset/limit pagination.
+
         count():
             Count the total number of records for the model.
 
@@ -107,29 +330,68 @@ class ORM(ORMSession):
             Execute a custom SQLAlchemy query.
 
         _filter_conditions(filtered_fields: dict[str, Any] = None):
-            Generate filter conditions for queries based on the provided fields.
+            Generate filter conditions for queries based on the provided fields and lookups.
+
+        _order_by(order_by: list[str] = None):
+            Generate the ordering clauses of a list of column names.
 
         select_related(attrs: list[str] = None, **kwargs):
-            Retrieve a record along with its related attributes.
+            Retrieve a record along with its eager-loaded related attributes.
 
         validate_relations(data: BaseModel):
             Validate the relationships of the model based on the provided data.
 
-        validate_unique_fields(data: BaseModel):
+        validate_unique_fields(data: BaseModel, exclude_pk=None):
             Validate that unique fields in the model do not violate constraints.
 
+        validate(data: BaseModel, exclude_pk=None):
+            Validate relations and unique fields in a single query.
+
+        validate_many(data: list[BaseModel], exclude_pks: list = None):
+            Validate relations and unique fields of a batch of payloads in a single query.
+
     Attributes:
         model: The SQLAlchemy model associated with this ORM instance.
+        database (str): The alias of the database the model is stored in.
+        meta (ModelMetadata): The precomputed metadata of the model.
+        cache_ttl (Optional[float]): Seconds a record read by `get` stays in the identity
+            cache. Defaults to the model's `__cache_ttl__`; None disables the cache.
+        batch_get (bool): Whether `get` by primary key alone goes through `load`.
+            Defaults to the model's `__batch_get__`, or False.
     """
 
-    def __init__(self, model: Type["DeclarativeBase"]):
+    def __init__(
+        self,
+        model: Type["DeclarativeBase"],
+        cache_ttl: float = None,
+        cache_size: int = None,
+        batch_get: bool = None,
+    ):
         self.model = model
+        self.database = self.database_for(model)
+        self.batch_get = (
+            batch_get if batch_get is not None else getattr(model, "__batch_get__", False)
+        )
+        self.cache_ttl = (
+            cache_ttl if cache_ttl is not None else getattr(model, "__cache_ttl__", None)
+        )
+        if self.cache_ttl:
+            enable_model_cache(model, maxsize=cache_size)
+
+    @property
+    def meta(self) -> ModelMetadata:
+        """The precomputed metadata of the model (see `FastAPIBig.orm.base.metadata`)."""
+        return get_model_metadata(self.model)
 
     async def create(self, **kwargs):
         """
-        Asynchronously creates a new instance of the model with the provided keyword arguments,
-        adds it to the database session, commits the transaction, and refreshes the instance
-        to reflect the latest state from the database.
+        Asynchronously creates a new instance of the model with the provided keyword arguments
+        and commits the transaction.
+
+        On databases supporting `INSERT ... RETURNING`, the row is inserted and read
+        back (including server-generated values) by a single statement. Otherwise,
+        or when `kwargs` set relationships, the instance is added to the session,
+        committed and refreshed.
 
         Args:
             **kwargs: Arbitrary keyword arguments representing the fields and their values
@@ -142,29 +404,265 @@ class ORM(ORMSession):
             Any exceptions raised during the database session operations, such as integrity
             errors or connection issues.
         """
-        async for db_session in self._async_session():
+        async with self._async_session(self.database) as db_session:
+            if self._returning(db_session, "insert", kwargs):
+                result = await db_session.scalars(
+                    insert(self.model).values(**kwargs).returning(self.model)
+                )
+                instance = result.one()
+                await self._commit(db_session, self.database)
+                return instance
             instance = self.model(**kwargs)
             db_session.add(instance)
-            await db_session.commit()
+            await self._commit(db_session, self.database)
             await db_session.refresh(instance)
             return instance
 
-    async def get(self, pk: int):
+    def _returning(self, db_session, statement: str, values: dict = None) -> bool:
+        """
+        Tells whether a write can run as a single `... RETURNING` statement.
+
+        Args:
+            db_session (AsyncSession): The session the statement runs in.
+            statement (str): One of "insert", "update" or "delete".
+            values (dict, optional): The values written, which must all be columns.
+
+        Returns:
+            bool: True if the dialect supports RETURNING for the statement.
+        """
+        if values and not all(key in self.meta.columns for key in values):
+            return False
+        dialect = db_session.get_bind(self.meta.mapper).dialect
+        return getattr(dialect, f"{statement}_returning", False)
+
+    async def get(
+        self,
+        pk: int,
+        select_related: list[str] = None,
+        prefetch_related: list[str] = None,
+        fields: list[str] = None,
+    ):
         """
         Retrieve a single record from the database by its primary key.
 
         Args:
             pk (int): The primary key of the record to retrieve.
+            select_related (list[str], optional): Relationships loaded in the same
+                query (`joinedload`). Nested paths are separated by "__".
+            prefetch_related (list[str], optional): Relationships loaded with one extra
+                query per path (`selectinload`).
+            fields (list[str], optional): Only select these columns and return a
+                mapping of their values instead of a model instance.
 
         Returns:
-            Optional[Base]: The retrieved record as an instance of the model,
-            or None if no record with the specified primary key exists.
+            Optional[Base]: The retrieved record as an instance of the model (or a
+            mapping when `fields` is given), or None if no record with the specified
+            primary key exists.
+
+        Note:
+            When `cache_ttl` is set, the record is read through the model's identity
+            cache and a cache hit returns a detached instance without querying the
+            database. Entries are invalidated by `update`, `save` and `delete`
+            once their transaction commits; until then, reads of the writing unit
+            of work bypass the cache.
+            Eager-loaded reads bypass the cache, which only holds column values.
+            Projected reads of a cached model still load the whole row on a miss,
+            so the entry can serve every projection afterwards.
+
+            When `batch_get` is set, reads by primary key alone are delegated to
+            `load`.
         """
-        async for db_session in self._async_session():
-            result = await db_session.execute(
-                select(self.model).filter(self.model.id == pk)
-            )
-            return result.scalars().first()
+        eager = bool(select_related or prefetch_related)
+        if self.batch_get and not (eager or fields):
+            return await self.load(pk)
+        return await self._get(pk, select_related, prefetch_related, fields)
+
+    async def _get(
+        self,
+        pk: int,
+        select_related: list[str] = None,
+        prefetch_related: list[str] = None,
+        fields: list[str] = None,
+    ):
+        """Reads a record by primary key with one query (see `get`)."""
+        eager = bool(select_related or prefetch_related)
+        cache = get_model_cache(self.model) if self.cache_ttl and not eager else None
+        if cache is not None and not self._get_db_manager(self.database).shares_reads():
+            # The unit of work wrote: its records are invalidated on commit only.
+            cache = None
+        if cache is not None:
+            version = cache.version
+            snapshot = cache.get(pk)
+            if snapshot is not None:
+                if fields:
+                    return self._project(snapshot, fields)
+                return self._from_snapshot(snapshot)
+
+        query_fields = fields if cache is None else None
+        statement = statement_cache.get(
+            (
+                "get",
+                self.model,
+                tuple(select_related or ()),
+                tuple(prefetch_related or ()),
+                tuple(query_fields or ()),
+            ),
+            lambda: self._select(select_related, prefetch_related, query_fields).where(
+                self.meta.pk_attribute == bindparam("pk")
+            ),
+            kind="get",
+        )
+        async with self._async_read_session(self.database) as db_session:
+            result = await db_session.execute(statement, {"pk": pk})
+            instance = self._rows(result, query_fields).first()
+            if cache is None or instance is None:
+                return instance
+            snapshot = self._snapshot(instance)
+            if not db_session.info.get("pending_writes"):
+                cache.set(pk, snapshot, self.cache_ttl, version)
+            return self._project(snapshot, fields) if fields else instance
+
+    def _snapshot(self, instance) -> dict:
+        """Returns the loaded column values of an instance."""
+        state = instance.__dict__
+        return {key: state[key] for key in self.meta.columns if key in state}
+
+    def _copy(self, instance):
+        """
+        Returns a detached copy of an instance, with its loaded columns and
+        relationships. The related records themselves are not copied.
+        """
+        state = instance.__dict__
+        return self._from_snapshot(
+            {
+                key: state[key]
+                for key in itertools.chain(self.meta.columns, self.meta.relationships)
+                if key in state
+            }
+        )
+
+    def _project(self, snapshot: dict, fields: list[str]) -> dict:
+        """Returns the requested columns of a snapshot, validating their names."""
+        self._projection(fields)
+        return {key: snapshot.get(key) for key in fields}
+
+    def _from_snapshot(self, snapshot: dict):
+        """Builds a detached instance from a column snapshot, as if loaded from the database."""
+        instance = self.meta.mapper.class_manager.new_instance()
+        for key, value in snapshot.items():
+            set_committed_value(instance, key, value)
+        make_transient_to_detached(instance)
+        return instance
+
+    async def load(self, pk):
+        """
+        Retrieve a record by its primary key through the batch loader of the model.
+
+        The lookups made in the same event loop iteration (or within the configured
+        window) by any caller, including concurrent requests, are deduplicated and
+        run as one `WHERE pk IN (...)` query (see `FastAPIBig.orm.base.batching`).
+        Inside a request, records already loaded are returned from its memo.
+
+        Args:
+            pk (Any): The primary key of the record to retrieve.
+
+        Returns:
+            Optional[Base]: The record, or None if it does not exist.
+
+        Note:
+            Lookups that must see the uncommitted writes of the current unit of
+            work run their own query instead of joining a batch.
+        """
+        loader_stats.loads += 1
+        pk = self.meta.coerce_pk(pk)
+        memo = current_memo()
+        if memo is not None:
+            instance = memo.get((self.model, pk))
+            if instance is not None:
+                loader_stats.memo_hits += 1
+                return instance
+
+        if not self._get_db_manager(self.database).shares_reads():
+            loader_stats.direct += 1
+            instance = await self._get(pk)
+        else:
+            cache = get_model_cache(self.model) if self.cache_ttl else None
+            snapshot = cache.get(pk) if cache is not None else None
+            if snapshot is not None:
+                instance = self._from_snapshot(snapshot)
+            else:
+                instance = await loader_for(self).load(pk)
+                if instance is not None:
+                    # The callers of a batch would otherwise share one instance.
+                    instance = self._copy(instance)
+
+        # Missing records are not memoized: the request may create them.
+        if memo is not None and instance is not None:
+            memo[(self.model, pk)] = instance
+        return instance
+
+    async def load_many(self, pks: list) -> list:
+        """
+        Retrieve records by primary key through the batch loader of the model.
+
+        Args:
+            pks (list): The primary keys.
+
+        Returns:
+            list: The record of each key, in order (None for missing ones).
+        """
+        return list(await asyncio.gather(*(self.load(pk) for pk in pks)))
+
+    async def _load_records(self, pks: list) -> dict:
+        """
+        Reads the records of a batch of primary keys with one query.
+
+        Args:
+            pks (list): The distinct primary keys.
+
+        Returns:
+            dict: The records keyed by primary key.
+        """
+        statement = statement_cache.get(
+            ("load", self.model),
+            lambda: select(self.model).where(
+                self.meta.pk_attribute.in_(bindparam("pks", expanding=True))
+            ),
+            kind="load",
+        )
+        pk_key = self.meta.pk_attribute.key
+        cache = get_model_cache(self.model) if self.cache_ttl else None
+        version = cache.version if cache is not None else None
+        async with self._async_read_session(self.database) as db_session:
+            result = await db_session.scalars(statement, {"pks": pks})
+            records = {getattr(instance, pk_key): instance for instance in result}
+            if cache is not None and not db_session.info.get("pending_writes"):
+                for pk, instance in records.items():
+                    cache.set(pk, self._snapshot(instance), self.cache_ttl, version)
+        return records
+
+    @staticmethod
+    def _invalidate(model, pks: list) -> Callable:
+        """
+        Forgets written records in the request memo, and returns the callback
+        dropping their identity cache entries, to run once the write is committed.
+
+        The cache is only invalidated after the commit: a concurrent read could
+        otherwise cache the old row again in between. Reads of the writing unit
+        of work bypass the cache until then (see `get`).
+        """
+        meta = get_model_metadata(model)
+        pks = [meta.coerce_pk(pk) for pk in pks]
+        for pk in pks:
+            forget(model, pk)
+        cache = get_model_cache(model)
+
+        def invalidate():
+            if cache is not None:
+                for pk in pks:
+                    cache.invalidate(pk)
+
+        return invalidate
 
     async def update(self, pk, **kwargs):
         """
@@ -178,17 +676,46 @@ class ORM(ORMSession):
             Optional[Model]: The updated instance of the model if found, otherwise None.
 
         Notes:
-            - This method uses an asynchronous database session to fetch, update, and save the instance.
+            - On databases supporting `UPDATE ... RETURNING`, the row is updated and
+              read back by a single statement.
+            - Otherwise the row is updated and then reloaded, or, when `kwargs` set
+              relationships, fetched, modified and refreshed through the session.
             - If the instance with the given primary key does not exist, the method returns None.
-            - After updating the instance, the session is committed and the instance is refreshed.
         """
-        async for db_session in self._async_session():
+        if not kwargs:
+            return await self.get(pk)
+        invalidate = self._invalidate(self.model, [pk])
+        async with self._async_session(self.database) as db_session:
+            if all(key in self.meta.columns for key in kwargs):
+                query = (
+                    update(self.model)
+                    .where(self.meta.pk_attribute == pk)
+                    .values(**kwargs)
+                )
+                if self._returning(db_session, "update"):
+                    result = await db_session.scalars(
+                        query.returning(self.model).execution_options(
+                            populate_existing=True
+                        )
+                    )
+                    instance = result.first()
+                else:
+                    result = await db_session.execute(query)
+                    instance = (
+                        await db_session.get(self.model, pk, populate_existing=True)
+                        if result.rowcount
+                        else None
+                    )
+                if instance is not None:
+                    await self._commit(db_session, self.database, invalidate)
+                return instance
+
             instance = await db_session.get(self.model, pk)
             if not instance:
                 return None
             for key, value in kwargs.items():
                 setattr(instance, key, value)
-            await db_session.commit()
+            await self._commit(db_session, self.database, invalidate)
             await db_session.refresh(instance)
             return instance
 
@@ -196,6 +723,11 @@ class ORM(ORMSession):
         """
         Asynchronously deletes an instance of the specified model by primary key.
 
+        The row is removed by a single `DELETE` statement (with `RETURNING` where
+        supported, the affected row count otherwise). Models whose relationships
+        make the ORM cascade the deletion to other rows are loaded and deleted
+        through the session instead, so those cascades still apply.
+
         Args:
             pk (Any): The primary key of the instance to delete.
             model (Optional[Type[Base]]): The SQLAlchemy model class. If not provided,
@@ -209,12 +741,30 @@ class ORM(ORMSession):
             SQLAlchemyError: If an error occurs during the database operation.
         """
         model = model or self.model
-        async for db_session in self._async_session():
+        meta = get_model_metadata(model)
+        database = self.database_for(model)
+        invalidate = self._invalidate(model, [pk])
+        async with self._async_session(database) as db_session:
+            if not meta.delete_cascades:
+                query = delete(model).where(meta.pk_attribute == pk)
+                dialect = db_session.get_bind(meta.mapper).dialect
+                if dialect.delete_returning:
+                    result = await db_session.execute(
+                        query.returning(meta.pk_attribute)
+                    )
+                    deleted = result.first() is not None
+                else:
+                    result = await db_session.execute(query)
+                    deleted = bool(result.rowcount)
+                if deleted:
+                    await self._commit(db_session, database, invalidate)
+                return deleted
+
             instance = await db_session.get(model, pk)
             if not instance:
                 return False
             await db_session.delete(instance)
-            await db_session.commit()
+            await self._commit(db_session, database, invalidate)
             return True
 
     async def save(self, model=None):
@@ -233,15 +783,177 @@ class ORM(ORMSession):
             BaseModel: The updated and saved model instance.
         """
         model = model or self.model
-        async for db_session in self._async_session():
+        invalidate = None
+        if not isinstance(model, type):
+            pk_key = get_model_metadata(type(model)).pk_attribute.key
+            invalidate = self._invalidate(type(model), [getattr(model, pk_key, None)])
+        async with self._async_session(self.database) as db_session:
             merged_instance = await db_session.merge(
                 model
             )  # Ensures no duplicate sessions
-            await db_session.commit()
+            await self._commit(db_session, self.database, invalidate)
             await db_session.refresh(merged_instance)
             return merged_instance  # Return the updated instance
 
-    async def all(self):
+    async def bulk_create(self, items: list[dict], batch_size: int = 1000) -> list:
+        """
+        Creates many records with multi-row inserts.
+
+        On databases supporting `INSERT ... RETURNING`, rows are inserted
+        `batch_size` at a time with multi-row `VALUES` and read back by the same
+        statements, in the order of `items`. Otherwise the instances are flushed
+        together and reloaded with one `IN` query per batch.
+
+        Args:
+            items (list[dict]): The column values of each record to create.
+            batch_size (int, optional): The number of rows per statement. Defaults to 1000.
+
+        Returns:
+            list: The created instances, in the order of `items`.
+        """
+        if not items:
+            return []
+        instances = []
+        async with self._async_session(self.database) as db_session:
+            keys = dict.fromkeys(key for item in items for key in item)
+            if self._returning(db_session, "insert", keys):
+                for batch in self._batches(items, batch_size):
+                    result = await db_session.scalars(
+                        insert(self.model).returning(
+                            self.model, sort_by_parameter_order=True
+                        ),
+                        batch,
+                    )
+                    instances.extend(result.all())
+            else:
+                for batch in self._batches(items, batch_size):
+                    created = [self.model(**item) for item in batch]
+                    db_session.add_all(created)
+                    await db_session.flush()
+                    instances.extend(
+                        await self._reload(
+                            db_session,
+                            [getattr(i, self.meta.pk_attribute.key) for i in created],
+                        )
+                    )
+            await self._commit(db_session, self.database)
+        return instances
+
+    async def bulk_update(self, items: list[dict], batch_size: int = 1000) -> list:
+        """
+        Updates many records by primary key.
+
+        Each record is updated by an executemany `UPDATE ... WHERE pk = ?` (one per
+        set of updated columns), then the batch is read back with one `IN` query.
+
+        Args:
+            items (list[dict]): The values of each record, including its primary key
+                under the primary key attribute name.
+            batch_size (int, optional): The number of records per batch. Defaults to 1000.
+
+        Returns:
+            list: The updated instances in the order of `items`, None for the
+            primary keys that do not exist.
+
+        Raises:
+            KeyError: If an item does not hold its primary key.
+            AttributeError: If a field is not a column of the model.
+        """
+        if not items:
+            return []
+        pk_key = self.meta.pk_attribute.key
+        pk_column = self.meta.pk_column
+        instances = {}
+        invalidate = self._invalidate(
+            self.model, [item.get(pk_key) for item in items if item.get(pk_key) is not None]
+        )
+        async with self._async_session(self.database) as db_session:
+            for batch in self._batches(items, batch_size):
+                groups = {}
+                for item in batch:
+                    if item.get(pk_key) is None:
+                        raise KeyError(f"Key '{pk_key}' not found in provided item.")
+                    keys = [key for key in item if key != pk_key]
+                    self._projection(keys)
+                    # The SET clause is derived from the parameter names, so
+                    # items updating the same columns share one executemany.
+                    params = {self.meta.columns[key].name: item[key] for key in keys}
+                    params["_pk"] = item[pk_key]
+                    groups.setdefault(tuple(keys), []).append(params)
+                query = update(self.meta.table).where(pk_column == bindparam("_pk"))
+                for keys, params in groups.items():
+                    if keys:
+                        await db_session.execute(query, params)
+                pks = [item[pk_key] for item in batch]
+                for instance in await self._reload(db_session, pks):
+                    instances[getattr(instance, pk_key)] = instance
+            await self._commit(db_session, self.database, invalidate)
+        return [instances.get(item[pk_key]) for item in items]
+
+    async def bulk_delete(self, pks: list, batch_size: int = 1000) -> list[bool]:
+        """
+        Deletes many records by primary key with `DELETE ... WHERE pk IN (...)`.
+
+        Where supported, `RETURNING` reports the deleted keys in the same
+        statement; otherwise they are selected first. Models whose relationships
+        cascade in the ORM are loaded and deleted through the session instead.
+
+        Args:
+            pks (list): The primary keys of the records to delete.
+            batch_size (int, optional): The number of keys per statement. Defaults to 1000.
+
+        Returns:
+            list[bool]: Whether each primary key was deleted, in the order of `pks`.
+        """
+        if not pks:
+            return []
+        pk_attribute = self.meta.pk_attribute
+        deleted = set()
+        invalidate = self._invalidate(self.model, list(dict.fromkeys(pks)))
+        async with self._async_session(self.database) as db_session:
+            dialect = db_session.get_bind(self.meta.mapper).dialect
+            for batch in self._batches(list(dict.fromkeys(pks)), batch_size):
+                if self.meta.delete_cascades:
+                    for instance in await self._reload(db_session, batch):
+                        await db_session.delete(instance)
+                        deleted.add(getattr(instance, pk_attribute.key))
+                    continue
+                query = delete(self.model).where(pk_attribute.in_(batch))
+                if dialect.delete_returning:
+                    result = await db_session.execute(query.returning(pk_attribute))
+                    deleted.update(result.scalars().all())
+                else:
+                    result = await db_session.execute(
+                        select(pk_attribute).where(pk_attribute.in_(batch))
+                    )
+                    deleted.update(result.scalars().all())
+                    await db_session.execute(query)
+            if deleted:
+                await self._commit(db_session, self.database, invalidate)
+        return [pk in deleted for pk in pks]
+
+    async def _reload(self, db_session, pks: list) -> list:
+        """Loads the instances of the given primary keys, refreshing any already in the session."""
+        result = await db_session.scalars(
+            select(self.model)
+            .where(self.meta.pk_attribute.in_(pks))
+            .execution_options(populate_existing=True)
+        )
+        return result.all()
+
+    @staticmethod
+    def _batches(items: list, batch_size: int):
+        """Yields consecutive slices of at most `batch_size` items."""
+        for start in range(0, len(items), batch_size):
+            yield items[start : start + batch_size]
+
+    async def all(
+        self,
+        select_related: list[str] = None,
+        prefetch_related: list[str] = None,
+        fields: list[str] = None,
+        order_by: list[str] = None,
+    ):
         """
         Retrieve all records of the model from the database.
 
@@ -249,21 +961,50 @@ class ORM(ORMSession):
         to select all records of the associated model, and returns the results
         as a list of model instances.
 
+        Args:
+            select_related (list[str], optional): Relationships loaded in the same
+                query (`joinedload`). Nested paths are separated by "__".
+            prefetch_related (list[str], optional): Relationships loaded with one extra
+                query per path (`selectinload`).
+            fields (list[str], optional): Only select these columns and return row
+                mappings instead of model instances.
+            order_by (list[str], optional): Columns to order by, each prefixed with
+                "-" for descending order.
+
         Returns:
             list: A list of all records of the model.
         """
-        async for db_session in self._async_session():
-            query = select(self.model)
+        async with self._async_read_session(self.database) as db_session:
+            query = self._select(select_related, prefetch_related, fields).order_by(
+                *self._order_by(order_by)
+            )
             result = await db_session.execute(query)
-            return result.scalars().all()
-
-    async def filter(self, **filters):
+            return self._rows(result, fields).all()
+
+    async def filter(
+        self,
+        *,
+        select_related: list[str] = None,
+        prefetch_related: list[str] = None,
+        fields: list[str] = None,
+        order_by: list[str] = None,
+        **filters,
+    ):
         """
         Filters records in the database based on the provided keyword arguments.
 
         Args:
+            select_related (list[str], optional): Relationships loaded in the same
+                query (`joinedload`). Nested paths are separated by "__".
+            prefetch_related (list[str], optional): Relationships loaded with one extra
+                query per path (`selectinload`).
+            fields (list[str], optional): Only select these columns and return row
+                mappings instead of model instances.
+            order_by (list[str], optional): Columns to order by, each prefixed with
+                "-" for descending order.
             **filters: Arbitrary keyword arguments representing the filter conditions.
-                       Each key-value pair corresponds to a column and its desired value.
+                       Each key corresponds to a column, optionally followed by a
+                       lookup such as "__gte" or "__in" (see `_filter_conditions`).
 
         Returns:
             list: A list of model instances that match the filter conditions.
@@ -272,19 +1013,58 @@ class ORM(ORMSession):
             Exception: If there is an issue with the database session or query execution.
 
         Example:
-            # Assuming `self.model` has a column `name`:
+            # Assuming `self.model` has the columns `name` and `age`:
             results = await instance.filter(name="John Doe")
+            adults = await instance.filter(age__gte=18, order_by=["-age"])
         """
-        async for db_session in self._async_session():
-            query = select(self.model).where(*self._filter_conditions(filters))
+        async with self._async_read_session(self.database) as db_session:
+            query = (
+                self._select(select_related, prefetch_related, fields)
+                .where(*self._filter_conditions(filters))
+                .order_by(*self._order_by(order_by))
+            )
             result = await db_session.execute(query)
-            return result.scalars().all()
+            return self._rows(result, fields).all()
 
-    async def first(self, **filters):
+    def query(self) -> QuerySet:
+        """
+        Start a lazy, immutable query over the model.
+
+        Nothing runs until the queryset is evaluated with `all`, `first`,
+        `count`, `exists` or `async for`. See `FastAPIBig.orm.base.queryset`.
+
+        Returns:
+            QuerySet: A queryset matching every record.
+
+        Example:
+            recent = await (
+                post_orm.query()
+                .filter(Q(user_id=1) | Q(title__startswith="News"))
+                .order_by("-id")
+                .limit(10)
+                .all()
+            )
+        """
+        return QuerySet(self)
+
+    async def first(
+        self,
+        *,
+        select_related: list[str] = None,
+        prefetch_related: list[str] = None,
+        fields: list[str] = None,
+        **filters,
+    ):
         """
         Retrieve the first record from the database that matches the given filters.
 
         Args:
+            select_related (list[str], optional): Relationships loaded in the same
+                query (`joinedload`). Nested paths are separated by "__".
+            prefetch_related (list[str], optional): Relationships loaded with one extra
+                query per path (`selectinload`).
+            fields (list[str], optional): Only select these columns and return a
+                row mapping instead of a model instance.
             **filters: Arbitrary keyword arguments representing the filter conditions
                        to apply to the query.
 
@@ -294,10 +1074,242 @@ class ORM(ORMSession):
         Raises:
             Any exceptions raised during the database query execution.
         """
-        async for db_session in self._async_session():
-            query = select(self.model).where(*self._filter_conditions(filters))
+        statement, params = self._filtered_statement(
+            "first",
+            filters,
+            (tuple(select_related or ()), tuple(prefetch_related or ()), tuple(fields or ())),
+            lambda conditions: self._select(select_related, prefetch_related, fields)
+            .where(*conditions)
+            .limit(1),
+        )
+        async with self._async_read_session(self.database) as db_session:
+            result = await db_session.execute(statement, params)
+            return self._rows(result, fields).first()
+
+    async def stream(
+        self,
+        *,
+        chunk_size: int = 1000,
+        prefetch_related: list[str] = None,
+        fields: list[str] = None,
+        order_by: list[str] = None,
+        own_session: bool = False,
+        **filters,
+    ):
+        """
+        Asynchronously iterates over the records that match the given filters.
+
+        The query runs on a server-side cursor (`AsyncSession.stream` with
+        `yield_per`), so rows are fetched from the database `chunk_size` at a time
+        and only one chunk is held in memory, regardless of the table size.
+        The session stays open until the iteration completes.
+
+        Args:
+            chunk_size (int, optional): The number of rows fetched per round trip.
+                Defaults to 1000.
+            prefetch_related (list[str], optional): Relationships loaded with one extra
+                query per chunk (`selectinload`). Joined eager loading cannot be
+                combined with a server-side cursor.
+            fields (list[str], optional): Only select these columns and return row
+                mappings instead of model instances.
+            order_by (list[str], optional): Columns to order by, each prefixed with
+                "-" for descending order.
+            own_session (bool, optional): Read through a session of its own, closed
+                when the iteration ends, instead of the session of the current unit
+                of work. Streaming responses use it: their body is produced after
+                the unit of work of the request committed. Defaults to False.
+            **filters: Arbitrary keyword arguments representing the filter conditions.
+
+        Yields:
+            The matching model instances (or row mappings), one at a time.
+
+        Example:
+            async for post in post_orm.stream(chunk_size=500, user_id=1):
+                ...
+        """
+        query = (
+            self._select(prefetch_related=prefetch_related, fields=fields)
+            .where(*self._filter_conditions(filters))
+            .order_by(*self._order_by(order_by))
+            .execution_options(yield_per=chunk_size)
+        )
+        async with self._async_read_session(
+            self.database, shared=not own_session
+        ) as db_session:
+            result = await db_session.stream(query)
+            rows = result.mappings() if fields else result.scalars()
+            async for chunk in rows.partitions():
+                for instance in chunk:
+                    yield instance
+
+    async def paginate(
+        self,
+        page_size: int,
+        cursor: str = None,
+        ordering: str = None,
+        *,
+        select_related: list[str] = None,
+        prefetch_related: list[str] = None,
+        fields: list[str] = None,
+        **filters,
+    ) -> Page:
+        """
+        Retrieve a page of records using keyset (cursor) pagination.
+
+        Rows are ordered by `ordering` with the primary key as a tie-breaker, and
+        each page continues strictly after (or before) the boundary row encoded in
+        the cursor. The database therefore seeks directly to the page through the
+        index instead of scanning and discarding an offset, so the query cost does
+        not grow with the page depth.
+
+        Args:
+            page_size (int): The maximum number of records to return.
+            cursor (str, optional): An opaque cursor returned as `next` or `prev`
+                by a previous call. Defaults to None (first page).
+            ordering (str, optional): The column to order by, prefixed with "-" for
+                descending order. Should be an indexed, non-nullable column.
+                Defaults to the primary key.
+            select_related (list[str], optional): Relationships loaded in the same
+                query (`joinedload`). Nested paths are separated by "__".
+            prefetch_related (list[str], optional): Relationships loaded with one extra
+                query per path (`selectinload`).
+            fields (list[str], optional): Only select these columns and return row
+                mappings instead of model instances. The ordering and primary key
+                columns are always selected.
+            **filters: Arbitrary keyword arguments representing the filter conditions.
+
+        Returns:
+            Page: The records of the page along with `next`/`prev` cursors.
+
+        Raises:
+            ValueError: If the cursor is malformed, or its values do not match the
+                types of the ordering columns.
+            AttributeError: If the ordering or filter fields do not exist in the model.
+        """
+        column, pk_column, descending = self._ordering_columns(ordering)
+        payload = decode_cursor(cursor) if cursor else {}
+        backwards = payload.get("d") == "p"
+        reverse = descending != backwards
+        if fields:
+            # The boundary values of the cursors are read from the rows.
+            fields = list(dict.fromkeys([*fields, column.key, pk_column.key]))
+
+        query = self._select(select_related, prefetch_related, fields).where(
+            *self._filter_conditions(filters)
+        )
+        if payload:
+            try:
+                value, pk_value = payload["k"]
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("Invalid pagination cursor.")
+            value = coerce_cursor_value(column, value)
+            pk_value = coerce_cursor_value(pk_column, pk_value)
+            if column is pk_column:
+                condition = column < value if reverse else column > value
+            elif reverse:
+                condition = or_(column < value, and_(column == value, pk_column < pk_value))
+            else:
+                condition = or_(column > value, and_(column == value, pk_column > pk_value))
+            query = query.where(condition)
+
+        order_by = [column.desc() if reverse else column.asc()]
+        if column is not pk_column:
+            order_by.append(pk_column.desc() if reverse else pk_column.asc())
+        query = query.order_by(*order_by).limit(page_size + 1)
+
+        async with self._async_read_session(self.database) as db_session:
             result = await db_session.execute(query)
-            return result.scalars().first()
+            items = list(self._rows(result, fields).all())
+
+        has_more = len(items) > page_size
+        items = items[:page_size]
+        if backwards:
+            items.reverse()
+
+        def boundary(item, direction):
+            if fields:
+                keys = [item[column.key], item[pk_column.key]]
+            else:
+                keys = [getattr(item, column.key), getattr(item, pk_column.key)]
+            return encode_cursor({"k": keys, "d": direction})
+
+        # Walking forward, a further page exists when we over-fetched; a previous
+        # one exists whenever we started from a cursor. Walking backward it is
+        # the other way around.
+        has_next = bool(payload) if backwards else has_more
+        has_prev = has_more if backwards else bool(payload)
+        next_cursor = boundary(items[-1], "n") if items and has_next else None
+        prev_cursor = boundary(items[0], "p") if items and has_prev else None
+        return Page(items, next=next_cursor, prev=prev_cursor)
+
+    async def paginate_offset(
+        self,
+        page_size: int,
+        cursor: str = None,
+        ordering: str = None,
+        *,
+        select_related: list[str] = None,
+        prefetch_related: list[str] = None,
+        fields: list[str] = None,
+        **filters,
+    ) -> Page:
+        """
+        Retrieve a page of records using offset/limit pagination.
+
+        This is a fallback for orderings that cannot be expressed as a keyset
+        (for example nullable columns). The cursor tokens are interchangeable in
+        shape with `paginate`, but the database still has to skip `offset` rows,
+        so deep pages get progressively slower.
+
+        Args:
+            page_size (int): The maximum number of records to return.
+            cursor (str, optional): An opaque cursor returned as `next` or `prev`
+                by a previous call. Defaults to None (first page).
+            ordering (str, optional): The column to order by, prefixed with "-" for
+                descending order. Defaults to the primary key.
+            select_related (list[str], optional): Relationships loaded in the same
+                query (`joinedload`). Nested paths are separated by "__".
+            prefetch_related (list[str], optional): Relationships loaded with one extra
+                query per path (`selectinload`).
+            fields (list[str], optional): Only select these columns and return row
+                mappings instead of model instances. The ordering and primary key
+                columns are always selected.
+            **filters: Arbitrary keyword arguments representing the filter conditions.
+
+        Returns:
+            Page: The records of the page along with `next`/`prev` cursors.
+
+        Raises:
+            ValueError: If the cursor is malformed, or its values do not match the
+                types of the ordering columns.
+            AttributeError: If the ordering or filter fields do not exist in the model.
+        """
+        column, pk_column, descending = self._ordering_columns(ordering)
+        offset = decode_cursor(cursor).get("o", 0) if cursor else 0
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError("Invalid pagination cursor.")
+
+        order_by = [column.desc() if descending else column.asc()]
+        if column is not pk_column:
+            order_by.append(pk_column.desc() if descending else pk_column.asc())
+        query = (
+            self._select(select_related, prefetch_related, fields)
+            .where(*self._filter_conditions(filters))
+            .order_by(*order_by)
+            .offset(offset)
+            .limit(page_size + 1)
+        )
+
+        async with self._async_read_session(self.database) as db_session:
+            result = await db_session.execute(query)
+            items = list(self._rows(result, fields).all())
+
+        has_more = len(items) > page_size
+        next_cursor = encode_cursor({"o": offset + page_size}) if has_more else None
+        prev_cursor = (
+            encode_cursor({"o": max(offset - page_size, 0)}) if offset > 0 else None
+        )
+        return Page(items[:page_size], next=next_cursor, prev=prev_cursor)
 
     async def count(self):
         """
@@ -307,8 +1319,13 @@ class ORM(ORMSession):
         Returns:
             int: The total count of records in the table.
         """
-        async for db_session in self._async_session():
-            result = await db_session.execute(select(count()).select_from(self.model))
+        statement = statement_cache.get(
+            ("count", self.model),
+            lambda: select(count()).select_from(self.model),
+            kind="count",
+        )
+        async with self._async_read_session(self.database) as db_session:
+            result = await db_session.execute(statement)
             return result.scalar()
 
     async def exists(self, **filters):
@@ -320,8 +1337,22 @@ class ORM(ORMSession):
 
         Returns:
             bool: True if a matching record exists, False otherwise.
+
+        Note:
+            The query is a `SELECT 1 ... LIMIT 1`, so no entity is loaded.
         """
-        return await self.first(**filters) is not None
+        statement, params = self._filtered_statement(
+            "exists",
+            filters,
+            (),
+            lambda conditions: select(literal_column("1"))
+            .select_from(self.model)
+            .where(*conditions)
+            .limit(1),
+        )
+        async with self._async_read_session(self.database) as db_session:
+            result = await db_session.execute(statement, params)
+            return result.first() is not None
 
     async def execute_query(self, query):
         """
@@ -338,68 +1369,407 @@ class ORM(ORMSession):
             returns the result. Ensure that the query is compatible with the
             database engine being used.
         """
-        async for db_session in self._async_session():
+        async with self._async_session(self.database) as db_session:
             result = await db_session.execute(query)
             return result
 
+    def _filtered_statement(
+        self, kind: str, filters: dict, key: tuple, build: Callable[[list], Any]
+    ) -> tuple:
+        """
+        Returns the cached statement of a filtered query and its parameters.
+
+        Filters on columns are compiled with bound parameters, so the statement is
+        built once per model, kind, filtered columns and lookups, and `key` (see
+        `FastAPIBig.orm.base.statements`). Filters on other attributes, such as
+        relationships, compile their values into the statement and are not cached.
+
+        Args:
+            kind (str): The kind of query, e.g. "first".
+            filters (dict): The filter keywords.
+            key (tuple): The other options the statement depends on.
+            build (Callable[[list], Any]): Builds the statement from its WHERE conditions.
+
+        Returns:
+            tuple: The statement and the parameters to execute it with.
+        """
+        columns = self.meta.columns
+        if not all(split_lookup(name)[0] in columns for name in filters):
+            return build(self._filter_conditions(filters)), {}
+        shape, params = bind_filters(filters)
+        statement = statement_cache.get(
+            (kind, self.model, shape, *key),
+            lambda: build([compile_condition(self, shape, itertools.count())]),
+            kind=kind,
+        )
+        return statement, params
+
     def _filter_conditions(self, filtered_fields: dict[str, Any] = None):
         """
         Generate a list of filter conditions based on the provided dictionary of field-value pairs.
 
+        Keys are field names, optionally followed by "__" and a lookup operator
+        (see `FastAPIBig.orm.base.lookups`): `eq` (default), `ne`, `in`, `gt`,
+        `gte`, `lt`, `lte`, `isnull`, `startswith` and `contains`.
+
         Args:
             filtered_fields (dict[str, Any], optional): A dictionary where keys are field names
-                and values are the corresponding values to filter by. Defaults to None.
+                (with an optional lookup) and values are the corresponding values to filter by.
+                Defaults to None.
 
         Returns:
             list: A list of filter conditions to be used in queries.
 
         Raises:
             AttributeError: If the specified field does not exist in the model.
+
+        Example:
+            # WHERE age >= 18 AND user_id IN (1, 2) AND deleted_at IS NULL
+            self._filter_conditions({"age__gte": 18, "user_id__in": [1, 2], "deleted_at__isnull": True})
         """
         filter_conditions = []
         fields = filtered_fields or {}
-        for attr, value in fields.items():
+        for key, value in fields.items():
+            attr, lookup = split_lookup(key)
             if hasattr(self.model, attr):
-                filter_conditions.append(getattr(self.model, attr) == value)
+                filter_conditions.append(
+                    compile_lookup(getattr(self.model, attr), lookup, value)
+                )
             else:
                 raise AttributeError(
                     f"Model {self.model.__name__} does not have '{attr}' attribute"
                 )
         return filter_conditions
 
+    def _order_by(self, order_by: list[str] = None) -> list:
+        """
+        Generate the ORDER BY clauses of a list of column names.
+
+        Args:
+            order_by (list[str], optional): Column names, each prefixed with "-" for
+                descending order. Defaults to None (no ordering).
+
+        Returns:
+            list: The ordering clauses to be used in queries.
+
+        Raises:
+            AttributeError: If a specified field does not exist in the model.
+        """
+        clauses = []
+        for ordering in order_by or []:
+            name = ordering.lstrip("-")
+            if name not in self.meta.columns:
+                raise AttributeError(
+                    f"Model {self.model.__name__} does not have '{name}' attribute"
+                )
+            column = getattr(self.model, name)
+            clauses.append(column.desc() if ordering.startswith("-") else column.asc())
+        return clauses
+
+    def _ordering_columns(self, ordering: str = None):
+        """
+        Resolve an ordering expression into the columns used for stable pagination.
+
+        Args:
+            ordering (str, optional): A column name, prefixed with "-" for descending
+                order. Defaults to the primary key.
+
+        Returns:
+            tuple: The ordering column, the primary key column and whether the
+            ordering is descending.
+
+        Raises:
+            AttributeError: If the specified field does not exist in the model.
+        """
+        pk_column = self.meta.pk_attribute
+        if not ordering:
+            return pk_column, pk_column, False
+        descending = ordering.startswith("-")
+        name = ordering.lstrip("-")
+        if not hasattr(self.model, name):
+            raise AttributeError(
+                f"Model {self.model.__name__} does not have '{name}' attribute"
+            )
+        column = getattr(self.model, name)
+        if column.key == pk_column.key:
+            column = pk_column
+        return column, pk_column, descending
+
     async def select_related(self, attrs: list[str] = None, **kwargs):
         """
-        Asynchronously retrieves a related model instance from the database with optional
-        attributes to refresh.
+        Asynchronously retrieves a model instance from the database together with
+        the given related attributes.
+
+        The relationships are eager-loaded by the same statement: many-to-one paths
+        are joined and collections are loaded with a single extra `IN` query each
+        (see `FastAPIBig.orm.base.loading.split_related`).
 
         Args:
-            attrs (list[str], optional): A list of attribute names to refresh on the
-                retrieved model instance. Defaults to an empty list.
+            attrs (list[str], optional): The relationship names to load on the
+                retrieved model instance. Nested paths are separated by "__".
+                Defaults to an empty list.
             **kwargs: Arbitrary keyword arguments used to filter the query.
 
         Raises:
-            AttributeError: If any attribute in `attrs` does not exist on the model.
+            AttributeError: If any attribute in `attrs` is not a relationship of the model.
 
         Returns:
             Optional[Model]: The first instance of the model that matches the filter
-                conditions, with the specified attributes refreshed, or `None` if no
+                conditions, with the specified attributes loaded, or `None` if no
                 matching instance is found.
         """
-        attrs = attrs or []
-        for attr in attrs:
-            if not hasattr(self.model, attr):
-                raise AttributeError(
-                    f"Model {self.__name__} does not have '{attr}' attribute"
+        select_related, prefetch_related = split_related(self.model, attrs)
+        return await self.first(
+            select_related=select_related, prefetch_related=prefetch_related, **kwargs
+        )
+
+    def _select(
+        self,
+        select_related: list[str] = None,
+        prefetch_related: list[str] = None,
+        fields: list[str] = None,
+    ):
+        """
+        Builds a `select` of the model with the requested eager-loading options,
+        or of the requested columns only when `fields` is given.
+
+        Raises:
+            AttributeError: If a path does not name relationships of the model, or
+                a field is not a column of the model.
+            ValueError: If a projection is combined with eager loading.
+        """
+        if fields:
+            if select_related or prefetch_related:
+                raise ValueError(
+                    "Column projections cannot eager-load relationships."
                 )
-        async for db_session in self._async_session():
-            result = await db_session.execute(
-                select(self.model).filter(*self._filter_conditions(kwargs))
+            return select(*self._projection(fields))
+        query = select(self.model)
+        if select_related or prefetch_related:
+            query = query.options(
+                *build_loader_options(self.model, select_related, prefetch_related)
             )
-            instance = result.scalars().first()
-            if not instance:
-                return None
-            await db_session.refresh(instance, attrs)
-            return instance
+        return query
+
+    def _projection(self, fields: list[str]) -> list:
+        """
+        Resolves field names into the column attributes of a projection.
+
+        Raises:
+            AttributeError: If a field is not a column of the model.
+        """
+        columns = self.meta.columns
+        for name in fields:
+            if name not in columns:
+                raise AttributeError(
+                    f"Model {self.model.__name__} does not have '{name}' column"
+                )
+        return [getattr(self.model, name) for name in fields]
+
+    @staticmethod
+    def _rows(result, fields: list[str] = None):
+        """Returns the row mappings of a projected result, or its model instances."""
+        return result.mappings() if fields else result.unique().scalars()
+
+    def _check_primary_key(self, data_dict: dict):
+        """
+        Rejects payloads that try to set the primary key.
+
+        Raises:
+            ValueError: If the primary key is manually included in the data.
+        """
+        pk_column = self.meta.pk_column
+        if data_dict.get(pk_column.name) is not None:
+            raise ValueError(f"Cannot create or change primary key '{pk_column.name}'.")
+
+    def _relation_checks(self, data_dict: dict) -> list:
+        """
+        Collects the foreign key values of a payload that must exist in the database.
+
+        Raises:
+            KeyError: If a required foreign key value is missing in the provided data.
+        """
+        checks = []
+        for local_col, remote_col in self.meta.foreign_keys:
+            col_val = data_dict.get(local_col.name)
+            if col_val is None:
+                raise KeyError(f"Key '{local_col.name}' not found in provided body.")
+            checks.append((remote_col, col_val))
+        return checks
+
+    def _unique_checks(self, data_dict: dict) -> list:
+        """Collects the unique column values of a payload that must not exist yet."""
+        return [
+            (column, data_dict[column.name])
+            for column in self.meta.unique_columns
+            if data_dict.get(column.name) is not None
+        ]
+
+    async def _run_checks(self, relation_checks: list, unique_checks: list, exclude_pk=None):
+        """
+        Runs relation and unique checks in a single round trip.
+
+        Every check becomes an `EXISTS (...)` column of one `SELECT`, so the number
+        of queries does not grow with the number of constraints. The statement is
+        cached per model and set of checked columns, with the values bound.
+
+        Args:
+            relation_checks (list): (remote column, value) pairs that must exist.
+            unique_checks (list): (column, value) pairs that must not exist.
+            exclude_pk (Any, optional): Primary key of the record being updated,
+                ignored by the unique checks. Defaults to None.
+
+        Raises:
+            ValueError: If a foreign key value does not correspond to an existing
+                entity, or a unique constraint is violated.
+        """
+        if not relation_checks and not unique_checks:
+            return
+        pk_column = self.meta.pk_column
+
+        def build():
+            clauses = [
+                exists().where(remote_col == bindparam(f"r{index}"))
+                for index, (remote_col, _) in enumerate(relation_checks)
+            ]
+            for index, (column, _) in enumerate(unique_checks):
+                condition = column == bindparam(f"u{index}")
+                if exclude_pk is not None:
+                    condition = and_(condition, pk_column != bindparam("exclude_pk"))
+                clauses.append(exists().where(condition))
+            return select(*clauses)
+
+        # The checks of a model only vary by the unique columns present in the
+        # payload, so their statements are built once per combination.
+        statement = statement_cache.get(
+            (
+                "checks",
+                self.model,
+                tuple((col.table.name, col.name) for col, _ in relation_checks),
+                tuple((col.table.name, col.name) for col, _ in unique_checks),
+                exclude_pk is not None,
+            ),
+            build,
+            kind="checks",
+        )
+        params = {f"r{index}": value for index, (_, value) in enumerate(relation_checks)}
+        params.update(
+            {f"u{index}": value for index, (_, value) in enumerate(unique_checks)}
+        )
+        if exclude_pk is not None:
+            params["exclude_pk"] = exclude_pk
+
+        async with self._async_session(self.database) as db_session:
+            result = await db_session.execute(statement, params)
+            row = result.one()
+
+        for (remote_col, value), found in zip(relation_checks, row):
+            if not found:
+                raise ValueError(
+                    f"Entity({remote_col.table.name}) with primary key: {value} not found."
+                )
+        for (column, value), found in zip(unique_checks, row[len(relation_checks) :]):
+            if found:
+                raise ValueError(
+                    f"Unique constraint violation: '{column.name}' with value '{value}' already exists."
+                )
+
+    async def validate(self, data: BaseModel, exclude_pk=None):
+        """
+        Validates the relations and unique fields of a payload in one query.
+
+        This is equivalent to calling `validate_relations` and `validate_unique_fields`,
+        but every foreign key and unique constraint is checked in a single round trip.
+
+        Args:
+            data (BaseModel): The Pydantic model instance containing the data to validate.
+            exclude_pk (Any, optional): Primary key of the record being updated, so its
+                own values do not count as unique constraint violations. Defaults to None.
+
+        Raises:
+            KeyError: If a required foreign key value is missing in the provided data.
+            ValueError: If the primary key is included in the data, a foreign key value
+                does not correspond to an existing entity, or a unique constraint is violated.
+        """
+        data_dict = data.model_dump()
+        self._check_primary_key(data_dict)
+        await self._run_checks(
+            self._relation_checks(data_dict),
+            self._unique_checks(data_dict),
+            exclude_pk=exclude_pk,
+        )
+
+    async def validate_many(self, data: list[BaseModel], exclude_pks: list = None):
+        """
+        Validates the relations and unique fields of a batch of payloads in one query.
+
+        Values are grouped per constraint and checked with `IN (...)` lists, one
+        `SELECT` per constraint combined with `UNION ALL`, so a batch of any size is
+        validated in a single round trip. Unique values repeated inside the batch are
+        rejected as well.
+
+        Args:
+            data (list[BaseModel]): The Pydantic model instances to validate.
+            exclude_pks (list, optional): Primary keys of the records being updated,
+                ignored by the unique checks. Defaults to None.
+
+        Raises:
+            KeyError: If a required foreign key value is missing in any payload.
+            ValueError: If a primary key is included in a payload, a foreign key value
+                does not correspond to an existing entity, or a unique constraint is violated.
+        """
+        relation_values = {}
+        unique_values = {}
+        for item in data:
+            data_dict = item.model_dump()
+            self._check_primary_key(data_dict)
+            for remote_col, value in self._relation_checks(data_dict):
+                relation_values.setdefault(remote_col, set()).add(value)
+            for column, value in self._unique_checks(data_dict):
+                values = unique_values.setdefault(column, set())
+                if value in values:
+                    raise ValueError(
+                        f"Unique constraint violation: '{column.name}' with value '{value}' is repeated in the batch."
+                    )
+                values.add(value)
+
+        checks = [(col, values, True) for col, values in relation_values.items()]
+        checks += [(col, values, False) for col, values in unique_values.items()]
+        if not checks:
+            return
+
+        # Each branch returns the matching values of one constraint in its own
+        # column (typed NULL elsewhere), tagged with the index of the constraint.
+        pk_column = self.meta.pk_column
+        branches = []
+        for index, (column, values, _) in enumerate(checks):
+            selected = [literal_column(str(index)).label("check")]
+            for other_index, (other, _, _) in enumerate(checks):
+                value = column if other_index == index else cast(null(), other.type)
+                selected.append(value.label(f"value_{other_index}"))
+            condition = column.in_(values)
+            if exclude_pks and column.table is pk_column.table and column.key != pk_column.key:
+                condition = and_(condition, pk_column.not_in(exclude_pks))
+            branches.append(select(*selected).where(condition))
+        query = branches[0] if len(branches) == 1 else union_all(*branches)
+
+        found = [set() for _ in checks]
+        async with self._async_session(self.database) as db_session:
+            result = await db_session.execute(query)
+            for row in result:
+                found[row[0]].add(row[row[0] + 1])
+
+        for (column, values, must_exist), matches in zip(checks, found):
+            if must_exist and values - matches:
+                missing = sorted(values - matches, key=str)
+                raise ValueError(
+                    f"Entity({column.table.name}) with primary key: {', '.join(map(str, missing))} not found."
+                )
+            if not must_exist and matches:
+                existing = sorted(matches, key=str)
+                raise ValueError(
+                    f"Unique constraint violation: '{column.name}' with value '{', '.join(map(str, existing))}' already exists."
+                )
 
     async def validate_relations(self, data: BaseModel):
         """
@@ -408,7 +1778,7 @@ class ORM(ORMSession):
         This method checks if the provided data contains valid foreign key references
         for the relationships defined in the SQLAlchemy model. If a required foreign key
         value is missing or does not correspond to an existing entity in the database,
-        an exception is raised.
+        an exception is raised. All relationships are checked in a single query.
 
         Args:
             data (BaseModel): The Pydantic model instance containing the data to validate.
@@ -418,38 +1788,17 @@ class ORM(ORMSession):
             ValueError: If a foreign key value does not correspond to an existing entity
                         in the database.
         """
-        data_dict = data.model_dump()
-        for rel in inspect(self.model).relationships:
-            for attr in dir(rel):
-                if attr.startswith("_"):
-                    continue
-            local_col = list(rel.local_columns)[0]
-            remote_side = list(rel.remote_side)[0]
-            if not local_col.primary_key:
-                col_val = data_dict.get(local_col.name)
-                if col_val is None:
-                    raise KeyError(
-                        f"Key '{local_col.name}' not found in provided body."
-                    )
-
-                async for db_session in self._async_session():
-                    result = await db_session.execute(
-                        select(rel.mapper.entity).filter(
-                            getattr(rel.mapper.entity, remote_side.name) == col_val
-                        )
-                    )
-                    if not result.first():
-                        raise ValueError(
-                            f"Entity({rel.mapper.entity}) with primary key: {col_val} not found."
-                        )
+        await self._run_checks(self._relation_checks(data.model_dump()), [])
 
-    async def validate_unique_fields(self, data: BaseModel):
+    async def validate_unique_fields(self, data: BaseModel, exclude_pk=None):
         """
         Validates that the unique fields in the provided data do not violate
         the unique constraints defined in the database model.
 
         Args:
             data (BaseModel): The data to validate, represented as a Pydantic model.
+            exclude_pk (Any, optional): Primary key of the record being updated, so its
+                own values are not reported as duplicates. Defaults to None.
 
         Raises:
             ValueError: If the primary key is manually included in the data or if
@@ -458,28 +1807,9 @@ class ORM(ORMSession):
         Notes:
             - The primary key field is excluded from validation to prevent manual
               overrides.
-            - For each column marked as unique, the method checks if the provided
-              value already exists in the database. If a duplicate is found, a
-              `ValueError` is raised.
+            - All unique columns are checked in a single query. If a duplicate is
+              found, a `ValueError` is raised.
         """
         data_dict = data.model_dump()
-
-        # Remove primary key from data to prevent manual override
-        pk_column = inspect(self.model).primary_key[0]
-        if pk_column in data_dict:
-            raise ValueError(f"Cannot create or change primary key '{pk_column.name}'.")
-
-        for column in inspect(self.model).columns:
-            if column.unique:
-                col_val = data_dict.get(column.name)
-                if col_val is not None:
-                    async for db_session in self._async_session():
-                        result = await db_session.execute(
-                            select(self.model).filter(
-                                getattr(self.model, column.name) == col_val
-                            )
-                        )
-                        if result.first():
-                            raise ValueError(
-                                f"Unique constraint violation: '{column.name}' with value '{col_val}' already exists."
-                            )
+        self._check_primary_key(data_dict)
+        await self._run_checks([], self._unique_checks(data_dict), exclude_pk=exclude_pk)
@@ -0,0 +1,246 @@
+"""
+This module provides the batch loader of primary key lookups (`ORM.load`).
+
+Handlers and hooks often read records one at a time (`await orm.get(pk)`), and
+concurrent requests read overlapping records. A `BatchLoader` collects the
+lookups of a model made in the same event loop iteration (or within `window`
+seconds), deduplicates their keys and runs one `WHERE pk IN (...)` query, then
+resolves every caller with its record (None if it does not exist).
+
+There is one loader per model and event loop. Its queries run in their own
+session, outside any unit of work, so one batch can serve several requests.
+Lookups that must see uncommitted writes of the current unit of work (or be
+routed to the primary after a write) therefore bypass the loader and query
+directly (see `DataBaseSessionManager.shares_reads`).
+
+Within an HTTP request, `memo_scope` (opened by the `BatchLoadMemoMiddleware`)
+memoizes the loaded records: loading the same key again returns the same
+record without a query, until a write through the ORM invalidates it.
+
+Each request receives its own detached copy of a batched record, so changing
+it does not affect the other requests of the batch. Relationships loaded
+eagerly are copied as references: the related records are shared, and must be
+treated as read-only.
+
+Loading is opt-in: call `ORM.load` / `ORM.load_many`, or enable batching of
+`ORM.get` with `batch_get=True` (or `__batch_get__ = True` on the model, or
+`batch_get = True` on a view). The window and batch size are configured from
+the `BATCH_LOADER` dict of the project settings, e.g.:
+
+    BATCH_LOADER = {
+        "window": 0.002,
+        "max_batch": 1000,
+        "memo": True,
+    }
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import weakref
+from typing import Any, Dict, Iterator, Optional, Set
+
+from FastAPIBig.orm.base.metadata import get_model_metadata
+from FastAPIBig.orm.base.session_manager import detach_unit_of_work
+
+# Records loaded during the current request, keyed by (model, pk). The dict is
+# mutated in place, so tasks spawned by the request share it.
+_memo: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "fastapibig_batch_load_memo", default=None
+)
+
+
+class LoaderStats:
+    """
+    LoaderStats counts the work of the batch loaders.
+
+    Attributes:
+        loads (int): Keys requested, memo hits included.
+        memo_hits (int): Keys answered by the request memo.
+        direct (int): Keys queried directly, bypassing the loader.
+        batches (int): Batch queries run.
+        keys (int): Distinct keys queried by the batches.
+    """
+
+    def __init__(self):
+        self.loads = 0
+        self.memo_hits = 0
+        self.direct = 0
+        self.batches = 0
+        self.keys = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "loads": self.loads,
+            "memo_hits": self.memo_hits,
+            "direct": self.direct,
+            "batches": self.batches,
+            "keys": self.keys,
+            "keys_per_batch": self.keys / self.batches if self.batches else 0.0,
+        }
+
+
+stats = LoaderStats()
+
+
+class BatchLoader:
+    """
+    BatchLoader collects the primary key lookups of a model and runs them as one
+    query per batch.
+
+    Attributes:
+        orm (ORM): The ORM running the batch queries.
+        window (float): Seconds a batch stays open after its first key. 0 (default)
+            dispatches it on the next event loop iteration.
+        max_batch (int): The number of keys dispatching a batch immediately.
+
+    Methods:
+        load(pk) -> Any:
+            Returns the record of a primary key, batched with concurrent lookups.
+    """
+
+    def __init__(self, orm: Any, window: float = 0.0, max_batch: int = 1000):
+        self.orm = orm
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[Any, asyncio.Future] = {}
+        self._handle: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, pk: Any) -> Any:
+        """
+        Returns the record of a primary key, loaded with the other keys requested
+        before the batch is dispatched.
+
+        Args:
+            pk (Any): The primary key.
+
+        Returns:
+            The record, or None if it does not exist.
+        """
+        future = self._pending.get(pk)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[pk] = loop.create_future()
+            if len(self._pending) >= self.max_batch:
+                self._dispatch()
+            elif self._handle is None:
+                if self.window > 0:
+                    self._handle = loop.call_later(self.window, self._dispatch)
+                else:
+                    self._handle = loop.call_soon(self._dispatch)
+        # Shielded: a cancelled caller must not cancel the key for the others.
+        return await asyncio.shield(future)
+
+    def _dispatch(self):
+        """Starts the query of the pending keys."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        # Detached from the unit of work of the caller that opened the batch:
+        # the query serves every caller.
+        task = detach_unit_of_work(asyncio.ensure_future, self._fetch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch: Dict[Any, asyncio.Future]):
+        """Queries the records of a batch and resolves its futures."""
+        stats.batches += 1
+        stats.keys += len(batch)
+        try:
+            records = await self.orm._load_records(list(batch))
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+                    # Retrieved here, so no warning is logged if every caller left.
+                    future.exception()
+        except BaseException:
+            for future in batch.values():
+                future.cancel()
+            raise
+        else:
+            for pk, future in batch.items():
+                if not future.done():
+                    future.set_result(records.get(pk))
+
+
+# Loaders of each event loop, keyed by model: futures belong to a loop.
+_loaders: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[type, BatchLoader]]" = (
+    weakref.WeakKeyDictionary()
+)
+_options: Dict[str, Any] = {"window": 0.0, "max_batch": 1000}
+
+
+def configure(window: float = 0.0, max_batch: int = 1000):
+    """
+    Configures the loaders created from now on.
+
+    Args:
+        window (float, optional): Seconds a batch stays open after its first key.
+            Defaults to 0, the next event loop iteration.
+        max_batch (int, optional): The number of keys dispatching a batch
+            immediately. Defaults to 1000.
+
+    Raises:
+        ValueError: If the window is negative or the batch size not positive.
+    """
+    if window < 0 or max_batch < 1:
+        raise ValueError("The batch loader needs a window >= 0 and a max_batch >= 1.")
+    _options.update(window=window, max_batch=max_batch)
+    _loaders.clear()
+
+
+def loader_for(orm: Any) -> BatchLoader:
+    """
+    Returns the loader of a model for the running event loop, creating it if needed.
+
+    Args:
+        orm (ORM): An ORM of the model, used to run the batch queries.
+
+    Returns:
+        BatchLoader: The loader.
+    """
+    loaders = _loaders.setdefault(asyncio.get_running_loop(), {})
+    loader = loaders.get(orm.model)
+    if loader is None:
+        loader = loaders[orm.model] = BatchLoader(orm, **_options)
+    return loader
+
+
+@contextlib.contextmanager
+def memo_scope() -> Iterator[dict]:
+    """
+    Memoizes the records loaded in the block, e.g. during one request.
+
+    Yields:
+        dict: The memo, keyed by (model, pk).
+    """
+    token = _memo.set({})
+    try:
+        yield _memo.get()
+    finally:
+        _memo.reset(token)
+
+
+def current_memo() -> Optional[dict]:
+    """Returns the memo of the current request, or None outside a `memo_scope`."""
+    return _memo.get()
+
+
+def forget(model: type, pk: Any):
+    """
+    Drops a record from the memo of the current request, e.g. after a write.
+
+    Args:
+        model (type): The mapped class.
+        pk (Any): The primary key, converted to the column's type like the keys
+            of `ORM.load`.
+    """
+    memo = _memo.get()
+    if memo:
+        memo.pop((model, get_model_metadata(model).coerce_pk(pk)), None)
+
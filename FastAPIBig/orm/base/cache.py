@@ -0,0 +1,182 @@
+"""
+This module provides the identity cache used by `ORM.get`.
+
+Each model with caching enabled owns an `IdentityCache`: a bounded LRU mapping
+primary keys to detached column snapshots, where every entry expires after the
+TTL it was stored with. The store is shared by every ORM instance of the model,
+so writes through any view invalidate the entries read by the others.
+
+Caching is enabled per model with a `__cache_ttl__` class attribute (and
+optionally `__cache_size__`), or per view with `cache_ttl` on the view class.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class IdentityCache:
+    """
+    IdentityCache is a bounded LRU cache with per-entry expiry.
+
+    Attributes:
+        maxsize (int): The maximum number of entries kept.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that found no valid entry.
+        evictions (int): The number of entries dropped to respect `maxsize`.
+        expirations (int): The number of entries dropped because their TTL elapsed.
+        invalidations (int): The number of entries dropped by writes.
+        version (int): Incremented by every invalidation. A read records it before
+            querying and passes it to `set`, which then ignores the snapshot if a
+            write committed in between.
+
+    Methods:
+        get(key) -> Optional[dict]:
+            Returns the snapshot stored for a key, if present and not expired.
+
+        set(key, snapshot: dict, ttl: float, version: int = None):
+            Stores a snapshot for `ttl` seconds, unless invalidated since `version`.
+
+        invalidate(key):
+            Drops the entry of a key.
+
+        clear():
+            Drops every entry.
+
+        stats() -> dict:
+            Returns the cache counters.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, Tuple[float, dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.version = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Any) -> Optional[dict]:
+        """
+        Returns the snapshot stored for a key.
+
+        Args:
+            key (Any): The primary key.
+
+        Returns:
+            Optional[dict]: The column snapshot, or None on a miss or expired entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, snapshot = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return snapshot
+
+    def set(self, key: Any, snapshot: dict, ttl: float, version: int = None):
+        """
+        Stores a snapshot, evicting the least recently used entries when full.
+
+        Args:
+            key (Any): The primary key.
+            snapshot (dict): The column values of the record.
+            ttl (float): The number of seconds the entry stays valid.
+            version (int, optional): The `version` read before querying the
+                snapshot. If an invalidation happened since, the snapshot may
+                predate a committed write and is not stored.
+        """
+        if version is not None and version != self.version:
+            return
+        self._entries[key] = (time.monotonic() + ttl, snapshot)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Any):
+        """Drops the entry of a key, if any, and fences the reads in flight."""
+        self.version += 1
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def clear(self):
+        """Drops every entry."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: size, maxsize, hits, misses, hit_ratio, evictions, expirations
+            and invalidations.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+_caches: Dict[type, IdentityCache] = {}
+
+
+def get_model_cache(model: type) -> Optional[IdentityCache]:
+    """
+    Returns the identity cache of a model.
+
+    Returns:
+        Optional[IdentityCache]: The cache, or None if caching was never enabled
+        for the model.
+    """
+    return _caches.get(model)
+
+
+def enable_model_cache(model: type, maxsize: int = None) -> IdentityCache:
+    """
+    Returns the identity cache of a model, creating it if needed.
+
+    Args:
+        model (type): The mapped class.
+        maxsize (int, optional): The maximum number of entries. Defaults to the
+            model's `__cache_size__`, or `DEFAULT_CACHE_SIZE`.
+
+    Returns:
+        IdentityCache: The cache of the model.
+    """
+    cache = _caches.get(model)
+    if cache is None:
+        maxsize = maxsize or getattr(model, "__cache_size__", DEFAULT_CACHE_SIZE)
+        cache = _caches[model] = IdentityCache(maxsize=maxsize)
+    elif maxsize and maxsize > cache.maxsize:
+        cache.maxsize = maxsize
+    return cache
+
+
+def get_cache_stats() -> Dict[str, dict]:
+    """
+    Returns the counters of every identity cache.
+
+    Returns:
+        Dict[str, dict]: The stats of each cache keyed by model name.
+    """
+    return {model.__name__: cache.stats() for model, cache in _caches.items()}
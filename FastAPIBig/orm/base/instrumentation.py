@@ -0,0 +1,209 @@
+"""
+This module instruments the SQL statements executed by the database engines.
+
+Listeners on the engine events time every statement. Within a `track_queries`
+block (opened per request by `QueryInstrumentationMiddleware`) the statements are
+accumulated into a `QueryStats`:
+
+- the number of queries, the total database time and the rows returned or affected;
+- the statements slower than the slow-query threshold, which are also logged along
+  with the view handling the request;
+- statements executed again and again with different parameters, the signature of
+  an N+1 query pattern (e.g. loading a relationship once per row of a list).
+"""
+
+import contextlib
+import contextvars
+import logging
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+_query_stats: contextvars.ContextVar[Optional["QueryStats"]] = contextvars.ContextVar(
+    "fastapibig_query_stats", default=None
+)
+
+
+class QueryStats:
+    """
+    QueryStats accumulates the statements executed in a context, e.g. one request.
+
+    Attributes:
+        label (Union[str, Callable[[], str]]): What issued the queries, e.g. the view
+            method. A callable is resolved lazily, once routing has happened.
+        n_plus_one_threshold (int): How many executions of the same statement flag
+            it as an N+1 pattern.
+        queries (int): The number of statements executed.
+        duration (float): The total seconds spent executing them.
+        rows (int): The rows returned or affected, as reported by the driver.
+        slow (int): The number of statements slower than the slow-query threshold.
+        statements (Counter): The number of executions of each statement.
+
+    Methods:
+        record(statement: str, duration: float, rows: int, slow: bool = False):
+            Records an executed statement.
+
+        n_plus_one() -> List[dict]:
+            Returns the statements repeated at least `n_plus_one_threshold` times.
+
+        summary() -> dict:
+            Returns the structured summary of the queries.
+
+        headers() -> Dict[str, str]:
+            Returns the summary as HTTP response headers.
+    """
+
+    def __init__(
+        self,
+        label: Union[str, Callable[[], str], None] = None,
+        n_plus_one_threshold: int = 5,
+    ):
+        self._label = label
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.queries = 0
+        self.duration = 0.0
+        self.rows = 0
+        self.slow = 0
+        self.statements: Counter = Counter()
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._label() if callable(self._label) else self._label
+
+    def record(self, statement: str, duration: float, rows: int, slow: bool = False):
+        """Records an executed statement."""
+        self.queries += 1
+        self.duration += duration
+        self.rows += rows
+        self.slow += slow
+        self.statements[statement] += 1
+
+    def n_plus_one(self) -> List[dict]:
+        """
+        Returns the statements executed at least `n_plus_one_threshold` times.
+
+        Bound parameters are not part of the statement text, so a statement run
+        once per row of a previous result shows up as one repeated statement.
+
+        Returns:
+            List[dict]: The "statement" and its "count", most repeated first.
+        """
+        return [
+            {"statement": statement, "count": count}
+            for statement, count in self.statements.most_common()
+            if count >= self.n_plus_one_threshold
+        ]
+
+    def summary(self) -> dict:
+        """
+        Returns the structured summary of the queries.
+
+        Returns:
+            dict: label, queries, duration_ms, rows, slow and n_plus_one.
+        """
+        return {
+            "label": self.label,
+            "queries": self.queries,
+            "duration_ms": round(self.duration * 1000, 3),
+            "rows": self.rows,
+            "slow": self.slow,
+            "n_plus_one": self.n_plus_one(),
+        }
+
+    def headers(self) -> Dict[str, str]:
+        """
+        Returns the summary as HTTP response headers.
+
+        Returns:
+            Dict[str, str]: The `X-DB-*` headers and a `Server-Timing` entry.
+        """
+        duration_ms = self.duration * 1000
+        return {
+            "x-db-queries": str(self.queries),
+            "x-db-time-ms": f"{duration_ms:.3f}",
+            "x-db-rows": str(self.rows),
+            "x-db-slow-queries": str(self.slow),
+            "x-db-n-plus-one": str(len(self.n_plus_one())),
+            "server-timing": f"db;dur={duration_ms:.3f};desc=\"{self.queries} queries\"",
+        }
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Returns the `QueryStats` of the current context, if queries are tracked."""
+    return _query_stats.get()
+
+
+@contextlib.contextmanager
+def track_queries(
+    label: Union[str, Callable[[], str], None] = None, n_plus_one_threshold: int = 5
+) -> Iterator[QueryStats]:
+    """
+    Accumulates the statements executed inside the block into a `QueryStats`.
+
+    Args:
+        label (Union[str, Callable[[], str]], optional): What issues the queries.
+        n_plus_one_threshold (int, optional): How many executions of the same
+            statement flag it as an N+1 pattern. Defaults to 5.
+
+    Yields:
+        Iterator[QueryStats]: The statistics of the block.
+    """
+    stats = QueryStats(label, n_plus_one_threshold)
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def _row_count(cursor) -> int:
+    """Returns the rows a statement returned or affected."""
+    # The async adapters fetch the whole result while executing, so the rows of
+    # a SELECT are already buffered; other cursors only report affected rows.
+    buffered = getattr(cursor, "_rows", None)
+    if cursor.description is not None and buffered is not None:
+        return len(buffered)
+    return max(cursor.rowcount or 0, 0)
+
+
+def instrument_engine(engine, slow_query_ms: Optional[float] = None):
+    """
+    Times the statements executed by an engine.
+
+    Args:
+        engine (AsyncEngine): The engine to instrument.
+        slow_query_ms (float, optional): Statements running at least this many
+            milliseconds are logged as slow queries. None disables the log.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("fastapibig_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["fastapibig_query_start"].pop()
+        slow = slow_query_ms is not None and duration * 1000 >= slow_query_ms
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.record(statement, duration, _row_count(cursor), slow)
+        if slow:
+            logger.warning(
+                "Slow query (%.1f ms) in %s: %s",
+                duration * 1000,
+                stats.label if stats is not None else "-",
+                statement,
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        # Failed statements never reach after_cursor_execute.
+        if context.connection is not None:
+            starts = context.connection.info.get("fastapibig_query_start")
+            if starts:
+                starts.pop()
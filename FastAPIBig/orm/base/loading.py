@@ -0,0 +1,107 @@
+"""
+This module compiles eager-loading declarations into SQLAlchemy loader options.
+
+Relationships are named by attribute, with "__" separating the hops of a nested
+path (e.g. "posts__comments"):
+
+- `select_related` paths are loaded with `joinedload`, in the same query.
+  Best for many-to-one relationships.
+- `prefetch_related` paths are loaded with `selectinload`, one extra
+  `SELECT ... WHERE fk IN (...)` per hop regardless of the number of rows.
+  Best for collections.
+
+Either way relationships are loaded up front, so serializing nested fields never
+triggers lazy loads (which would issue N+1 queries, and fail under asyncio).
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import joinedload, selectinload
+
+from FastAPIBig.orm.base.metadata import get_model_metadata
+
+_options_cache: Dict[tuple, list] = {}
+
+
+def _resolve_path(model: type, path: str) -> List[Tuple[type, str, bool]]:
+    """
+    Resolves a relationship path into (model, attribute, uselist) hops.
+
+    Raises:
+        AttributeError: If a hop is not a relationship of its model.
+    """
+    hops = []
+    for name in path.split("__"):
+        relation = get_model_metadata(model).relationships.get(name)
+        if relation is None:
+            raise AttributeError(
+                f"Model {model.__name__} does not have '{name}' relationship"
+            )
+        hops.append((model, name, relation.uselist))
+        model = relation.target
+    return hops
+
+
+def build_loader_options(
+    model: type,
+    select_related: Optional[Iterable[str]] = None,
+    prefetch_related: Optional[Iterable[str]] = None,
+) -> list:
+    """
+    Compiles relationship paths into loader options for `select(...).options()`.
+
+    The compiled options are cached per model and declaration.
+
+    Args:
+        model (type): The mapped class being queried.
+        select_related (Iterable[str], optional): Paths loaded with `joinedload`.
+        prefetch_related (Iterable[str], optional): Paths loaded with `selectinload`.
+
+    Returns:
+        list: The loader options.
+
+    Raises:
+        AttributeError: If a path does not name relationships of the model.
+    """
+    key = (model, tuple(select_related or ()), tuple(prefetch_related or ()))
+    options = _options_cache.get(key)
+    if options is not None:
+        return options
+
+    options = []
+    for paths, loader in ((key[1], joinedload), (key[2], selectinload)):
+        for path in paths:
+            option = None
+            for owner, name, _ in _resolve_path(model, path):
+                attribute = getattr(owner, name)
+                # Nested hops chain on the parent option, e.g.
+                # joinedload(User.posts).joinedload(Post.author).
+                chain = loader if option is None else getattr(option, loader.__name__)
+                option = chain(attribute)
+            options.append(option)
+    _options_cache[key] = options
+    return options
+
+
+def split_related(
+    model: type, paths: Optional[Iterable[str]]
+) -> Tuple[List[str], List[str]]:
+    """
+    Splits relationship paths by the loading strategy that suits them best.
+
+    Paths made only of many-to-one hops are joined (`select_related`); paths
+    crossing a collection are loaded with separate IN queries (`prefetch_related`).
+
+    Args:
+        model (type): The mapped class being queried.
+        paths (Iterable[str], optional): The relationship paths to load.
+
+    Returns:
+        Tuple[List[str], List[str]]: The `select_related` and `prefetch_related` paths.
+    """
+    select_related, prefetch_related = [], []
+    for path in paths or ():
+        if any(uselist for _, _, uselist in _resolve_path(model, path)):
+            prefetch_related.append(path)
+        else:
+            select_related.append(path)
+    return select_related, prefetch_related
@@ -0,0 +1,90 @@
+"""
+This module provides the field lookups understood by the ORM filters.
+
+A filter keyword is a column name, optionally followed by "__" and a lookup
+operator, e.g. `age__gte=18` or `user_id__in=[1, 2]`. Without an operator the
+lookup is an equality (`eq`). Every lookup compiles into a SQL condition, so the
+filtering always runs in the database.
+
+The operators accept a bound parameter in place of the value, so a condition can
+be built once and executed with different values (see `QuerySet`). Values are
+first passed through `prepare_value`, which e.g. escapes LIKE patterns. The
+`isnull` lookup and `None` values change the SQL itself (`IS NULL`) and are
+never bound (see `is_structural`).
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+LOOKUP_SEPARATOR = "__"
+LIKE_ESCAPE = "/"
+
+LOOKUPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "in": lambda column, value: column.in_(value),
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "isnull": lambda column, value: column.is_(None) if value else column.is_not(None),
+    "startswith": lambda column, value: column.like(value, escape=LIKE_ESCAPE),
+    "contains": lambda column, value: column.like(value, escape=LIKE_ESCAPE),
+}
+
+
+def _escape_like(value: str) -> str:
+    """Escapes the LIKE wildcards of a value, so they match literally."""
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+_PREPARERS: Dict[str, Callable[[Any], Any]] = {
+    "in": list,
+    "startswith": lambda value: f"{_escape_like(value)}%",
+    "contains": lambda value: f"%{_escape_like(value)}%",
+}
+
+
+def prepare_value(lookup: str, value: Any) -> Any:
+    """Converts a filter value into the value bound to the lookup's condition."""
+    preparer = _PREPARERS.get(lookup)
+    return preparer(value) if preparer and value is not None else value
+
+
+def is_structural(lookup: str, value: Any) -> bool:
+    """Tells whether a filter value changes the SQL of its condition, so it cannot be bound."""
+    return lookup == "isnull" or value is None
+
+
+def compile_lookup(column: Any, lookup: str, value: Any) -> Any:
+    """
+    Compiles a lookup on a column into a SQL condition comparing it with a value.
+
+    Args:
+        column: The column attribute, e.g. `User.age`.
+        lookup (str): The operator, e.g. "gte".
+        value (Any): The value to compare with.
+
+    Returns:
+        The SQL condition.
+    """
+    return LOOKUPS[lookup](column, prepare_value(lookup, value))
+
+
+def split_lookup(key: str) -> Tuple[str, str]:
+    """
+    Splits a filter keyword into its field name and lookup operator.
+
+    Args:
+        key (str): The filter keyword, e.g. "age__gte" or "name".
+
+    Returns:
+        Tuple[str, str]: The field name and the operator ("eq" when omitted).
+    """
+    name, separator, lookup = key.rpartition(LOOKUP_SEPARATOR)
+    if separator and lookup in LOOKUPS:
+        return name, lookup
+    return key, "eq"
@@ -0,0 +1,192 @@
+"""
+This module provides a registry of precomputed per-model metadata.
+
+Reflecting a mapped class with `sqlalchemy.inspect` and walking its columns and
+relationships is comparatively expensive, and the result never changes once the
+mappers are configured. The registry does that work once per model, at app
+startup (`register_models`) or on first use (`get_model_metadata`), so the
+request path only performs dictionary lookups.
+"""
+
+from typing import Any, Dict, List, Tuple, Type
+from sqlalchemy import Column, inspect
+from sqlalchemy.orm import MANYTOONE, configure_mappers
+from pydantic import BaseModel
+
+
+class RelationInfo:
+    """
+    RelationInfo describes a relationship of a mapped class.
+
+    Attributes:
+        name (str): The relationship attribute name on the model.
+        target (type): The mapped class the relationship points to.
+        uselist (bool): Whether the relationship holds a collection.
+        lazy (str): The loader strategy configured on the relationship.
+        local_column (Column): The first local column of the join condition.
+        remote_column (Column): The first remote column of the join condition.
+    """
+
+    def __init__(self, rel):
+        self.name = rel.key
+        self.target = rel.mapper.class_
+        self.uselist = rel.uselist
+        self.lazy = rel.lazy
+        self.local_column = list(rel.local_columns)[0]
+        self.remote_column = list(rel.remote_side)[0]
+
+
+class ModelMetadata:
+    """
+    ModelMetadata holds everything the ORM and views need to know about a model.
+
+    Attributes:
+        model (type): The mapped class.
+        mapper: The SQLAlchemy mapper of the model.
+        table: The table the model is mapped to.
+        pk_column (Column): The primary key column.
+        pk_attribute: The mapped attribute of the primary key (e.g. `Model.id`).
+        pk_type (type): The Python type of the primary key, `Any` if unknown.
+        columns (Dict[str, Column]): Columns keyed by their mapped attribute name.
+        unique_columns (List[Column]): Columns declared with `unique=True`.
+        foreign_keys (List[Tuple[Column, Column]]): (local column, remote column) pairs
+            of the many-to-one relationships, i.e. the values a payload must reference.
+        relationships (Dict[str, RelationInfo]): Relationships keyed by attribute name.
+        delete_cascades (bool): Whether deleting a record makes the ORM touch other
+            rows (cascaded deletes, nullified children or association rows), so it
+            cannot be replaced by a single `DELETE` statement.
+
+    Methods:
+        coerce_pk(pk: Any) -> Any:
+            Converts a primary key to the Python type of the column.
+
+        schema_columns(schema: Type[BaseModel]) -> List[str]:
+            Returns the column attribute names needed to build a schema.
+
+        schema_relations(schema: Type[BaseModel]) -> List[str]:
+            Returns the relationship names referenced by a schema.
+    """
+
+    def __init__(self, model: type):
+        mapper = inspect(model)
+        self.model = model
+        self.mapper = mapper
+        self.table = mapper.local_table
+        self.pk_column: Column = mapper.primary_key[0]
+        pk_property = mapper.get_property_by_column(self.pk_column)
+        self.pk_attribute = getattr(model, pk_property.key)
+        try:
+            self.pk_type = self.pk_column.type.python_type
+        except NotImplementedError:
+            self.pk_type = Any
+        self.columns: Dict[str, Column] = {
+            prop.key: prop.columns[0] for prop in mapper.column_attrs
+        }
+        self.unique_columns: List[Column] = [
+            column for column in mapper.columns if column.unique
+        ]
+        self.relationships: Dict[str, RelationInfo] = {
+            rel.key: RelationInfo(rel) for rel in mapper.relationships
+        }
+        self.foreign_keys: List[Tuple[Column, Column]] = [
+            (info.local_column, info.remote_column)
+            for info in self.relationships.values()
+            if not info.local_column.primary_key
+        ]
+        self.delete_cascades: bool = any(
+            not rel.viewonly
+            and (
+                rel.cascade.delete
+                or (rel.direction is not MANYTOONE and not rel.passive_deletes)
+            )
+            for rel in mapper.relationships
+        )
+        self._schema_columns: Dict[Type[BaseModel], List[str]] = {}
+        self._schema_relations: Dict[Type[BaseModel], List[str]] = {}
+
+    def coerce_pk(self, pk: Any) -> Any:
+        """
+        Converts a primary key to the Python type of the column, e.g. a path
+        parameter "1" to 1, so it matches the keys of loaded rows. Keys that do not
+        convert are returned unchanged.
+
+        Args:
+            pk (Any): The primary key.
+
+        Returns:
+            Any: The converted primary key.
+        """
+        if self.pk_type is Any or isinstance(pk, self.pk_type):
+            return pk
+        try:
+            return self.pk_type(pk)
+        except (TypeError, ValueError):
+            return pk
+
+    def schema_columns(self, schema: Type[BaseModel]) -> List[str]:
+        """
+        Returns the column attribute names needed to build a schema.
+
+        Args:
+            schema (Type[BaseModel]): The output schema.
+
+        Returns:
+            List[str]: The schema fields that are columns of the model, in schema order.
+        """
+        if schema not in self._schema_columns:
+            self._schema_columns[schema] = [
+                name for name in schema.model_fields if name in self.columns
+            ]
+        return self._schema_columns[schema]
+
+    def schema_relations(self, schema: Type[BaseModel]) -> List[str]:
+        """
+        Returns the relationship names referenced by a schema.
+
+        Args:
+            schema (Type[BaseModel]): The output schema.
+
+        Returns:
+            List[str]: The schema fields that are relationships of the model.
+        """
+        if schema not in self._schema_relations:
+            self._schema_relations[schema] = [
+                name for name in schema.model_fields if name in self.relationships
+            ]
+        return self._schema_relations[schema]
+
+
+_registry: Dict[type, ModelMetadata] = {}
+
+
+def get_model_metadata(model: type) -> ModelMetadata:
+    """
+    Returns the metadata of a mapped class, building it on first use.
+
+    Args:
+        model (type): The mapped class.
+
+    Returns:
+        ModelMetadata: The precomputed metadata of the model.
+    """
+    try:
+        return _registry[model]
+    except KeyError:
+        configure_mappers()
+        metadata = _registry[model] = ModelMetadata(model)
+        return metadata
+
+
+def register_models(base: Any):
+    """
+    Builds the metadata of every model mapped by a declarative base.
+
+    This is called once at app startup so the first requests do not pay for the
+    reflection either.
+
+    Args:
+        base: The SQLAlchemy declarative base of the project.
+    """
+    configure_mappers()
+    for mapper in base.registry.mappers:
+        get_model_metadata(mapper.class_)
@@ -0,0 +1,132 @@
+import json
+import base64
+import datetime
+import decimal
+import uuid
+from typing import Any, Optional, List
+
+
+class Page:
+    """
+    Page is a lightweight container for a single page of query results.
+
+    Attributes:
+        items (List[Any]): The model instances that belong to this page.
+        next (Optional[str]): Opaque cursor pointing to the following page, or None
+            when this is the last page.
+        prev (Optional[str]): Opaque cursor pointing to the preceding page, or None
+            when this is the first page.
+    """
+
+    def __init__(
+        self, items: List[Any], next: Optional[str] = None, prev: Optional[str] = None
+    ):
+        self.items = items
+        self.next = next
+        self.prev = prev
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def encode_cursor(payload: dict) -> str:
+    """
+    Encodes a cursor payload into an opaque, URL-safe token.
+
+    Args:
+        payload (dict): The cursor state (ordering values, direction or offset).
+
+    Returns:
+        str: A base64 URL-safe token without padding.
+    """
+    raw = json.dumps(payload, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> dict:
+    """
+    Decodes an opaque cursor token produced by `encode_cursor`.
+
+    Args:
+        token (str): The cursor token received from a client.
+
+    Returns:
+        dict: The decoded cursor payload.
+
+    Raises:
+        ValueError: If the token is malformed or was not produced by `encode_cursor`.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor.")
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid pagination cursor.")
+    return payload
+
+
+# Column types whose cursor values are serialized as strings, with their parsers.
+_STRING_PARSERS = {
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+    uuid.UUID: uuid.UUID,
+}
+
+
+def coerce_cursor_value(column, value: Any) -> Any:
+    """
+    Converts a JSON-decoded cursor value back to the python type of its column.
+
+    Cursor values are serialized with `str` for types JSON cannot represent
+    (dates, decimals, UUIDs), so they have to be restored before being bound
+    into a comparison against the column. Cursors are client input: a value that
+    does not fit the column is rejected here rather than by the database.
+
+    Args:
+        column: The SQLAlchemy column the value is compared against.
+        value (Any): The decoded cursor value.
+
+    Returns:
+        Any: The value converted to the column's python type when needed.
+
+    Raises:
+        ValueError: If the value does not match the type of the column.
+    """
+    if value is None:
+        return value
+    if isinstance(value, (list, dict)):
+        raise ValueError("Invalid pagination cursor.")
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if python_type in _STRING_PARSERS:
+            if not isinstance(value, str):
+                raise ValueError
+            return _STRING_PARSERS[python_type](value)
+        if python_type is decimal.Decimal:
+            if isinstance(value, bool):
+                raise ValueError
+            return decimal.Decimal(str(value))
+        if python_type is bool:
+            if not isinstance(value, bool):
+                raise ValueError
+        elif python_type is int:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ValueError
+        elif python_type is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError
+            return float(value)
+        elif python_type is str:
+            if not isinstance(value, str):
+                raise ValueError
+    except (ValueError, TypeError, ArithmeticError):
+        raise ValueError("Invalid pagination cursor.")
+    return value
@@ -0,0 +1,216 @@
+"""
+This module builds the connection pool options of the database engines and
+records pool telemetry.
+
+Pool settings come from the `DATABASE_POOL` dict of the project settings, e.g.:
+
+    DATABASE_POOL = {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "statement_cache_size": 100,  # asyncpg prepared statement cache
+        "pgbouncer": False,
+    }
+
+With `"pgbouncer": True` the prepared-statement caches of the driver are turned
+off (and asyncpg statements get unique names), which PgBouncer requires in
+transaction pooling mode.
+
+Queue pools are replaced by `InstrumentedAsyncQueuePool`, which measures how long
+each checkout waited for a free connection. `PoolStats` exposes those timings
+alongside the live pool counters, so pool sizes can be chosen from data.
+"""
+
+import bisect
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Upper bounds (in seconds) of the checkout wait-time histogram buckets.
+WAIT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+ENGINE_POOL_OPTIONS = (
+    "pool_size",
+    "max_overflow",
+    "pool_timeout",
+    "pool_recycle",
+    "pool_pre_ping",
+    "pool_use_lifo",
+    "poolclass",
+)
+
+
+class PoolStats:
+    """
+    PoolStats accumulates the checkout wait times of a pool.
+
+    Attributes:
+        buckets (Tuple[float, ...]): The upper bounds of the histogram buckets, in seconds.
+        counts (list[int]): The number of checkouts per bucket, plus one for slower ones.
+        waits (int): The number of checkouts measured.
+        wait_sum (float): The total seconds spent waiting for connections.
+        wait_max (float): The longest wait, in seconds.
+        timeouts (int): The number of checkouts that gave up after `pool_timeout`.
+
+    Methods:
+        observe(seconds: float):
+            Records the wait time of a checkout.
+
+        snapshot(pool) -> dict:
+            Returns the live counters of a pool along with the wait histogram.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = WAIT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.waits = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def observe(self, seconds: float):
+        """Records the wait time of a checkout."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.waits += 1
+        self.wait_sum += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+    def snapshot(self, pool) -> dict:
+        """
+        Returns the live counters of a pool along with the wait histogram.
+
+        Args:
+            pool: The SQLAlchemy pool of the engine.
+
+        Returns:
+            dict: size, checked_out, checked_in, overflow, timeouts and a `wait`
+            histogram with cumulative bucket counts keyed by their upper bound.
+        """
+        stats = {"pool": type(pool).__name__}
+        for name, counter in (
+            ("size", "size"),
+            ("checked_out", "checkedout"),
+            ("checked_in", "checkedin"),
+            ("overflow", "overflow"),
+        ):
+            method = getattr(pool, counter, None)
+            stats[name] = method() if method else None
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        stats["timeouts"] = self.timeouts
+        stats["wait"] = {
+            "count": self.waits,
+            "sum": self.wait_sum,
+            "max": self.wait_max,
+            "avg": self.wait_sum / self.waits if self.waits else 0.0,
+            "buckets": buckets,
+        }
+        return stats
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    InstrumentedAsyncQueuePool is an `AsyncAdaptedQueuePool` recording how long
+    each checkout waits for a connection into its `stats`.
+
+    Attributes:
+        stats (PoolStats): The wait-time statistics of the pool.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        # Keep accumulating into the same stats across engine disposals.
+        pool.stats = self.stats
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.observe(time.perf_counter() - start)
+
+
+def engine_options(database_url: str, pool: Optional[Dict[str, Any]] = None) -> dict:
+    """
+    Translates a `DATABASE_POOL` dict into `create_async_engine` keyword arguments.
+
+    Args:
+        database_url (str): The URL of the database.
+        pool (Dict[str, Any], optional): The pool settings.
+
+    Returns:
+        dict: The engine keyword arguments, including `url`.
+
+    Raises:
+        KeyError: If the pool settings contain an unknown key.
+    """
+    pool = dict(pool or {})
+    url = make_url(database_url)
+    driver = url.get_driver_name()
+    options: Dict[str, Any] = {}
+    connect_args: Dict[str, Any] = {}
+
+    pgbouncer = pool.pop("pgbouncer", False)
+    statement_cache_size = pool.pop("statement_cache_size", None)
+    if pgbouncer:
+        statement_cache_size = 0
+    if statement_cache_size is not None and driver == "asyncpg":
+        connect_args["statement_cache_size"] = statement_cache_size
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(statement_cache_size)}
+        )
+    if pgbouncer and driver == "asyncpg":
+        # PgBouncer may hand each transaction a different server connection,
+        # so statement names must never collide between clients.
+        connect_args["prepared_statement_name_func"] = (
+            lambda: f"__asyncpg_{uuid.uuid4()}__"
+        )
+    elif pgbouncer and driver == "psycopg":
+        connect_args["prepare_threshold"] = None
+
+    for key in list(pool):
+        if key not in ENGINE_POOL_OPTIONS and key != "connect_args":
+            raise KeyError(f"Unknown DATABASE_POOL option '{key}'.")
+    connect_args.update(pool.pop("connect_args", {}))
+    options.update(pool)
+    if "poolclass" not in options and issubclass(
+        url.get_dialect().get_pool_class(url), AsyncAdaptedQueuePool
+    ):
+        options["poolclass"] = InstrumentedAsyncQueuePool
+    if connect_args:
+        options["connect_args"] = connect_args
+    options["url"] = url
+    return options
+
+
+def pool_stats(engine) -> dict:
+    """
+    Returns the live counters and wait statistics of an engine's pool.
+
+    Args:
+        engine (AsyncEngine): The engine.
+
+    Returns:
+        dict: The pool statistics (see `PoolStats.snapshot`); pools that are not
+        instrumented only report their live counters.
+    """
+    pool = engine.pool
+    stats = getattr(pool, "stats", None) or PoolStats()
+    return stats.snapshot(pool)
@@ -0,0 +1,452 @@
+"""
+This module provides `QuerySet`, a lazy and immutable query over a model,
+returned by `ORM.query()`:
+
+    posts = await (
+        post_orm.query()
+        .filter(Q(title__startswith="How") | Q(user_id__in=[1, 2]), published=True)
+        .exclude(deleted_at__isnull=False)
+        .order_by("-created_at")
+        .limit(20)
+        .all()
+    )
+
+Every method returns a new QuerySet, so a base query can be shared and refined.
+Nothing runs until the query is evaluated with `all`, `first`, `count`,
+`exists` or `async for`, and each evaluation issues a single statement (plus
+one IN query per prefetched collection).
+
+Filters use the lookups of `FastAPIBig.orm.base.lookups` (`age__gte=18`,
+`id__in=[...]`, ...) and can be combined with `Q` objects: `&` (AND), `|` (OR)
+and `~` (NOT). Values are bound parameters, so the statement only depends on
+the shape of the query (filtered columns and lookups, ordering, projection,
+...). It is built once per shape and kept in the `statement_cache`, and
+SQLAlchemy reuses its compiled SQL as well.
+"""
+
+import copy
+import itertools
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Integer, and_, bindparam, literal_column, not_, or_, select, true
+from sqlalchemy.sql.functions import count
+
+from FastAPIBig.orm.base.loading import split_related
+from FastAPIBig.orm.base.lookups import (
+    LOOKUPS,
+    compile_lookup,
+    is_structural,
+    prepare_value,
+    split_lookup,
+)
+from FastAPIBig.orm.base.statements import statement_cache
+
+
+class Q:
+    """
+    Q is a filter expression that can be combined with `&`, `|` and `~`.
+
+    The keyword lookups of a Q, and the Q objects it is built from, are joined
+    with AND:
+
+        Q(age__gte=18, country="FR") | ~Q(name__startswith="test")
+
+    Attributes:
+        children (tuple): The nested Q objects and (keyword, value) lookups.
+        connector (str): How the children are joined, "AND" or "OR".
+        negated (bool): Whether the expression is negated.
+    """
+
+    AND = "AND"
+    OR = "OR"
+
+    def __init__(self, *children: "Q", **lookups: Any):
+        self.children: Tuple[Any, ...] = (*children, *lookups.items())
+        self.connector = self.AND
+        self.negated = False
+
+    def _combine(self, children: tuple, connector: str, negated: bool) -> "Q":
+        q = Q()
+        q.children, q.connector, q.negated = children, connector, negated
+        return q
+
+    def __and__(self, other: "Q") -> "Q":
+        return self._combine((self, other), self.AND, False)
+
+    def __or__(self, other: "Q") -> "Q":
+        return self._combine((self, other), self.OR, False)
+
+    def __invert__(self) -> "Q":
+        return self._combine(self.children, self.connector, not self.negated)
+
+    def shape(self, values: List[Any]) -> tuple:
+        """
+        Returns the hashable shape of the expression, appending the values it
+        binds to `values` in the order of the bound parameters.
+
+        Args:
+            values (List[Any]): Receives the values to bind.
+
+        Returns:
+            tuple: The connector, negation and children shapes. Lookups whose
+            value changes the SQL (see `is_structural`) keep their value.
+        """
+        children = []
+        for child in self.children:
+            if isinstance(child, Q):
+                children.append(child.shape(values))
+                continue
+            key, value = child
+            name, lookup = split_lookup(key)
+            if is_structural(lookup, value):
+                literal = bool(value) if lookup == "isnull" else None
+                children.append(("lookup", name, lookup, True, literal))
+            else:
+                values.append(prepare_value(lookup, value))
+                children.append(("lookup", name, lookup, False, None))
+        return ("q", self.connector, self.negated, tuple(children))
+
+
+def bind_filters(filters: Dict[str, Any]) -> Tuple[tuple, Dict[str, Any]]:
+    """
+    Splits filter keywords into the shape of their conditions and the values to bind.
+
+    Args:
+        filters (Dict[str, Any]): Filter keywords, e.g. `{"age__gte": 18}`.
+
+    Returns:
+        Tuple[tuple, Dict[str, Any]]: The shape (see `Q.shape`) and the parameters.
+    """
+    values: List[Any] = []
+    shape = Q(**filters).shape(values)
+    return shape, bound_params(values)
+
+
+def bound_params(values: List[Any]) -> Dict[str, Any]:
+    """Names the values collected by `Q.shape` after their bound parameters."""
+    return {f"p{index}": value for index, value in enumerate(values)}
+
+
+def compile_condition(orm: Any, shape: tuple, names: Iterator[int]) -> Any:
+    """
+    Compiles the shape of a Q into a SQL condition on the model of an ORM, with
+    bound parameters in place of the values. Parameters are named in the order
+    `Q.shape` collected their values.
+
+    Args:
+        orm (ORM): The ORM instance whose model is filtered.
+        shape (tuple): The shape returned by `Q.shape`.
+        names (Iterator[int]): Numbers the bound parameters, e.g. `itertools.count()`.
+
+    Returns:
+        The SQL condition.
+
+    Raises:
+        AttributeError: If a field is not a column of the model.
+    """
+    if shape[0] == "lookup":
+        _, name, lookup, structural, value = shape
+        if name not in orm.meta.columns:
+            raise AttributeError(
+                f"Model {orm.model.__name__} does not have '{name}' column"
+            )
+        column = getattr(orm.model, name)
+        if structural:
+            return compile_lookup(column, lookup, value)
+        parameter = bindparam(f"p{next(names)}", expanding=lookup == "in")
+        return LOOKUPS[lookup](column, parameter)
+
+    _, connector, negated, children = shape
+    conditions = [compile_condition(orm, child, names) for child in children]
+    if not conditions:
+        condition = true()
+    elif len(conditions) == 1:
+        condition = conditions[0]
+    else:
+        condition = (and_ if connector == Q.AND else or_)(*conditions)
+    return not_(condition) if negated else condition
+
+
+class QuerySet:
+    """
+    QuerySet is a lazy, immutable query over the model of an ORM.
+
+    Attributes:
+        chunk_size (int): The number of rows fetched per round trip by `async for`.
+
+    Methods:
+        filter(*conditions: Q, **lookups) -> QuerySet:
+            Keeps the records matching the conditions.
+
+        exclude(*conditions: Q, **lookups) -> QuerySet:
+            Drops the records matching the conditions.
+
+        order_by(*fields: str) -> QuerySet:
+            Orders the records ("-" prefix for descending), replacing any previous ordering.
+
+        limit(limit: int) -> QuerySet:
+            Returns at most `limit` records.
+
+        offset(offset: int) -> QuerySet:
+            Skips the first `offset` records.
+
+        only(*fields: str) -> QuerySet:
+            Selects these columns only, returning row mappings.
+
+        prefetch(*paths: str) -> QuerySet:
+            Eager-loads relationships ("__" separates nested paths).
+
+        all() -> list:
+            Returns the records.
+
+        first():
+            Returns the first record, or None.
+
+        count() -> int:
+            Counts the records.
+
+        exists() -> bool:
+            Tells whether any record matches.
+
+        iterator(chunk_size: int = None) -> AsyncIterator:
+            Iterates over the records through a server-side cursor.
+    """
+
+    chunk_size: int = 1000
+
+    def __init__(self, orm: Any):
+        """
+        Args:
+            orm (ORM): The ORM instance whose model and database are queried.
+        """
+        self._orm = orm
+        self._where: Tuple[Q, ...] = ()
+        self._order: Tuple[str, ...] = ()
+        self._limit: Optional[int] = None
+        self._offset: Optional[int] = None
+        self._fields: Tuple[str, ...] = ()
+        self._prefetch: Tuple[str, ...] = ()
+
+    def __repr__(self):
+        return f"<QuerySet {self._orm.model.__name__}>"
+
+    def _clone(self, **changes: Any) -> "QuerySet":
+        """Returns a copy of the queryset with some of its state replaced."""
+        clone = copy.copy(self)
+        for name, value in changes.items():
+            setattr(clone, f"_{name}", value)
+        return clone
+
+    def filter(self, *conditions: Q, **lookups: Any) -> "QuerySet":
+        """
+        Keeps the records matching every condition.
+
+        Args:
+            *conditions (Q): Filter expressions.
+            **lookups: Filter keywords, e.g. `age__gte=18`.
+
+        Returns:
+            QuerySet: The refined queryset.
+        """
+        return self._clone(where=(*self._where, Q(*conditions, **lookups)))
+
+    def exclude(self, *conditions: Q, **lookups: Any) -> "QuerySet":
+        """
+        Drops the records matching every condition.
+
+        Args:
+            *conditions (Q): Filter expressions.
+            **lookups: Filter keywords, e.g. `status="draft"`.
+
+        Returns:
+            QuerySet: The refined queryset.
+        """
+        return self._clone(where=(*self._where, ~Q(*conditions, **lookups)))
+
+    def order_by(self, *fields: str) -> "QuerySet":
+        """
+        Orders the records, replacing any previous ordering.
+
+        Args:
+            *fields (str): Column names, prefixed with "-" for descending order.
+
+        Returns:
+            QuerySet: The ordered queryset.
+        """
+        return self._clone(order=fields)
+
+    def limit(self, limit: Optional[int]) -> "QuerySet":
+        """Returns a queryset of at most `limit` records (None removes the limit)."""
+        return self._clone(limit=limit)
+
+    def offset(self, offset: Optional[int]) -> "QuerySet":
+        """Returns a queryset skipping the first `offset` records (None removes the offset)."""
+        return self._clone(offset=offset)
+
+    def only(self, *fields: str) -> "QuerySet":
+        """
+        Selects these columns only. The records are then returned as row
+        mappings instead of model instances.
+
+        Args:
+            *fields (str): Column names.
+
+        Returns:
+            QuerySet: The projected queryset.
+        """
+        return self._clone(fields=fields)
+
+    def prefetch(self, *paths: str) -> "QuerySet":
+        """
+        Eager-loads relationships, joined for many-to-one paths and with one IN
+        query per hop for collections (see `split_related`).
+
+        Args:
+            *paths (str): Relationship paths, "__" separating nested hops.
+
+        Returns:
+            QuerySet: The queryset loading the relationships.
+        """
+        return self._clone(prefetch=(*self._prefetch, *paths))
+
+    def _statement(self, kind: str) -> Tuple[Any, dict]:
+        """
+        Returns the cached statement of the query and the parameters to execute it with.
+
+        Args:
+            kind (str): "select", "iterate", "count" or "exists".
+        """
+        values: List[Any] = []
+        where = tuple(condition.shape(values) for condition in self._where)
+        key = (
+            self._orm.model,
+            kind,
+            where,
+            self._order,
+            self._limit is not None,
+            self._offset is not None,
+            self._fields,
+            self._prefetch,
+        )
+        statement = statement_cache.get(
+            key, lambda: self._build(kind, where), kind="queryset"
+        )
+        params = bound_params(values)
+        if self._limit is not None:
+            params["p_limit"] = self._limit
+        if self._offset is not None:
+            params["p_offset"] = self._offset
+        return statement, params
+
+    def _build(self, kind: str, where: tuple) -> Any:
+        """
+        Builds the statement of a query shape, with bound parameters in place of values.
+
+        Raises:
+            AttributeError: If a field or path does not exist in the model.
+            ValueError: If a projection is combined with eager loading.
+        """
+        orm = self._orm
+        names = itertools.count()
+        conditions = [compile_condition(orm, shape, names) for shape in where]
+
+        if kind in ("count", "exists"):
+            column = count() if kind == "count" else literal_column("1")
+            if self._limit is None and self._offset is None:
+                query = select(column).select_from(orm.model).where(*conditions)
+            else:
+                rows = self._paged(select(orm.meta.pk_attribute).where(*conditions))
+                query = select(column).select_from(rows.subquery())
+            return query.limit(1) if kind == "exists" else query
+
+        select_related, prefetch_related = split_related(orm.model, self._prefetch)
+        if kind == "iterate":
+            # Joined eager loading cannot be combined with a server-side cursor.
+            select_related, prefetch_related = [], select_related + prefetch_related
+        query = (
+            orm._select(select_related, prefetch_related, list(self._fields) or None)
+            .where(*conditions)
+            .order_by(*orm._order_by(list(self._order)))
+        )
+        return self._paged(query)
+
+    def _paged(self, query: Any) -> Any:
+        """Applies the bound LIMIT and OFFSET of the queryset."""
+        if self._limit is not None:
+            query = query.limit(bindparam("p_limit", type_=Integer))
+        if self._offset is not None:
+            query = query.offset(bindparam("p_offset", type_=Integer))
+        return query
+
+    async def all(self) -> list:
+        """
+        Runs the query.
+
+        Returns:
+            list: The model instances, or row mappings with `only`.
+        """
+        statement, params = self._statement("select")
+        async with self._orm._async_read_session(self._orm.database) as db_session:
+            result = await db_session.execute(statement, params)
+            return self._orm._rows(result, self._fields).all()
+
+    async def first(self) -> Any:
+        """
+        Runs the query limited to one record.
+
+        Returns:
+            The first record, or None if nothing matches.
+        """
+        records = await self.limit(1).all()
+        return records[0] if records else None
+
+    async def count(self) -> int:
+        """
+        Counts the matching records with a `SELECT count(*)`, honouring the limit and offset.
+
+        Returns:
+            int: The number of records.
+        """
+        statement, params = self._statement("count")
+        async with self._orm._async_read_session(self._orm.database) as db_session:
+            result = await db_session.execute(statement, params)
+            return result.scalar()
+
+    async def exists(self) -> bool:
+        """
+        Tells whether any record matches, with a `SELECT 1 ... LIMIT 1`.
+
+        Returns:
+            bool: True if a record matches.
+        """
+        statement, params = self._statement("exists")
+        async with self._orm._async_read_session(self._orm.database) as db_session:
+            result = await db_session.execute(statement, params)
+            return result.first() is not None
+
+    async def iterator(self, chunk_size: Optional[int] = None) -> AsyncIterator[Any]:
+        """
+        Iterates over the records through a server-side cursor, fetching
+        `chunk_size` rows per round trip (see `ORM.stream`). Related records are
+        loaded with one IN query per chunk.
+
+        Args:
+            chunk_size (int, optional): Rows per round trip. Defaults to `chunk_size`.
+
+        Yields:
+            The model instances, or row mappings with `only`.
+        """
+        statement, params = self._statement("iterate")
+        async with self._orm._async_read_session(self._orm.database) as db_session:
+            result = await db_session.stream(
+                statement,
+                params,
+                execution_options={"yield_per": chunk_size or self.chunk_size},
+            )
+            rows = result.mappings() if self._fields else result.scalars()
+            async for chunk in rows.partitions():
+                for record in chunk:
+                    yield record
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.iterator()
@@ -0,0 +1,93 @@
+"""
+This module decides which database each model lives in.
+
+A project can declare several databases in the `DATABASES` setting, each with
+its own engine and pool. Models are assigned to one of them, in order of
+precedence, by:
+
+1. a `__database__` attribute on the model class;
+2. the longest module prefix in the `DATABASE_ROUTES` setting matching the
+   model's module, e.g. `{"apps.events": "events"}` routes every model of the
+   `events` app;
+3. the "default" database.
+
+Anything that is not a mapped class (e.g. the `model = None` of a view without
+a model) goes to the "default" database.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import inspect
+
+DEFAULT_DATABASE = "default"
+
+
+class DatabaseRouter:
+    """
+    DatabaseRouter resolves the database alias of models.
+
+    Attributes:
+        routes (Dict[str, str]): Database aliases keyed by module prefix.
+
+    Methods:
+        database_for(model: type) -> str:
+            Returns the alias of the database a model is stored in.
+
+        tables_by_database(base) -> Dict[str, list]:
+            Groups the tables of a declarative base by database alias.
+    """
+
+    def __init__(self, routes: Optional[Dict[str, str]] = None):
+        self.routes = routes or {}
+        self._aliases: Dict[type, str] = {}
+
+    def database_for(self, model: type) -> str:
+        """
+        Returns the alias of the database a model is stored in.
+
+        Args:
+            model (type): The mapped class, or None.
+
+        Returns:
+            str: The database alias, "default" if `model` is not mapped.
+        """
+        if model is None:
+            return DEFAULT_DATABASE
+        alias = self._aliases.get(model)
+        if alias is None:
+            alias = getattr(model, "__database__", None)
+            if alias is None and inspect(model, raiseerr=False) is None:
+                return DEFAULT_DATABASE
+            if alias is None:
+                module = model.__module__
+                prefixes = [
+                    prefix
+                    for prefix in self.routes
+                    if module == prefix or module.startswith(prefix + ".")
+                ]
+                alias = (
+                    self.routes[max(prefixes, key=len)] if prefixes else DEFAULT_DATABASE
+                )
+            self._aliases[model] = alias
+        return alias
+
+    def tables_by_database(self, base: Any) -> Dict[str, List]:
+        """
+        Groups the tables of a declarative base by the database they belong to.
+
+        Tables that are not mapped by a model (e.g. association tables) go to
+        the "default" database.
+
+        Args:
+            base: The SQLAlchemy declarative base of the project.
+
+        Returns:
+            Dict[str, List[Table]]: The tables of each database alias.
+        """
+        aliases = {}
+        for mapper in base.registry.mappers:
+            aliases[mapper.local_table] = self.database_for(mapper.class_)
+        tables: Dict[str, List] = {}
+        for table in base.metadata.sorted_tables:
+            tables.setdefault(aliases.get(table, DEFAULT_DATABASE), []).append(table)
+        return tables
@@ -1,6 +1,48 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 import contextlib
-from typing import AsyncIterator, Any
+import contextvars
+from typing import AsyncIterator, Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from FastAPIBig.orm.base.pool import engine_options, pool_stats
+from FastAPIBig.orm.base.instrumentation import instrument_engine
+
+REPLICA_POLICIES = ("round_robin", "least_connections")
+
+# Maps each DataBaseSessionManager to the session of the unit of work currently
+# active in this context. The mapping is replaced, never mutated, so contexts
+# copied into other tasks do not observe later changes.
+_unit_of_work_sessions: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "fastapibig_unit_of_work_sessions", default=None
+)
+
+# Read routing state of the current request: whether the client is pinned to the
+# primary by a recent write ("pinned") and whether the request wrote ("wrote").
+# Unlike the sessions above, the state dict is mutated in place so writes made
+# anywhere in the request are seen by the middleware that owns it.
+_routing_state: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "fastapibig_routing_state", default=None
+)
+
+
+def detach_unit_of_work(callback: Callable, *args: Any) -> Any:
+    """
+    Runs a callback in a copy of the current context without any active unit of work.
+
+    Tasks created with `asyncio.create_task` inherit the context of their creator,
+    so a background task spawned during a request would otherwise share (and race
+    on) the request's session after the request has committed and closed it.
+
+    Args:
+        callback (Callable): The callable to run, e.g. `asyncio.create_task`.
+        *args (Any): Positional arguments passed to the callback.
+
+    Returns:
+        Any: The return value of the callback.
+    """
+    context = contextvars.copy_context()
+    context.run(_unit_of_work_sessions.set, None)
+    return context.run(callback, *args)
 
 
 class DataBaseSessionManager:
@@ -12,26 +54,122 @@ class DataBaseSessionManager:
     Attributes:
         _async_engine (AsyncEngine): The asynchronous database engine.
         _async_sessionmaker (async_sessionmaker): The sessionmaker for creating async sessions.
+        _replica_engines (List[AsyncEngine]): The engines of the read replicas.
+        _replica_sessionmakers (List[async_sessionmaker]): The sessionmakers of the read replicas.
+        replica_policy (str): How reads are spread over replicas, "round_robin" or
+            "least_connections".
+        read_your_writes (float): Seconds a client stays pinned to the primary after a write.
+        pool (Dict[str, Any]): The pool settings shared by every engine (see
+            `FastAPIBig.orm.base.pool`).
+        slow_query_ms (Optional[float]): The slow-query log threshold (see
+            `FastAPIBig.orm.base.instrumentation`).
 
     Methods:
-        __init__(database_url: str, **kwargs: Any):
-            Initializes the async database engine and sessionmaker.
+        __init__(database_url: str, replica_urls: List[str] = None, replica_policy: str = "round_robin", read_your_writes: float = 0, pool: Dict[str, Any] = None, slow_query_ms: float = None, **kwargs: Any):
+            Initializes the async database engines and sessionmakers.
+        pool_stats() -> Dict[str, dict]:
+            Returns the live counters and wait times of every connection pool.
         close():
             Disposes of the async engine and cleans up resources.
-        create_all_tables(base):
-            Creates all tables defined in the provided SQLAlchemy declarative base.
+        create_all_tables(base, tables: List[Table] = None):
+            Creates all tables (or the given ones) defined in the provided SQLAlchemy declarative base.
         async_session():
             Provides an asynchronous context manager for database sessions.
+        current_session():
+            Returns the session of the unit of work active in the current context.
+        session():
+            Provides the active unit-of-work session, or a new session if none is active.
+        unit_of_work():
+            Binds a single session/transaction to the current context until exit.
+        atomic():
+            Runs a block atomically, using a savepoint inside an active unit of work.
+        commit(session, on_commit: Callable = None):
+            Commits a session, or only flushes it if it belongs to a unit of work,
+            then runs `on_commit` once the changes are committed.
+        on_commit(callback: Callable[[], Awaitable]):
+            Awaits a callback once the writes of the current unit of work commit.
+        commit_transaction(session):
+            Commits a session and awaits the callbacks registered with `on_commit`.
+        read_session(shared: bool = True):
+            Provides a session for read-only operations, on a replica when possible.
+        routing_scope(pinned: bool = False):
+            Tracks the writes of a request to keep its reads on the primary.
     """
 
-    def __init__(self, database_url: str, **kwargs: Any):
-        """Initializes the SessionManager with a database URL and optional keyword arguments."""
-        self._async_engine = create_async_engine(
-            url=database_url,
-        )
+    def __init__(
+        self,
+        database_url: str,
+        replica_urls: Optional[List[str]] = None,
+        replica_policy: str = "round_robin",
+        read_your_writes: float = 0,
+        pool: Optional[Dict[str, Any]] = None,
+        slow_query_ms: Optional[float] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initializes the SessionManager with a database URL and optional keyword arguments.
+
+        Args:
+            database_url (str): The URL of the primary database.
+            replica_urls (List[str], optional): The URLs of read replicas. Read-only
+                ORM operations are spread over them.
+            replica_policy (str, optional): "round_robin" (default) or
+                "least_connections" (the replica with the fewest open read sessions).
+            read_your_writes (float, optional): Seconds a client that wrote stays
+                pinned to the primary, so it reads its own writes despite replica lag.
+            pool (Dict[str, Any], optional): The pool settings of the engines, such as
+                `pool_size`, `max_overflow`, `pool_timeout`, `pool_recycle`,
+                `pool_pre_ping`, `statement_cache_size` and `pgbouncer`.
+            slow_query_ms (float, optional): Statements running at least this many
+                milliseconds are logged as slow queries.
+            **kwargs: Extra keyword arguments passed to `create_async_engine`.
+
+        Raises:
+            ValueError: If the replica policy is not supported.
+            KeyError: If the pool settings contain an unknown key.
+        """
+        if replica_policy not in REPLICA_POLICIES:
+            raise ValueError(
+                f"Unsupported replica policy '{replica_policy}', "
+                f"expected one of {list(REPLICA_POLICIES)}."
+            )
+        self.pool = pool or {}
+        self.slow_query_ms = slow_query_ms
+        self._engine_kwargs = kwargs
+        self._async_engine = self._create_engine(database_url)
         self._async_sessionmaker = async_sessionmaker(
             bind=self._async_engine, expire_on_commit=False, class_=AsyncSession
         )
+        self._replica_engines = [self._create_engine(url) for url in replica_urls or []]
+        self._replica_sessionmakers = [
+            async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+            for engine in self._replica_engines
+        ]
+        self._replica_sessions = [0] * len(self._replica_engines)
+        self._next_replica = 0
+        self.replica_policy = replica_policy
+        self.read_your_writes = read_your_writes
+
+    def _create_engine(self, database_url: str):
+        """Creates an instrumented async engine with the configured pool settings and keyword arguments."""
+        engine = create_async_engine(
+            **{**engine_options(database_url, self.pool), **self._engine_kwargs}
+        )
+        instrument_engine(engine, self.slow_query_ms)
+        return engine
+
+    def pool_stats(self) -> Dict[str, dict]:
+        """
+        Returns the live counters and checkout wait times of every connection pool.
+
+        Returns:
+            Dict[str, dict]: The stats of the "primary" pool and of each replica
+            ("replica_0", "replica_1", ...), see `FastAPIBig.orm.base.pool.PoolStats`.
+        """
+        stats = {"primary": pool_stats(self._async_engine)}
+        for index, engine in enumerate(self._replica_engines):
+            stats[f"replica_{index}"] = pool_stats(engine)
+        return stats
 
     async def close(self):
         """
@@ -45,22 +183,28 @@ class DataBaseSessionManager:
             Any exception that may occur during the disposal of the engine.
         """
         await self._async_engine.dispose()
+        for engine in self._replica_engines:
+            await engine.dispose()
         self._async_engine = None
         self._async_sessionmaker = None
+        self._replica_engines = []
+        self._replica_sessionmakers = []
 
-    async def create_all_tables(self, base):
+    async def create_all_tables(self, base, tables: Optional[List] = None):
         """
         Asynchronously creates all tables defined in the provided SQLAlchemy Base metadata.
 
         Args:
             base (sqlalchemy.ext.declarative.api.DeclarativeMeta):
                 The SQLAlchemy Base class containing the metadata for table definitions.
+            tables (List[Table], optional): Only create these tables, e.g. those
+                routed to this database. Defaults to every table of the metadata.
 
         Returns:
             None
         """
         async with self._async_engine.begin() as conn:
-            await conn.run_sync(base.metadata.create_all)
+            await conn.run_sync(base.metadata.create_all, tables=tables)
 
     @contextlib.asynccontextmanager
     async def async_session(self) -> AsyncIterator[AsyncSession]:
@@ -82,7 +226,239 @@ class DataBaseSessionManager:
         async with self._async_sessionmaker() as session:
             try:
                 yield session
-                await session.commit()
+                await self.commit_transaction(session)
             except Exception as e:
+                session.info.pop("on_commit", None)
                 await session.rollback()
                 raise e
+
+    def current_session(self) -> Optional[AsyncSession]:
+        """
+        Returns the session of the unit of work active in the current context.
+
+        Returns:
+            Optional[AsyncSession]: The bound session, or None outside a unit of work.
+        """
+        sessions = _unit_of_work_sessions.get()
+        return sessions.get(self) if sessions else None
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Provides a session for a single database operation.
+
+        Inside a unit of work the bound session is reused, so every operation of
+        the request shares one connection and one transaction. Otherwise a new
+        session is opened and committed on exit, as with `async_session`.
+
+        Yields:
+            AsyncIterator[AsyncSession]: An asynchronous session object for database operations.
+        """
+        current = self.current_session()
+        if current is not None:
+            yield current
+            return
+        async with self.async_session() as session:
+            yield session
+
+    async def commit(
+        self, session: AsyncSession, on_commit: Optional[Callable[[], Any]] = None
+    ):
+        """
+        Commits the changes made through a session.
+
+        Sessions bound to a unit of work are only flushed, so generated values
+        are available immediately while the commit is deferred to the end of
+        the unit of work.
+
+        Args:
+            session (AsyncSession): The session to commit.
+            on_commit (Callable[[], Any], optional): Called once the changes are
+                committed: right away, or when the unit of work commits. Not called
+                if it rolls back.
+        """
+        state = _routing_state.get()
+        if state is not None:
+            state["wrote"] = True
+        if session is self.current_session():
+            await session.flush()
+            # Flushed but uncommitted data must not leak into shared caches.
+            session.info["pending_writes"] = True
+            if on_commit is not None:
+                event.listen(
+                    session.sync_session,
+                    "after_commit",
+                    lambda _session: on_commit(),
+                    once=True,
+                )
+        else:
+            await session.commit()
+            if on_commit is not None:
+                on_commit()
+
+    async def on_commit(self, callback: Callable[[], Awaitable]):
+        """
+        Awaits a callback once the writes of the current unit of work are committed.
+
+        Outside a unit of work the writes are already committed and the callback
+        is awaited right away. Callbacks of a unit of work that rolls back are
+        discarded.
+
+        Args:
+            callback (Callable[[], Awaitable]): The coroutine function to await.
+        """
+        current = self.current_session()
+        if current is None:
+            await callback()
+        else:
+            current.info.setdefault("on_commit", []).append(callback)
+
+    async def commit_transaction(self, session: AsyncSession):
+        """
+        Commits the transaction of a session, then awaits the callbacks registered
+        with `on_commit`.
+
+        Args:
+            session (AsyncSession): The session to commit.
+        """
+        await session.commit()
+        for callback in session.info.pop("on_commit", ()):
+            await callback()
+
+    @contextlib.asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[AsyncSession]:
+        """
+        Binds a single session and transaction to the current context.
+
+        Every ORM operation executed inside the block reuses this session instead
+        of checking out its own connection. The transaction is committed once on
+        exit, or rolled back if an exception is raised. Nested calls reuse the
+        outer unit of work.
+
+        Yields:
+            AsyncIterator[AsyncSession]: The session bound to the unit of work.
+        """
+        current = self.current_session()
+        if current is not None:
+            yield current
+            return
+        async with self.async_session() as session:
+            sessions = dict(_unit_of_work_sessions.get() or {})
+            sessions[self] = session
+            token = _unit_of_work_sessions.set(sessions)
+            try:
+                yield session
+            finally:
+                _unit_of_work_sessions.reset(token)
+
+    @contextlib.asynccontextmanager
+    async def atomic(self) -> AsyncIterator[AsyncSession]:
+        """
+        Runs a block of operations atomically.
+
+        Inside an active unit of work the block runs in a savepoint, so it can be
+        rolled back on its own without aborting the surrounding transaction.
+        Outside a unit of work, a new unit of work is opened and committed on exit.
+
+        Yields:
+            AsyncIterator[AsyncSession]: The session the block runs in.
+        """
+        current = self.current_session()
+        if current is None:
+            async with self.unit_of_work() as session:
+                yield session
+            return
+        async with current.begin_nested():
+            yield current
+
+    def _use_primary(self) -> bool:
+        """Tells whether reads of the current context must stay on the primary."""
+        if not self._replica_sessionmakers:
+            return True
+        state = _routing_state.get()
+        if state is not None and (state["pinned"] or state["wrote"]):
+            return True
+        current = self.current_session()
+        return current is not None and (
+            current.info.get("pending_writes") or current.in_nested_transaction()
+        )
+
+    def shares_reads(self) -> bool:
+        """
+        Tells whether the reads of the current context can be served by a session
+        shared with other contexts, e.g. by a batch query (see `ORM.load`). They
+        cannot once the current unit of work (or request) wrote, inside an
+        `atomic()` block, or while the client is pinned to the primary.
+        """
+        state = _routing_state.get()
+        if state is not None and (state["pinned"] or state["wrote"]):
+            return False
+        current = self.current_session()
+        return current is None or not (
+            current.info.get("pending_writes") or current.in_nested_transaction()
+        )
+
+    def _pick_replica(self) -> int:
+        """Returns the index of the replica serving the next read."""
+        if self.replica_policy == "least_connections":
+            return min(
+                range(len(self._replica_sessions)),
+                key=self._replica_sessions.__getitem__,
+            )
+        index = self._next_replica % len(self._replica_sessionmakers)
+        self._next_replica = index + 1
+        return index
+
+    @contextlib.asynccontextmanager
+    async def read_session(self, shared: bool = True) -> AsyncIterator[AsyncSession]:
+        """
+        Provides a session for read-only operations.
+
+        Without replicas this is `session()`. With replicas, the session is opened
+        on the replica chosen by `replica_policy`, except when the read must see
+        data the primary has not replicated yet: after the current unit of work
+        (or request) wrote, inside an `atomic()` block, or while the client is
+        pinned to the primary by `read_your_writes`.
+
+        Args:
+            shared (bool, optional): Whether a read on the primary reuses the session
+                of the current unit of work. False always opens a session of its own,
+                closed on exit, for reads outliving the unit of work. Defaults to True.
+
+        Yields:
+            AsyncIterator[AsyncSession]: An asynchronous session for read-only operations.
+        """
+        if self._use_primary():
+            async with (self.session() if shared else self.async_session()) as session:
+                yield session
+            return
+        index = self._pick_replica()
+        self._replica_sessions[index] += 1
+        try:
+            async with self._replica_sessionmakers[index]() as session:
+                yield session
+        finally:
+            self._replica_sessions[index] -= 1
+
+    @contextlib.contextmanager
+    def routing_scope(self, pinned: bool = False) -> Iterator[dict]:
+        """
+        Tracks the writes made in the current context, e.g. during one request.
+
+        Once anything is committed in the scope, later reads of the scope stay on
+        the primary.
+
+        Args:
+            pinned (bool, optional): Whether reads start pinned to the primary,
+                because the client wrote within the `read_your_writes` window.
+
+        Yields:
+            Iterator[dict]: The routing state, whose "wrote" key tells whether the
+            scope committed any write.
+        """
+        state = {"pinned": pinned, "wrote": False}
+        token = _routing_state.set(state)
+        try:
+            yield state
+        finally:
+            _routing_state.reset(token)
@@ -0,0 +1,146 @@
+"""
+This module provides a cache of prebuilt SQL statements, keyed by query shape.
+
+Building a `select(...)` construct, and having SQLAlchemy derive its cache key,
+costs Python time on every query even when only the values change. Queries whose
+values are bound parameters (`bindparam`) can instead be built once per shape
+(model, filtered columns and lookups, ordering, ...) and executed with a dict of
+parameters. SQLAlchemy then also reuses the compiled SQL of the statement.
+
+The ORM caches its hot, fixed-shape queries this way (`get` by primary key,
+`first`, `exists` and `count`, the relation and unique checks of `validate`), as
+well as every `QuerySet`. Hits and misses are counted per kind of query; the
+cache is configured from the `STATEMENT_CACHE` dict of the project settings,
+e.g.:
+
+    STATEMENT_CACHE = {
+        "maxsize": 1024,
+        "enabled": True,
+    }
+"""
+
+import collections
+from typing import Any, Callable, Dict, Hashable, List
+
+
+class StatementCache:
+    """
+    StatementCache is a bounded LRU mapping query shapes to prebuilt statements.
+
+    Attributes:
+        maxsize (int): The maximum number of statements kept.
+        enabled (bool): Whether statements are cached. When False, every call
+            builds its statement.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of statements built.
+
+    Methods:
+        configure(maxsize: int = 1024, enabled: bool = True):
+            Changes the size of the cache, or disables it.
+
+        get(key: Hashable, build: Callable[[], Any], kind: str = "query") -> Any:
+            Returns the statement of a shape, building it on first use.
+
+        clear():
+            Empties the cache.
+
+        stats() -> dict:
+            Returns the cache counters.
+    """
+
+    def __init__(self, maxsize: int = 1024, enabled: bool = True):
+        self._statements: "collections.OrderedDict[Hashable, Any]" = (
+            collections.OrderedDict()
+        )
+        self.configure(maxsize, enabled)
+        self.hits = 0
+        self.misses = 0
+        self._kinds: Dict[str, List[int]] = {}
+
+    def configure(self, maxsize: int = 1024, enabled: bool = True):
+        """
+        Changes the size of the cache, or disables it.
+
+        Args:
+            maxsize (int, optional): The maximum number of statements kept.
+                Defaults to 1024.
+            enabled (bool, optional): Whether statements are cached. Defaults to True.
+
+        Raises:
+            ValueError: If the size is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError("The statement cache needs a maxsize of at least 1.")
+        self.maxsize = maxsize
+        self.enabled = enabled
+        if not enabled:
+            self._statements.clear()
+        while len(self._statements) > maxsize:
+            self._statements.popitem(last=False)
+
+    def get(self, key: Hashable, build: Callable[[], Any], kind: str = "query") -> Any:
+        """
+        Returns the statement of a query shape, building it on first use.
+
+        Args:
+            key (Hashable): The shape of the query. Values bound at execution
+                time must not be part of it.
+            build (Callable[[], Any]): Builds the statement on a miss.
+            kind (str, optional): The kind of query counted in `stats`, e.g. "get".
+
+        Returns:
+            The statement.
+        """
+        counters = self._kinds.get(kind)
+        if counters is None:
+            counters = self._kinds[kind] = [0, 0]
+        if not self.enabled:
+            return build()
+        try:
+            statement = self._statements[key]
+        except KeyError:
+            self.misses += 1
+            counters[1] += 1
+            statement = self._statements[key] = build()
+            if len(self._statements) > self.maxsize:
+                self._statements.popitem(last=False)
+            return statement
+        self.hits += 1
+        counters[0] += 1
+        self._statements.move_to_end(key)
+        return statement
+
+    def clear(self):
+        """Empties the cache, e.g. after the models are remapped."""
+        self._statements.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dict[str, Any]: enabled, size, maxsize, hits, misses and hit_rate, and
+            the hits, misses and hit_rate of each kind of query under "kinds".
+        """
+        return {
+            "enabled": self.enabled,
+            "size": len(self._statements),
+            "maxsize": self.maxsize,
+            **_rates(self.hits, self.misses),
+            "kinds": {
+                kind: _rates(hits, misses) for kind, (hits, misses) in self._kinds.items()
+            },
+        }
+
+
+def _rates(hits: int, misses: int) -> Dict[str, Any]:
+    """Returns the hits, misses and hit rate of cache lookups."""
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else 0.0,
+    }
+
+
+statement_cache = StatementCache()
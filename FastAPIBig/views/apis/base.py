@@ -1,9 +1,21 @@
+import functools
+import inspect
 from functools import cached_property
-from typing import List, Type, Optional, Dict, get_origin
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from typing import Annotated, Any, Callable, List, Type, Optional, Dict, Union, get_origin
+from fastapi import APIRouter, Body, Depends, Request, Response
+from pydantic import BaseModel, create_model
 
 from FastAPIBig.orm.base.base_model import ORM
+from FastAPIBig.orm.base.loading import split_related
+from FastAPIBig.orm.base.metadata import get_model_metadata
+from FastAPIBig.views.apis.pagination import BasePagination
+from FastAPIBig.views.apis.caching import CacheConfig, cache_route
+from FastAPIBig.views.apis.coalescing import coalesce_route
+from FastAPIBig.views.apis.filters import ListFilter
+from FastAPIBig.views.apis.metrics import instrument_route
+from FastAPIBig.views.apis.offload import rebuild_view
+from FastAPIBig.views.apis.serializers import get_type_adapter
+from FastAPIBig.views.apis.parsers import json_body_dependency, json_body_openapi
 
 
 class BaseAPI:
@@ -32,6 +44,40 @@ class BaseAPI:
         tags (Optional[List[str]]): Tags for API documentation.
         include_router (bool): Whether to include the router in the application.
         schemas_out_is_list (bool): Flag to indicate if the output schema is a list.
+        cache_ttl (Optional[float]): Seconds records read by `get` stay in the model's
+            identity cache. None (default) reads from the database every time.
+        cache_size (Optional[int]): Maximum number of records kept in the identity cache.
+        batch_get (Optional[bool]): Whether the model's `get` by primary key alone is
+            batched with the concurrent lookups (see `ORM.load`). None (default)
+            follows the model's `__batch_get__`.
+        prefetch (Optional[List[str]]): Relationships eager-loaded by the built-in read
+            operations ("__" separates nested paths). None (default) loads the
+            relationships referenced by the method's output schema.
+        projection (bool): Whether the built-in read operations select only the
+            columns of the output schema and validate row mappings instead of model
+            instances. Schemas with relationship or non-column fields keep loading
+            whole instances.
+        metrics (bool): Whether the routes record latency, in-flight and error
+            metrics (see `FastAPIBig.views.apis.metrics`). Defaults to True.
+        fast_serialization (bool): Whether the built-in operations encode their
+            results to JSON bytes themselves and return a `Response`, skipping the
+            re-validation and encoding of FastAPI's `response_model` (which still
+            documents the route). Defaults to True; when False they return schema
+            instances.
+        raw_body (bool): Whether the methods receiving a body (`create`, `update`,
+            `partial_update`, the bulk and custom POST/PUT/PATCH methods) validate
+            the raw request bytes in one pass with `validate_json`, instead of
+            letting FastAPI decode the JSON first. Errors and OpenAPI docs are the
+            same. Defaults to False.
+        cache (Optional[CacheConfig]): The HTTP response cache of the read methods
+            (see `FastAPIBig.views.apis.caching`). None (default) disables it.
+        coalesce (Union[bool, List[str]]): Whether concurrent identical requests of
+            the "get" and "list" methods share one execution (see
+            `FastAPIBig.views.apis.coalescing`), or the list of methods coalesced.
+            Defaults to False.
+        coalesce_vary_on (Optional[List[str]]): The query parameters, and headers
+            written "header:<name>", that make two coalesced requests different
+            besides the path. None (default) compares every query parameter.
 
     Methods:
         __init__(prefix: str = "", tags: Optional[List[str]] = None):
@@ -46,12 +92,24 @@ class BaseAPI:
         _get_schema_out_class(method: str = None) -> Type[BaseModel]:
             Retrieves the output schema class for a specific method.
 
+        _get_schema_in(method: str = None) -> Any:
+            Retrieves the annotation of the request body for a specific method.
+
         _get_schema_out(method: str = None) -> Type[BaseModel] | Type[List[BaseModel]] | None:
             Retrieves the output schema for a specific method, considering list methods.
 
         _get_dependencies(method: str = None) -> List[Depends]:
             Retrieves the dependencies for a specific method.
 
+        _get_read_options(method: str = None) -> dict:
+            Retrieves the eager-loading and projection options for a specific method.
+
+        _serialize(method: str, data: Any) -> Any:
+            Validates the result of a built-in operation against its output schema.
+
+        _with_body(endpoint: Callable, annotation: Any) -> Callable:
+            Returns the endpoint with its "data" parameter annotated for this view.
+
         register_method_wrapper(method_name: str, set_annotations: bool = False):
             Attaches a method to the wrapper class and optionally sets type annotations.
 
@@ -93,6 +151,9 @@ class BaseAPI:
         "delete",
         "list",
         "partial_update",
+        "bulk_create",
+        "bulk_update",
+        "bulk_delete",
     ]
 
     dependencies: List[Depends] = []
@@ -104,6 +165,19 @@ class BaseAPI:
     include_router: bool = False
     schemas_out_is_list: bool = False
 
+    cache_ttl: Optional[float] = None
+    cache_size: Optional[int] = None
+    batch_get: Optional[bool] = None
+
+    prefetch: Optional[List[str]] = None
+    projection: bool = False
+    metrics: bool = True
+    fast_serialization: bool = True
+    raw_body: bool = False
+    cache: Optional[CacheConfig] = None
+    coalesce: Union[bool, List[str]] = False
+    coalesce_vary_on: Optional[List[str]] = None
+
     def __init__(self, prefix: str = "", tags: Optional[List[str]] = None):
         """
         Initializes the base API view with a router, model, and other configurations.
@@ -117,9 +191,24 @@ class BaseAPI:
             pass
 
         self.wrapper = Wrapper
-        self._model = ORM(model=self.model)
+        self._model = ORM(
+            model=self.model,
+            cache_ttl=self.cache_ttl,
+            cache_size=self.cache_size,
+            batch_get=self.batch_get,
+        )
         self.router = APIRouter(prefix=self.prefix or prefix, tags=self.tags or tags)
         self.required_objects = []
+        self._read_options: Dict[str, dict] = {}
+        self._raw_bodies: Dict[str, Any] = {}
+
+    def __reduce__(self):
+        """
+        Pickles the view by class, e.g. when one of its methods is offloaded to a
+        worker process (see `FastAPIBig.views.apis.offload`). The view is rebuilt
+        once per process on unpickling.
+        """
+        return rebuild_view, (type(self),)
 
     @classmethod
     def as_router(
@@ -154,6 +243,18 @@ class BaseAPI:
         """
         return self.schemas_in.get(method, self.schema_in)
 
+    def _get_schema_in(self, method: str = None) -> Any:
+        """
+        Get the annotation of the request body of a method.
+
+        Args:
+            method (str, optional): The method name. Defaults to None.
+
+        Returns:
+            Any: The input schema class, possibly wrapped (e.g. in a list for bulk methods).
+        """
+        return self._get_schema_in_class(method)
+
     def _get_schema_out_class(self, method: str = None) -> Type[BaseModel]:
         """
         Get the output schema class for a method.
@@ -200,19 +301,122 @@ class BaseAPI:
         """
         return self.dependencies_by_method.get(method, self.dependencies)
 
+    def _get_read_options(self, method: str = None) -> dict:
+        """
+        Get the eager-loading and projection options of a method.
+
+        The relationships listed in `prefetch`, or by default those referenced by
+        the method's output schema, are split into joined (`select_related`) and
+        IN-query (`prefetch_related`) loads, so nested fields are filled in a fixed
+        number of queries. With `projection` enabled and an output schema made of
+        columns only, the columns are selected directly instead (`fields`). The
+        result is computed once per method.
+
+        Args:
+            method (str, optional): The method name.
+
+        Returns:
+            dict: The `select_related`, `prefetch_related` and `fields` keyword
+            arguments for the ORM read methods.
+        """
+        if method not in self._read_options:
+            meta = get_model_metadata(self.model)
+            schema = self._get_schema_out_class(method)
+            paths = self.prefetch
+            if paths is None:
+                paths = meta.schema_relations(schema) if schema else []
+            fields = None
+            if self.projection and schema and not paths:
+                columns = meta.schema_columns(schema)
+                if len(columns) == len(schema.model_fields):
+                    fields = columns
+            select_related, prefetch_related = split_related(self.model, paths)
+            self._read_options[method] = {
+                "select_related": select_related,
+                "prefetch_related": prefetch_related,
+                "fields": fields,
+            }
+        return self._read_options[method]
+
+    def _serialize(self, method: str, data: Any) -> Any:
+        """
+        Validates the result of a built-in operation against the method's output
+        annotation (`_get_schema_out`), reading model instances and row mappings
+        through their attributes.
+
+        With `fast_serialization`, the validated value is dumped straight to JSON
+        bytes by the cached type adapter of the annotation and returned as a
+        `Response`, which FastAPI sends as is.
+
+        Args:
+            method (str): The method name.
+            data (Any): The model instances or row mappings, shaped like the
+                annotation (e.g. a list for "list", a dict for a paginated page).
+
+        Returns:
+            Any: A JSON `Response`, or the validated schema instances.
+        """
+        adapter = get_type_adapter(self._get_schema_out(method))
+        value = adapter.validate_python(data, from_attributes=True)
+        if not self.fast_serialization:
+            return value
+        return Response(adapter.dump_json(value), media_type="application/json")
+
+    def _with_body(self, endpoint: Callable, annotation: Any) -> Callable:
+        """
+        Returns the endpoint with its "data" parameter annotated for this view.
+
+        The endpoint is wrapped in a function carrying its own signature, so views
+        sharing an operation class do not overwrite each other's annotations.
+
+        Args:
+            endpoint (Callable): The bound method.
+            annotation (Any): The annotation of the "data" parameter.
+
+        Returns:
+            Callable: The endpoint to register, unchanged if it has no "data" parameter.
+        """
+        signature = inspect.signature(endpoint)
+        if "data" not in signature.parameters:
+            return endpoint
+
+        if inspect.iscoroutinefunction(endpoint):
+
+            @functools.wraps(endpoint)
+            async def wrapper(*args: Any, **kwargs: Any):
+                return await endpoint(*args, **kwargs)
+
+        else:
+
+            @functools.wraps(endpoint)
+            def wrapper(*args: Any, **kwargs: Any):
+                return endpoint(*args, **kwargs)
+
+        wrapper.__signature__ = signature.replace(
+            parameters=[
+                param.replace(annotation=annotation) if param.name == "data" else param
+                for param in signature.parameters.values()
+            ]
+        )
+        return wrapper
+
     def register_method_wrapper(self, method_name: str, set_annotations=False):
         """
         Registers a method from the current class to the `wrapper` attribute.
 
         This function checks if the specified method name exists in the `all_methods`
         attribute. If it does, it retrieves the method from the current class and
-        assigns it to the `wrapper` attribute under the same name. Optionally, it can
-        also set type annotations for the method's "data" parameter.
+        assigns it to the `wrapper` attribute under the same name, served from the
+        response cache when `cache` covers it, coalesced with identical requests
+        in flight when `coalesce` covers it, and instrumented with route metrics
+        when `metrics` is enabled. Optionally, it can also set type
+        annotations for the method's "data" parameter. With `raw_body`, the "data"
+        parameter is filled by a dependency validating the raw request bytes.
 
         Args:
             method_name (str): The name of the method to register.
             set_annotations (bool, optional): If True, sets the "data" annotation
-                for the method using the schema returned by `_get_schema_in_class`.
+                for the method using the schema returned by `_get_schema_in`.
                 Defaults to False.
 
         Raises:
@@ -228,9 +432,19 @@ class BaseAPI:
                 f"Method '{method_name}' not found in {self.__class__.__name__}"
             )
 
-        setattr(self.wrapper, method_name, attr)
         if set_annotations:
-            attr.__annotations__["data"] = self._get_schema_in_class(method_name)
+            annotation = self._get_schema_in(method_name)
+            if self.raw_body:
+                self._raw_bodies[method_name] = annotation
+                annotation = Annotated[Any, Depends(json_body_dependency(annotation))]
+            attr = self._with_body(attr, annotation)
+        if self.cache and method_name in self.cache.methods:
+            attr = cache_route(self, method_name, attr)
+        if method_name in self._coalesced_methods:
+            attr = coalesce_route(self, method_name, attr)
+        if self.metrics:
+            attr = instrument_route(self, method_name, attr)
+        setattr(self.wrapper, method_name, attr)
 
     def _register_route(self, method_name: str, method_type: str, path: str):
         """
@@ -251,6 +465,8 @@ class BaseAPI:
             - The method in the wrapper corresponding to method_name will be used as the handler for the route.
             - The response model and dependencies for the route are dynamically determined
               using `_get_schema_out` and `_get_dependencies` methods, respectively.
+            - Bodies validated from raw bytes (`raw_body`) are documented through
+              `openapi_extra`.
         """
         if method_name not in self.all_methods:
             return
@@ -258,12 +474,16 @@ class BaseAPI:
         if not hasattr(self.wrapper, method_name):
             raise KeyError(f"Method '{method_name}' not found in wrapper.")
 
+        openapi_extra = None
+        if method_name in self._raw_bodies:
+            openapi_extra = json_body_openapi(self._raw_bodies[method_name])
         route_method = getattr(self.router, method_type)
         route_method(
             path,
             response_model=self._get_schema_out(method=method_name),
             dependencies=self._get_dependencies(method_name),
             name=method_name,
+            openapi_extra=openapi_extra,
         )(getattr(self.wrapper, method_name))
 
     def _load_method(
@@ -320,6 +540,13 @@ class BaseAPI:
             + self.delete_methods
         )
 
+    @cached_property
+    def _coalesced_methods(self) -> List[str]:
+        """The methods whose identical requests in flight share one execution."""
+        if self.coalesce is True:
+            return ["get", "list"]
+        return list(self.coalesce or [])
+
 
 class RegisterCreate(BaseAPI):
     """
@@ -643,18 +870,114 @@ class RegisterList(BaseAPI):
 
         _load_list_methods():
             Iterates through the `list_methods` attribute and loads additional list-related API methods.
+
+        _get_filters(request: Request) -> dict:
+            Returns the filters sent by the client, as ORM filter keywords.
+
+        _get_ordering(request: Request) -> List[str]:
+            Returns the ordering sent by the client, as ORM `order_by` entries.
+
+    Attributes:
+        pagination_class (Optional[Type[BasePagination]]): Pagination strategy for the "list"
+            endpoint. When None, the endpoint returns every record as a plain list.
+        page_size (int): Default number of records per page.
+        max_page_size (int): Upper bound accepted for the `page_size` query parameter.
+        ordering (Optional[str]): Column used to order paginated records, prefixed with
+            "-" for descending order. Defaults to the primary key.
+        streaming (bool): Whether the "list" endpoint streams every record through a
+            server-side cursor instead of building the response in memory. Takes
+            precedence over pagination.
+        stream_format (str): Streaming body format, "ndjson" or "json" (chunked array).
+        stream_chunk_size (int): Number of records fetched and written per chunk.
+        filter_fields (Dict[str, List[str]] | List[str]): Columns clients may filter
+            the list endpoints on, with their lookups ("eq", "ne", "in", "gt", "gte",
+            "lt", "lte", "isnull", "startswith", "contains"), exposed as typed query
+            parameters such as `created_at__gte`. A plain list allows "eq" only.
+        ordering_fields (List[str]): Columns clients may order the list endpoints by
+            with the `ordering` query parameter. Paginated lists accept one column.
     """
 
+    pagination_class: Optional[Type[BasePagination]] = None
+    page_size: int = 100
+    max_page_size: int = 1000
+    ordering: Optional[str] = None
+
+    streaming: bool = False
+    stream_format: str = "ndjson"
+    stream_chunk_size: int = 1000
+
+    filter_fields: Dict[str, List[str]] | List[str] = {}
+    ordering_fields: List[str] = []
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the instance and perform any necessary setup.
 
-        This constructor calls the parent class's initializer and then
-        invokes a method to load list functionality.
+        This constructor calls the parent class's initializer, sets up the
+        paginator when a `pagination_class` is configured and the list filter when
+        `filter_fields` or `ordering_fields` are declared (checking them against
+        the model), and then invokes a method to load list functionality.
         """
         super().__init__(*args, **kwargs)
+        self.paginator = (
+            self.pagination_class(
+                page_size=self.page_size,
+                max_page_size=self.max_page_size,
+                ordering=self.ordering,
+            )
+            if self.pagination_class and not self.streaming
+            else None
+        )
+        self.list_filter = (
+            ListFilter(
+                self.model,
+                self.filter_fields,
+                self.ordering_fields,
+                single_ordering=self.paginator is not None,
+            )
+            if self.filter_fields or self.ordering_fields
+            else None
+        )
         self._load_list()
 
+    def _get_schema_out(
+        self, method: str = None
+    ) -> Type[BaseModel] | Type[List[BaseModel]] | None:
+        """
+        Determines the output schema for a given method, wrapping the "list"
+        schema into a paginated response schema when pagination is enabled.
+        """
+        if method == "list" and self.paginator:
+            return self.paginator.response_schema(self._get_schema_out_class(method))
+        return super()._get_schema_out(method)
+
+    def _get_dependencies(self, method: str = None) -> List[Depends]:
+        """
+        Get dependencies for a specific method, adding the pagination query
+        parameters to the "list" endpoint when pagination is enabled, and the
+        filter and ordering query parameters to the list endpoints when declared.
+        """
+        dependencies = super()._get_dependencies(method)
+        if method == "list" and self.paginator:
+            dependencies = dependencies + [Depends(self.paginator.query_params())]
+        if (method == "list" or method in self.list_methods) and self.list_filter:
+            dependencies = dependencies + [Depends(self.list_filter.query_params())]
+        return dependencies
+
+    def _get_filters(self, request: Request) -> dict:
+        """
+        Returns the filters sent by the client to a list endpoint, e.g.
+        `{"user_id__in": [1, 2]}`, to be passed to the ORM read methods.
+        """
+        return self.list_filter.get_filters(request) if self.list_filter else {}
+
+    def _get_ordering(self, request: Request) -> List[str]:
+        """
+        Returns the ordering sent by the client to a list endpoint, e.g.
+        `["-created_at"]`, to be passed as `order_by` to the ORM read methods.
+        """
+        return self.list_filter.get_ordering(request) if self.list_filter else []
+
     def _load_list(self):
         """
         Loads the list-related API endpoints for the current view.
@@ -682,3 +1005,145 @@ class RegisterList(BaseAPI):
         """
         for method in self.list_methods:
             self._load_method("get", method, f"/{method}")
+
+
+class RegisterBulkCreate(BaseAPI):
+    """
+    A class that extends the BaseAPI to register an endpoint creating many resources
+    in one request.
+
+    The "bulk_create" method is exposed as `POST /bulk/` and receives a list of
+    `schema_in` payloads (or `schemas_in["bulk_create"]`).
+
+    Methods:
+        __init__(*args, **kwargs):
+            Initializes the RegisterBulkCreate instance and loads the bulk create endpoint.
+
+        _load_bulk_create():
+            Loads the "bulk_create" POST method.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the instance and perform necessary setup.
+
+        This constructor calls the parent class's initializer and then
+        invokes the `_load_bulk_create` method.
+        """
+        super().__init__(*args, **kwargs)
+        self._load_bulk_create()
+
+    def _get_schema_in(self, method: str = None) -> Any:
+        """Wraps the input schema of "bulk_create" into a list."""
+        if method == "bulk_create":
+            return List[self._get_schema_in_class(method)]
+        return super()._get_schema_in(method)
+
+    def _get_schema_out(
+        self, method: str = None
+    ) -> Type[BaseModel] | Type[List[BaseModel]] | None:
+        """Returns a list of output schemas for "bulk_create"."""
+        if method == "bulk_create":
+            return List[self._get_schema_out_class(method)]
+        return super()._get_schema_out(method)
+
+    def _load_bulk_create(self):
+        """Initializes and loads the "bulk_create" API endpoint at "/bulk/"."""
+        self._load_method("post", "bulk_create", "/bulk/", set_annotations=True)
+
+
+class RegisterBulkUpdate(BaseAPI):
+    """
+    A class that extends the BaseAPI to register an endpoint updating many resources
+    in one request.
+
+    The "bulk_update" method is exposed as `PUT /bulk/` and receives a list of
+    `{"pk": ..., "data": {...}}` items, where `data` follows `schema_in` (or
+    `schemas_in["bulk_update"]`). Missing records are returned as null.
+
+    Methods:
+        __init__(*args, **kwargs):
+            Initializes the RegisterBulkUpdate instance and loads the bulk update endpoint.
+
+        _load_bulk_update():
+            Loads the "bulk_update" PUT method.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the instance and perform necessary setup.
+
+        This constructor calls the parent class's initializer and then
+        invokes the `_load_bulk_update` method.
+        """
+        super().__init__(*args, **kwargs)
+        self._load_bulk_update()
+
+    def _get_schema_in(self, method: str = None) -> Any:
+        """Builds the list of `{"pk", "data"}` items received by "bulk_update"."""
+        if method == "bulk_update":
+            schema = self._get_schema_in_class(method)
+            item = create_model(
+                f"{schema.__name__}BulkUpdate",
+                pk=(get_model_metadata(self.model).pk_type, ...),
+                data=(schema, ...),
+            )
+            return List[item]
+        return super()._get_schema_in(method)
+
+    def _get_schema_out(
+        self, method: str = None
+    ) -> Type[BaseModel] | Type[List[BaseModel]] | None:
+        """Returns a list of optional output schemas for "bulk_update"."""
+        if method == "bulk_update":
+            return List[Optional[self._get_schema_out_class(method)]]
+        return super()._get_schema_out(method)
+
+    def _load_bulk_update(self):
+        """Initializes and loads the "bulk_update" API endpoint at "/bulk/"."""
+        self._load_method("put", "bulk_update", "/bulk/", set_annotations=True)
+
+
+class RegisterBulkDelete(BaseAPI):
+    """
+    A class that extends the BaseAPI to register an endpoint deleting many resources
+    in one request.
+
+    The "bulk_delete" method is exposed as `DELETE /bulk/` and receives the list of
+    primary keys to delete as its body.
+
+    Methods:
+        __init__(*args, **kwargs):
+            Initializes the RegisterBulkDelete instance and loads the bulk delete endpoint.
+
+        _load_bulk_delete():
+            Loads the "bulk_delete" DELETE method.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the instance and perform necessary setup.
+
+        This constructor calls the parent class's initializer and then
+        invokes the `_load_bulk_delete` method.
+        """
+        super().__init__(*args, **kwargs)
+        self._load_bulk_delete()
+
+    def _get_schema_in(self, method: str = None) -> Any:
+        """Returns the list of primary keys received by "bulk_delete"."""
+        if method == "bulk_delete":
+            return Annotated[List[get_model_metadata(self.model).pk_type], Body()]
+        return super()._get_schema_in(method)
+
+    def _get_schema_out(
+        self, method: str = None
+    ) -> Type[BaseModel] | Type[List[BaseModel]] | None:
+        """The "bulk_delete" endpoint has no output schema, like "delete"."""
+        if method == "bulk_delete":
+            return None
+        return super()._get_schema_out(method)
+
+    def _load_bulk_delete(self):
+        """Initializes and loads the "bulk_delete" API endpoint at "/bulk/"."""
+        self._load_method("delete", "bulk_delete", "/bulk/", set_annotations=True)
@@ -0,0 +1,545 @@
+"""
+This module provides the HTTP response cache of the read endpoints.
+
+A view enables it with a `CacheConfig`:
+
+    class PostView(RetrieveOperation, ListOperation):
+        model = Post
+        cache = CacheConfig(ttl=60, vary_on=["page_size", "cursor", "header:Authorization"])
+
+The JSON bodies of the "get" and "list" endpoints are then stored in a backend
+and served from it until they expire. The key of an entry is made of the view,
+the method, the path (so the primary key) and the `vary_on` query parameters and
+`header:` headers; without `vary_on`, every query parameter is part of the key.
+Responses that depend on the client (authentication, language, ...) must vary on
+the corresponding headers.
+
+Entries never outlive a write: the key also holds a generation counter per
+model, bumped by the create, update and delete operations (bulk ones included)
+of any view of the model once their transaction commits (at the end of the
+request with `ATOMIC_REQUESTS`). A read that started before the bump stores its
+response under the old generation, which is never read again; a read after the
+bump sees the committed data. Writes made outside the operations, e.g. directly
+through the ORM, are not seen and only expire with the TTL; call
+`invalidate_model` after they commit (see `ORM.on_commit`).
+
+Two backends are provided: `MemoryBackend`, an in-process LRU (the default),
+and `RedisBackend`, which speaks the Redis protocol (RESP) to a Redis-compatible
+server shared by every worker. The default backend is configured from the
+`RESPONSE_CACHE` dict of the project settings, e.g.:
+
+    RESPONSE_CACHE = {
+        "backend": "redis",
+        "url": "redis://localhost:6379/0",
+    }
+
+Backend failures are logged on the "FastAPIBig.cache" logger and the request is
+served without the cache.
+"""
+
+import abc
+import asyncio
+import collections
+import functools
+import hashlib
+import inspect
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import unquote, urlsplit
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger("FastAPIBig.cache")
+
+
+class CacheBackend(abc.ABC):
+    """
+    CacheBackend defines the storage interface of the response cache. Subclasses
+    implement `get`, `set`, `generations` and `bump`.
+
+    Methods:
+        get(key: str) -> Optional[bytes]:
+            Returns a stored body, or None if it is missing or expired.
+
+        set(key: str, value: bytes, ttl: float):
+            Stores a body for `ttl` seconds.
+
+        generations(names: Sequence[str]) -> List[int]:
+            Returns the generation counters of models.
+
+        bump(name: str):
+            Increments the generation counter of a model.
+
+        close():
+            Releases the resources of the backend.
+    """
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Returns a stored body, or None if it is missing or expired."""
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float):
+        """Stores a body for `ttl` seconds."""
+
+    @abc.abstractmethod
+    async def generations(self, names: Sequence[str]) -> List[int]:
+        """Returns the generation counters of models, 0 for those never bumped."""
+
+    @abc.abstractmethod
+    async def bump(self, name: str):
+        """Increments the generation counter of a model."""
+
+    async def close(self):
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """
+    MemoryBackend keeps the responses in a bounded, in-process LRU.
+
+    Each worker process has its own entries and generations, so a write only
+    invalidates the entries of the worker that served it; use `RedisBackend`
+    with several workers.
+
+    Attributes:
+        maxsize (int): The maximum number of responses kept.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "collections.OrderedDict[str, Tuple[float, bytes]]" = (
+            collections.OrderedDict()
+        )
+        self._generations: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def generations(self, names: Sequence[str]) -> List[int]:
+        return [self._generations.get(name, 0) for name in names]
+
+    async def bump(self, name: str):
+        self._generations[name] = self._generations.get(name, 0) + 1
+
+
+class RedisError(Exception):
+    """An error reply of the Redis server, or a malformed reply."""
+
+
+class RedisBackend(CacheBackend):
+    """
+    RedisBackend stores the responses in a Redis-compatible server, shared by
+    every worker, through a small pool of RESP connections.
+
+    Attributes:
+        url (str): The server URL, `redis://[[user]:password@]host[:port][/db]`.
+        prefix (str): The prefix of every key written by the cache.
+        max_connections (int): The maximum number of open connections.
+        timeout (float): Seconds a command may take before it fails.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "fastapibig:cache:",
+        max_connections: int = 10,
+        timeout: float = 1.0,
+    ):
+        parts = urlsplit(url)
+        if parts.scheme != "redis":
+            raise ValueError(f"Unsupported cache URL '{url}', expected redis://.")
+        self.url = url
+        self.prefix = prefix
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port or 6379
+        self._username = unquote(parts.username) if parts.username else None
+        self._password = unquote(parts.password) if parts.password else None
+        self._db = int(parts.path.strip("/") or 0)
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.execute("GET", self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        await self.execute("SET", self.prefix + key, value, "PX", max(int(ttl * 1000), 1))
+
+    async def generations(self, names: Sequence[str]) -> List[int]:
+        values = await self.execute("MGET", *(f"{self.prefix}gen:{name}" for name in names))
+        return [int(value) if value is not None else 0 for value in values]
+
+    async def bump(self, name: str):
+        await self.execute("INCR", f"{self.prefix}gen:{name}")
+
+    async def execute(self, *args: Any) -> Any:
+        """
+        Sends a command and returns its reply.
+
+        Args:
+            *args: The command and its arguments, e.g. `"GET", "key"`.
+
+        Returns:
+            Any: The decoded reply (str, int, bytes, list or None).
+
+        Raises:
+            RedisError: If the server replies with an error.
+            OSError, asyncio.TimeoutError: If the server cannot be reached in time.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        async with self._slots:
+            reader, writer = self._idle.pop() if self._idle else await self._connect()
+            try:
+                reply = await asyncio.wait_for(
+                    self._command(reader, writer, args), self.timeout
+                )
+            except BaseException:
+                # The connection may hold a partial reply: never reuse it.
+                writer.close()
+                raise
+            self._idle.append((reader, writer))
+            return reply
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Opens a connection, authenticated and on the configured database."""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port), self.timeout
+        )
+        try:
+            if self._password:
+                auth = [self._username, self._password] if self._username else [self._password]
+                await asyncio.wait_for(
+                    self._command(reader, writer, ("AUTH", *auth)), self.timeout
+                )
+            if self._db:
+                await asyncio.wait_for(
+                    self._command(reader, writer, ("SELECT", self._db)), self.timeout
+                )
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer
+
+    async def _command(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, args: tuple
+    ) -> Any:
+        """Writes a command as a RESP array of bulk strings and reads its reply."""
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        writer.write(b"".join(parts))
+        await writer.drain()
+        return await self._read_reply(reader)
+
+    async def _read_reply(self, reader: asyncio.StreamReader) -> Any:
+        """Reads one RESP reply."""
+        line = await reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by the cache server.")
+        kind, data = line[:1], line[1:-2]
+        if kind == b"+":
+            return data.decode()
+        if kind == b"-":
+            raise RedisError(data.decode())
+        if kind == b":":
+            return int(data)
+        if kind == b"$":
+            length = int(data)
+            if length < 0:
+                return None
+            return (await reader.readexactly(length + 2))[:-2]
+        if kind == b"*":
+            length = int(data)
+            if length < 0:
+                return None
+            return [await self._read_reply(reader) for _ in range(length)]
+        raise RedisError(f"Unexpected reply from the cache server: {line!r}")
+
+    async def close(self):
+        """Closes the idle connections."""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+BACKENDS = {"memory": MemoryBackend, "redis": RedisBackend}
+
+_default_backend: CacheBackend = MemoryBackend()
+
+# Views caching responses of each model, by model: the models whose writes
+# must invalidate an entry, and the backends holding entries.
+_backends: Dict[str, List[CacheBackend]] = {}
+
+
+def configure_backend(backend: str = "memory", **options: Any) -> CacheBackend:
+    """
+    Replaces the default backend of the views whose `CacheConfig` has none.
+
+    Args:
+        backend (str, optional): "memory" (default) or "redis".
+        **options: The arguments of the backend class, e.g. `maxsize` or `url`.
+
+    Returns:
+        CacheBackend: The new default backend.
+
+    Raises:
+        ValueError: If the backend is not supported.
+    """
+    global _default_backend
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unsupported cache backend '{backend}', expected one of {list(BACKENDS)}."
+        )
+    _default_backend = BACKENDS[backend](**options)
+    return _default_backend
+
+
+def get_default_backend() -> CacheBackend:
+    """Returns the default backend of the response cache."""
+    return _default_backend
+
+
+class CacheStats:
+    """
+    CacheStats counts the outcomes of the response cache.
+
+    Attributes:
+        hits (int): Responses served from the cache.
+        misses (int): Responses computed by the endpoint.
+        stores (int): Responses stored.
+        invalidations (int): Model generations bumped by writes.
+        errors (int): Backend calls that failed.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
+
+
+stats = CacheStats()
+
+
+def model_name(model: type) -> str:
+    """Returns the name of a model in the cache keys: its table name."""
+    return getattr(model, "__tablename__", None) or model.__name__
+
+
+class CacheConfig:
+    """
+    CacheConfig declares the response cache of a view.
+
+    Attributes:
+        ttl (float): Seconds a response is served from the cache.
+        vary_on (Optional[List[str]]): The query parameters, and headers written
+            "header:<name>", that select a response besides the path. None (default)
+            varies on every query parameter and no header.
+        methods (Tuple[str, ...]): The cached methods. Defaults to "get" and "list";
+            custom GET methods taking a `request` can be added.
+        backend (Optional[CacheBackend]): Where responses are stored. Defaults to the
+            backend configured by `RESPONSE_CACHE`.
+        invalidated_by (Tuple[type, ...]): Other models whose writes invalidate the
+            cached responses, e.g. those of nested relationships.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        vary_on: Optional[Iterable[str]] = None,
+        methods: Iterable[str] = ("get", "list"),
+        backend: Optional[CacheBackend] = None,
+        invalidated_by: Iterable[type] = (),
+    ):
+        if ttl <= 0:
+            raise ValueError("The response cache needs a positive ttl.")
+        self.ttl = ttl
+        self.vary_on = list(vary_on) if vary_on is not None else None
+        self.methods = tuple(methods)
+        self.backend = backend
+        self.invalidated_by = tuple(invalidated_by)
+        self._params, self._headers = split_vary_on(self.vary_on)
+
+    def get_backend(self) -> CacheBackend:
+        """Returns the backend of the config, or the default one."""
+        return self.backend or _default_backend
+
+    def variant(self, request: Request) -> str:
+        """Returns the part of the key selected by the query parameters and headers."""
+        return request_variant(request, self._params, self._headers)
+
+
+def split_vary_on(
+    vary_on: Optional[Iterable[str]],
+) -> Tuple[Optional[List[str]], List[str]]:
+    """
+    Splits a `vary_on` list into query parameter names and lowercased header names.
+
+    Args:
+        vary_on (Optional[Iterable[str]]): Query parameters, and headers written
+            "header:<name>". None varies on every query parameter.
+
+    Returns:
+        Tuple[Optional[List[str]], List[str]]: The query parameters (None for all
+        of them) and the headers.
+    """
+    if vary_on is None:
+        return None, []
+    vary_on = list(vary_on)
+    params = [name for name in vary_on if not name.startswith("header:")]
+    headers = [
+        name[len("header:") :].lower() for name in vary_on if name.startswith("header:")
+    ]
+    return params, headers
+
+
+def request_variant(
+    request: Request, params: Optional[List[str]], headers: List[str]
+) -> str:
+    """
+    Returns the part of a request that selects its response: the path, the given
+    query parameters (every one when None) and headers.
+    """
+    if params is None:
+        values = sorted(request.query_params.multi_items())
+    else:
+        values = [
+            (name, value) for name in params for value in request.query_params.getlist(name)
+        ]
+    header_values = [(name, request.headers.get(name, "")) for name in headers]
+    return repr((request.url.path, values, header_values))
+
+
+def cache_route(view: Any, method_name: str, endpoint: Callable) -> Callable:
+    """
+    Wraps a read endpoint of a view with the response cache of its `CacheConfig`.
+
+    Only 200 JSON responses without cookies are stored, e.g. those of the
+    built-in operations with `fast_serialization`. Served entries carry an
+    `X-Cache: HIT` header, stored ones `X-Cache: MISS`.
+
+    Args:
+        view (BaseAPI): The view instance.
+        method_name (str): The method name, e.g. "list".
+        endpoint (Callable): The endpoint registered on the route.
+
+    Returns:
+        Callable: The caching endpoint, with the same signature.
+
+    Raises:
+        TypeError: If the endpoint does not take a `request` parameter.
+    """
+    if "request" not in inspect.signature(endpoint).parameters:
+        raise TypeError(
+            f"Cached method '{method_name}' of {type(view).__name__} "
+            f"must take a 'request' parameter."
+        )
+    config: CacheConfig = view.cache
+    names = [model_name(model) for model in (view.model, *config.invalidated_by)]
+    for name in names:
+        backends = _backends.setdefault(name, [])
+        if config.backend not in backends:
+            backends.append(config.backend)
+    namespace = f"{type(view).__module__}.{type(view).__qualname__}.{method_name}"
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any):
+        request: Request = kwargs["request"]
+        backend = config.get_backend()
+        try:
+            # Generations are read first: a write landing during the endpoint
+            # bumps them, so the response stored below is never served.
+            generations = await backend.generations(names)
+            key = hashlib.sha256(
+                f"{namespace}|{generations}|{config.variant(request)}".encode()
+            ).hexdigest()
+            body = await backend.get(key)
+        except Exception:
+            stats.errors += 1
+            logger.warning("Response cache unavailable for %s.", namespace, exc_info=True)
+            return await endpoint(*args, **kwargs)
+
+        if body is not None:
+            stats.hits += 1
+            return Response(body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+        stats.misses += 1
+        response = await endpoint(*args, **kwargs)
+        if _cacheable(response):
+            try:
+                await backend.set(key, response.body, config.ttl)
+                stats.stores += 1
+                response.headers["X-Cache"] = "MISS"
+            except Exception:
+                stats.errors += 1
+                logger.warning("Response of %s not cached.", namespace, exc_info=True)
+        return response
+
+    return wrapper
+
+
+def _cacheable(response: Any) -> bool:
+    """Tells whether a response can be stored: a 200 JSON body without cookies."""
+    return (
+        isinstance(response, Response)
+        and not isinstance(response, StreamingResponse)
+        and response.status_code == 200
+        and response.media_type == "application/json"
+        and "set-cookie" not in response.headers
+    )
+
+
+async def invalidate_model(model: type):
+    """
+    Invalidates the cached responses depending on a model, in every backend
+    holding some. Called by the write operations once their transaction commits.
+
+    Args:
+        model (type): The mapped class that was written.
+    """
+    name = model_name(model)
+    for backend in _backends.get(name, ()):
+        backend = backend or _default_backend
+        try:
+            await backend.bump(name)
+            stats.invalidations += 1
+        except Exception:
+            stats.errors += 1
+            logger.warning(
+                "Cached responses of %s not invalidated; they expire with their ttl.",
+                name,
+                exc_info=True,
+            )
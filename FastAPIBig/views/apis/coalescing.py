@@ -0,0 +1,189 @@
+"""
+This module coalesces concurrent identical reads ("single flight").
+
+When a hot record changes, or its cached response expires, many requests for it
+arrive at once and would all run the same query. A view enabling `coalesce`
+runs its read methods once per group of identical requests in flight: the first
+request executes the method, and the requests arriving before it completes wait
+for it and share its result (or its exception) instead of running their own.
+
+    class PostView(RetrieveOperation, ListOperation):
+        model = Post
+        coalesce = True  # or a list of methods, e.g. ["get"]
+        coalesce_vary_on = ["page_size", "cursor", "header:Authorization"]
+
+Requests are identical when they target the same view, method and path (so the
+same primary key) with the same `coalesce_vary_on` query parameters and
+`header:` headers; without `coalesce_vary_on`, every query parameter counts.
+Responses that depend on the client (authentication, language, ...) must vary on
+the corresponding headers, or clients would receive each other's responses.
+Requests whose reads cannot be shared with other requests (see
+`DataBaseSessionManager.shares_reads`), e.g. from a client pinned to the primary
+by `read_your_writes`, never join a group: they run the method themselves, so
+they read their own writes instead of a result read from a lagging replica.
+
+Only requests in flight at the same time are grouped, in each worker process:
+nothing is kept once the method returns. Shared responses are copied for each
+request, without the background tasks of the original; streamed responses
+cannot be shared, so the waiting requests run the method themselves. If the
+executing request is cancelled, e.g. its client disconnected, one of the
+waiting requests executes the method instead.
+
+Every coalescable request is counted in the route metrics as "executed" or
+"shared" (`fastapibig_route_coalesced_total`); the coalescing ratio of each
+route is exposed at `COALESCING_STATS_PATH`, if set.
+"""
+
+import asyncio
+import copy
+import functools
+import inspect
+from typing import Any, Callable, Dict, Hashable, List
+
+from fastapi import Request, Response
+
+from FastAPIBig.views.apis.caching import request_variant, split_vary_on
+from FastAPIBig.views.apis.metrics import registry
+
+
+class SingleFlight:
+    """
+    SingleFlight runs one call per key at a time, sharing its outcome with the
+    callers arriving while it runs.
+
+    Methods:
+        do(key: Hashable, func: Callable[[], Awaitable]) -> Tuple[Any, bool]:
+            Runs `func`, or waits for the identical call in flight.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable) -> tuple:
+        """
+        Runs `func` unless a call with the same key is in flight, in which case
+        waits for that call and returns its result (or raises its exception).
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            func (Callable[[], Awaitable]): The call to run.
+
+        Returns:
+            tuple: The result, and whether it was shared from another call.
+        """
+        # Futures belong to a loop: calls from different loops never meet.
+        key = (asyncio.get_running_loop(), key)
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            # Unlike awaiting the future, `wait` only raises if this caller is
+            # cancelled, not if the executing one is.
+            await asyncio.wait((future,))
+            if not future.cancelled():
+                return future.result(), True
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieved here, so no warning is logged when nobody was waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+
+def coalesce_route(view: Any, method_name: str, endpoint: Callable) -> Callable:
+    """
+    Wraps a read endpoint of a view so that identical requests in flight share
+    one execution.
+
+    Args:
+        view (BaseAPI): The view instance.
+        method_name (str): The method name, e.g. "get".
+        endpoint (Callable): The endpoint registered on the route.
+
+    Returns:
+        Callable: The coalescing endpoint, with the same signature.
+
+    Raises:
+        TypeError: If the endpoint does not take a `request` parameter.
+    """
+    if "request" not in inspect.signature(endpoint).parameters:
+        raise TypeError(
+            f"Coalesced method '{method_name}' of {type(view).__name__} "
+            f"must take a 'request' parameter."
+        )
+    params, headers = split_vary_on(view.coalesce_vary_on)
+    view_name = type(view).__name__
+    flight = SingleFlight()
+    registry.coalesced.setdefault((view_name, method_name, "executed"), 0)
+    registry.coalesced.setdefault((view_name, method_name, "shared"), 0)
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any):
+        request: Request = kwargs["request"]
+        executed = False
+        db_manager = view._model._get_db_manager(view._model.database)
+
+        async def execute():
+            nonlocal executed
+            executed = True
+            return await endpoint(*args, **kwargs)
+
+        try:
+            if not db_manager.shares_reads():
+                return await execute()
+            result, shared = await flight.do(
+                request_variant(request, params, headers), execute
+            )
+            if not shared:
+                return result
+            if isinstance(result, Response) and not hasattr(result, "body"):
+                # A streamed body can only be sent once.
+                return await execute()
+            return _share(result)
+        finally:
+            registry.coalesce(view_name, method_name, "executed" if executed else "shared")
+
+    return wrapper
+
+
+def _share(result: Any) -> Any:
+    """Returns a copy of a response for another request, without its background tasks."""
+    if not isinstance(result, Response):
+        return result
+    response = copy.copy(result)
+    response.raw_headers = list(result.raw_headers)
+    response.__dict__.pop("_headers", None)
+    response.background = None
+    return response
+
+
+def stats() -> List[Dict[str, Any]]:
+    """
+    Returns the coalescing counters of each route of this process.
+
+    Returns:
+        List[Dict[str, Any]]: view, method, executed and shared requests, and the
+        ratio of requests that shared a result.
+    """
+    routes: Dict[tuple, Dict[str, Any]] = {}
+    for (view, method, outcome), value in sorted(registry.coalesced.items()):
+        route = routes.setdefault(
+            (view, method), {"view": view, "method": method, "executed": 0, "shared": 0}
+        )
+        route[outcome] = value
+    for route in routes.values():
+        requests = route["executed"] + route["shared"]
+        route["ratio"] = route["shared"] / requests if requests else 0.0
+    return list(routes.values())
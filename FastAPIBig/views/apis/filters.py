@@ -0,0 +1,240 @@
+"""
+This module provides the declarative filtering and ordering of list views.
+
+A list view declares the columns clients may filter and order by:
+
+    class PostView(ListOperation):
+        model = Post
+        filter_fields = {
+            "title": ["eq", "startswith"],
+            "user_id": ["eq", "in"],
+            "created_at": ["gte", "lte"],
+            "deleted_at": ["isnull"],
+        }
+        ordering_fields = ["created_at", "title"]
+
+Each field and lookup becomes a typed query parameter (`title`,
+`title__startswith`, `user_id__in`, ...), validated by FastAPI and documented in
+the OpenAPI schema; `in` lookups take repeated parameters
+(`?user_id__in=1&user_id__in=2`). The `ordering` parameter takes a comma
+separated list of the `ordering_fields`, each prefixed with "-" for descending
+order (`?ordering=-created_at,title`). The values are compiled into the WHERE and
+ORDER BY clauses of the query by the ORM (see `ORM._filter_conditions`), so the
+filtering runs in the database.
+
+The declarations are checked against the model when the view is created, so a
+misspelled column or an unsupported lookup fails at startup.
+"""
+
+import inspect
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from fastapi import Query, Request
+from fastapi.exceptions import RequestValidationError
+
+from FastAPIBig.orm.base.lookups import LOOKUP_SEPARATOR, LOOKUPS
+from FastAPIBig.orm.base.metadata import get_model_metadata
+
+# How each lookup is described in the OpenAPI schema.
+LOOKUP_DESCRIPTIONS: Dict[str, str] = {
+    "eq": "equal to",
+    "ne": "not equal to",
+    "in": "one of (repeat the parameter)",
+    "gt": "greater than",
+    "gte": "greater than or equal to",
+    "lt": "less than",
+    "lte": "less than or equal to",
+    "isnull": "null (true) or not null (false)",
+    "startswith": "starting with",
+    "contains": "containing",
+}
+
+
+class ListFilter:
+    """
+    ListFilter turns the `filter_fields` and `ordering_fields` of a list view into
+    query parameters and ORM arguments.
+
+    Attributes:
+        model (type): The mapped class of the view.
+        filter_fields (Dict[str, List[str]]): The lookups allowed per column.
+        ordering_fields (List[str]): The columns clients may order by.
+        single_ordering (bool): Whether clients may order by one column only, e.g.
+            for keyset pagination.
+
+    Methods:
+        query_params() -> Callable:
+            Returns a FastAPI dependency parsing the filter and ordering query parameters.
+
+        get_filters(request: Request) -> Dict[str, Any]:
+            Returns the filters sent by the client, as ORM filter keywords.
+
+        get_ordering(request: Request) -> List[str]:
+            Returns the ordering sent by the client, as ORM `order_by` entries.
+    """
+
+    def __init__(
+        self,
+        model: type,
+        filter_fields: Union[Dict[str, Iterable[str]], Iterable[str], None] = None,
+        ordering_fields: Optional[Iterable[str]] = None,
+        single_ordering: bool = False,
+    ):
+        """
+        Validates the declarations against the model.
+
+        Args:
+            model (type): The mapped class of the view.
+            filter_fields (Union[Dict[str, Iterable[str]], Iterable[str]], optional):
+                The lookups allowed per column. A plain list of columns allows
+                equality only.
+            ordering_fields (Iterable[str], optional): The columns clients may order by.
+            single_ordering (bool, optional): Whether clients may order by one
+                column only. Defaults to False.
+
+        Raises:
+            AttributeError: If a field is not a column of the model.
+            ValueError: If a lookup is not supported.
+        """
+        if filter_fields is None:
+            filter_fields = {}
+        elif not isinstance(filter_fields, dict):
+            filter_fields = {name: ["eq"] for name in filter_fields}
+        self.model = model
+        self.filter_fields = {name: list(lookups) for name, lookups in filter_fields.items()}
+        self.ordering_fields = list(ordering_fields or [])
+        self.single_ordering = single_ordering
+
+        meta = get_model_metadata(model)
+        for name in [*self.filter_fields, *self.ordering_fields]:
+            if name not in meta.columns:
+                raise AttributeError(
+                    f"Model {model.__name__} does not have '{name}' column"
+                )
+        for name, lookups in self.filter_fields.items():
+            for lookup in lookups:
+                if lookup not in LOOKUPS:
+                    raise ValueError(
+                        f"Unsupported lookup '{lookup}' for field '{name}', "
+                        f"expected one of {list(LOOKUPS)}."
+                    )
+        self._params = self._build_params(meta)
+
+    def _build_params(self, meta) -> Dict[str, inspect.Parameter]:
+        """Builds the typed query parameters, keyed by ORM filter keyword."""
+        params = {}
+        for name, lookups in self.filter_fields.items():
+            try:
+                python_type = meta.columns[name].type.python_type
+            except NotImplementedError:
+                python_type = Any
+            for lookup in lookups:
+                if lookup == "in":
+                    annotation = List[python_type]
+                elif lookup == "isnull":
+                    annotation = bool
+                elif lookup in ("startswith", "contains"):
+                    annotation = str
+                else:
+                    annotation = python_type
+                key = name if lookup == "eq" else f"{name}{LOOKUP_SEPARATOR}{lookup}"
+                params[key] = inspect.Parameter(
+                    key,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=Query(
+                        None, description=f"Filter on {name}: {LOOKUP_DESCRIPTIONS[lookup]}."
+                    ),
+                    annotation=Optional[annotation],
+                )
+        if self.ordering_fields:
+            description = (
+                f"{'Column' if self.single_ordering else 'Comma separated columns'} to "
+                f"order by among {', '.join(self.ordering_fields)}, prefixed with '-' "
+                f"for descending order."
+            )
+            params["ordering"] = inspect.Parameter(
+                "ordering",
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Query(None, description=description),
+                annotation=Optional[str],
+            )
+        return params
+
+    def query_params(self) -> Callable:
+        """
+        Builds a dependency declaring the filter and ordering query parameters.
+
+        The dependency is registered on the list routes so the parameters are
+        validated by FastAPI and appear in the OpenAPI schema; the parsed values
+        are stored on the request state and read back with `get_filters` and
+        `get_ordering`.
+
+        Returns:
+            Callable: A FastAPI dependency.
+        """
+
+        def list_filter_params(request: Request, **values):
+            ordering = values.pop("ordering", None)
+            request.state.list_filters = {
+                key: value for key, value in values.items() if value is not None
+            }
+            request.state.list_ordering = self._parse_ordering(ordering)
+
+        list_filter_params.__signature__ = inspect.Signature(
+            [
+                inspect.Parameter(
+                    "request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request
+                ),
+                *self._params.values(),
+            ]
+        )
+        return list_filter_params
+
+    def _parse_ordering(self, ordering: Optional[str]) -> List[str]:
+        """Splits and checks the `ordering` query parameter."""
+        if not ordering:
+            return []
+        entries = [entry.strip() for entry in ordering.split(",") if entry.strip()]
+        invalid = [entry for entry in entries if entry.lstrip("-") not in self.ordering_fields]
+        if invalid or (self.single_ordering and len(entries) > 1):
+            expected = "one of" if self.single_ordering else "comma separated"
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "value_error",
+                        "loc": ("query", "ordering"),
+                        "msg": f"Value error, expected {expected} "
+                        f"{', '.join(self.ordering_fields)}, prefixed with '-' for "
+                        f"descending order",
+                        "input": ordering,
+                        "ctx": {"error": "invalid ordering"},
+                    }
+                ]
+            )
+        return entries
+
+    @staticmethod
+    def get_filters(request: Request) -> Dict[str, Any]:
+        """
+        Returns the filters sent by the client.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            Dict[str, Any]: ORM filter keywords, e.g. `{"user_id__in": [1, 2]}`.
+        """
+        return getattr(request.state, "list_filters", {})
+
+    @staticmethod
+    def get_ordering(request: Request) -> List[str]:
+        """
+        Returns the ordering sent by the client.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            List[str]: ORM `order_by` entries, e.g. `["-created_at", "title"]`.
+        """
+        return getattr(request.state, "list_ordering", [])
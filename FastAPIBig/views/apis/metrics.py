@@ -0,0 +1,430 @@
+"""
+This module records metrics for the routes registered by `BaseAPI` views.
+
+Every registered method is wrapped so that it records, labelled by view class
+and method name:
+
+- a latency histogram of the whole route (stage "total") and of each stage of
+  the operation pipeline: "validation", "pre", "operation", "post" (the
+  background hook) and "serialization" (building the response once the other
+  stages are done). Custom methods only report "total";
+- an in-flight gauge;
+- an error counter, labelled by the stage that raised and the exception type;
+- for views coalescing their reads (see `coalescing`), a counter of the
+  requests that executed their method and of those that shared the result of
+  an identical request in flight.
+
+Metrics are kept per process in plain dicts, without locks: they are only
+updated from the event loop (synchronous custom methods are run in the
+threadpool by the wrapper itself), so recording costs a few microseconds. To
+aggregate several uvicorn workers, point `METRICS_DIR` at a directory shared by
+the workers: each worker periodically writes its metrics there from a
+background task (the file is written in a thread, off the event loop), and the
+Prometheus endpoint (`METRICS_PATH`) served by any worker merges all of them.
+"""
+
+import asyncio
+import bisect
+import contextvars
+import functools
+import inspect
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+# Upper bounds (in seconds) of the latency histogram buckets.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Stage methods of the built-in operations, by stage name. "{}" is the method name.
+OPERATION_STAGES: Tuple[Tuple[str, str], ...] = (
+    ("validation", "{}_validation"),
+    ("pre", "pre_{}"),
+    ("operation", "_{}"),
+    ("post", "on_{}"),
+)
+
+
+class Histogram:
+    """
+    Histogram counts observations into cumulative-friendly buckets.
+
+    Attributes:
+        counts (List[int]): The observations per bucket, plus one for larger values.
+        sum (float): The sum of all observations.
+    """
+
+    __slots__ = ("counts", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """Records an observation, in seconds."""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.sum += value
+
+
+class MetricsRegistry:
+    """
+    MetricsRegistry holds the route metrics of the current process.
+
+    Attributes:
+        durations (Dict[tuple, Histogram]): Latency histograms keyed by (view, method, stage).
+        in_flight (Dict[tuple, int]): Requests being handled, keyed by (view, method).
+        errors (Dict[tuple, int]): Errors keyed by (view, method, stage, exception type).
+        coalesced (Dict[tuple, int]): Coalescable requests keyed by (view, method,
+            outcome), the outcome being "executed" or "shared".
+        directory (Optional[str]): Where workers share their metrics, if aggregated.
+        flush_interval (float): Seconds between two writes of this worker's metrics.
+
+    Methods:
+        configure(directory: str = None, flush_interval: float = 5.0):
+            Enables the aggregation of the metrics of several workers.
+
+        histogram(view: str, method: str, stage: str) -> Histogram:
+            Returns the latency histogram of a route stage.
+
+        error(view: str, method: str, stage: str, exc: BaseException):
+            Counts an error raised by a route stage.
+
+        coalesce(view: str, method: str, outcome: str):
+            Counts a request of a coalescing route.
+
+        snapshot() -> dict:
+            Returns the metrics of this process in a JSON-serializable form.
+
+        flush():
+            Writes this worker's snapshot to the shared directory.
+
+        start():
+            Starts writing this worker's snapshot every `flush_interval` seconds.
+
+        stop():
+            Stops the periodic writes, writing a last snapshot.
+
+        collect() -> List[dict]:
+            Returns the snapshots of every live worker.
+
+        render() -> str:
+            Renders the aggregated metrics in the Prometheus text format.
+    """
+
+    def __init__(self):
+        self.durations: Dict[tuple, Histogram] = {}
+        self.in_flight: Dict[tuple, int] = {}
+        self.errors: Dict[tuple, int] = {}
+        self.coalesced: Dict[tuple, int] = {}
+        self.directory: Optional[str] = None
+        self.flush_interval = 5.0
+        self._flusher: Optional[asyncio.Task] = None
+
+    def configure(self, directory: Optional[str] = None, flush_interval: float = 5.0):
+        """
+        Enables the aggregation of the metrics of several workers.
+
+        Args:
+            directory (str, optional): A directory shared by the workers.
+            flush_interval (float, optional): Seconds between two writes of this
+                worker's metrics. Defaults to 5.
+        """
+        self.directory = directory
+        self.flush_interval = flush_interval
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def histogram(self, view: str, method: str, stage: str) -> Histogram:
+        """Returns the latency histogram of a route stage, creating it if needed."""
+        key = (view, method, stage)
+        histogram = self.durations.get(key)
+        if histogram is None:
+            histogram = self.durations[key] = Histogram()
+        return histogram
+
+    def error(self, view: str, method: str, stage: str, exc: BaseException):
+        """Counts an error raised by a route stage."""
+        key = (view, method, stage, type(exc).__name__)
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    def coalesce(self, view: str, method: str, outcome: str):
+        """Counts a request of a coalescing route, "executed" or "shared"."""
+        key = (view, method, outcome)
+        self.coalesced[key] = self.coalesced.get(key, 0) + 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns the metrics of this process in a JSON-serializable form.
+
+        Returns:
+            dict: pid, durations, in_flight, errors and coalesced, as lists of label values
+            followed by the measurements.
+        """
+        return {
+            "pid": os.getpid(),
+            "durations": [
+                [*key, histogram.counts, histogram.sum]
+                for key, histogram in self.durations.items()
+            ],
+            "in_flight": [[*key, value] for key, value in self.in_flight.items()],
+            "errors": [[*key, value] for key, value in self.errors.items()],
+            "coalesced": [[*key, value] for key, value in self.coalesced.items()],
+        }
+
+    def flush(self):
+        """
+        Writes this worker's snapshot to the shared directory, if any, blocking
+        until the file is written.
+        """
+        if self.directory:
+            self._write(self.snapshot())
+
+    async def _flush_async(self):
+        """Writes this worker's snapshot from a thread, so the event loop never waits on the file."""
+        if self.directory:
+            # The snapshot is taken on the loop, which is the only writer of the metrics.
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write, self.snapshot()
+            )
+
+    async def _flush_periodically(self):
+        """Writes this worker's snapshot every `flush_interval` seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_async()
+
+    async def start(self):
+        """
+        Starts writing this worker's snapshot to the shared directory every
+        `flush_interval` seconds, e.g. when the application starts. Does nothing
+        without a directory.
+        """
+        if self.directory and self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self):
+        """Stops the periodic writes, e.g. when the application shuts down, and writes a last snapshot."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self._flush_async()
+
+    def _write(self, snapshot: dict):
+        """Atomically replaces this worker's file with a snapshot."""
+        path = os.path.join(self.directory, f"{os.getpid()}.json")
+        with open(f"{path}.tmp", "w") as file:
+            json.dump(snapshot, file)
+        os.replace(f"{path}.tmp", path)
+
+    def collect(self) -> List[dict]:
+        """
+        Returns the snapshots of this process and of the other workers.
+
+        Counters and histograms of workers that exited are kept, so totals never
+        go backwards; their in-flight gauges are dropped.
+
+        Returns:
+            List[dict]: One snapshot per worker.
+        """
+        snapshots = [self.snapshot()]
+        if not self.directory:
+            return snapshots
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json") or name == f"{os.getpid()}.json":
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as file:
+                    snapshot = json.load(file)
+            except (OSError, ValueError):
+                continue
+            if not _is_alive(snapshot["pid"]):
+                snapshot["in_flight"] = []
+            snapshots.append(snapshot)
+        return snapshots
+
+    def render(self) -> str:
+        """
+        Renders the metrics of every worker in the Prometheus text format.
+
+        Returns:
+            str: The exposition text.
+        """
+        durations: Dict[tuple, list] = {}
+        in_flight: Dict[tuple, int] = {}
+        errors: Dict[tuple, int] = {}
+        coalesced: Dict[tuple, int] = {}
+        for snapshot in self.collect():
+            for *key, counts, total in snapshot["durations"]:
+                merged = durations.setdefault(
+                    tuple(key), [[0] * len(counts), 0.0]
+                )
+                merged[0] = [a + b for a, b in zip(merged[0], counts)]
+                merged[1] += total
+            for target, rows in (
+                (in_flight, "in_flight"),
+                (errors, "errors"),
+                (coalesced, "coalesced"),
+            ):
+                for *key, value in snapshot.get(rows, ()):
+                    target[tuple(key)] = target.get(tuple(key), 0) + value
+
+        lines = [
+            "# HELP fastapibig_route_duration_seconds Latency of the API routes by stage.",
+            "# TYPE fastapibig_route_duration_seconds histogram",
+        ]
+        for (view, method, stage), (counts, total) in sorted(durations.items()):
+            labels = _labels(view=view, method=method, stage=stage)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    f'fastapibig_route_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}'
+                )
+            lines.append(f"fastapibig_route_duration_seconds_sum{{{labels}}} {total}")
+            lines.append(f"fastapibig_route_duration_seconds_count{{{labels}}} {cumulative}")
+        lines += [
+            "# HELP fastapibig_route_in_flight Requests being handled by the API routes.",
+            "# TYPE fastapibig_route_in_flight gauge",
+        ]
+        for (view, method), value in sorted(in_flight.items()):
+            lines.append(
+                f"fastapibig_route_in_flight{{{_labels(view=view, method=method)}}} {value}"
+            )
+        lines += [
+            "# HELP fastapibig_route_errors_total Errors raised by the API routes by stage.",
+            "# TYPE fastapibig_route_errors_total counter",
+        ]
+        for (view, method, stage, error), value in sorted(errors.items()):
+            labels = _labels(view=view, method=method, stage=stage, error=error)
+            lines.append(f"fastapibig_route_errors_total{{{labels}}} {value}")
+        if coalesced:
+            lines += [
+                "# HELP fastapibig_route_coalesced_total Requests of the coalescing routes, "
+                "executed or sharing the result of an identical request in flight.",
+                "# TYPE fastapibig_route_coalesced_total counter",
+            ]
+        for (view, method, outcome), value in sorted(coalesced.items()):
+            labels = _labels(view=view, method=method, outcome=outcome)
+            lines.append(f"fastapibig_route_coalesced_total{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# Progress of the route being handled: when its last in-request stage ended,
+# and whether an error was already counted by a stage.
+_route_clock: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar(
+    "fastapibig_route_clock", default=None
+)
+
+
+def _is_alive(pid: int) -> bool:
+    """Tells whether a worker process is still running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _labels(**labels: str) -> str:
+    """Formats Prometheus labels, escaping their values."""
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
+
+
+def _instrument_stage(view: str, method: str, stage: str, func: Callable) -> Callable:
+    """Wraps a stage method of an operation to time it."""
+    histogram = registry.histogram(view, method, stage)
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any):
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except BaseException as exc:
+            registry.error(view, method, stage, exc)
+            clock = _route_clock.get()
+            if clock is not None:
+                clock[1] = exc
+            raise
+        finally:
+            end = time.perf_counter()
+            histogram.observe(end - start)
+            clock = _route_clock.get()
+            if clock is not None and stage != "post":
+                clock[0] = end
+
+    return wrapper
+
+
+def instrument_route(view: Any, method: str, endpoint: Callable) -> Callable:
+    """
+    Wraps the endpoint of a view method, and the stage methods of the built-in
+    operations, to record their metrics.
+
+    Args:
+        view (BaseAPI): The view instance.
+        method (str): The method name, e.g. "create" or a custom method.
+        endpoint (Callable): The bound method registered as the route endpoint.
+
+    Returns:
+        Callable: The instrumented endpoint, with the signature of `endpoint`.
+    """
+    view_name = type(view).__name__
+    staged = method in view._allowed_methods
+    if staged:
+        for stage, pattern in OPERATION_STAGES:
+            name = pattern.format(method)
+            func = getattr(view, name, None)
+            if func is not None and inspect.iscoroutinefunction(func):
+                setattr(view, name, _instrument_stage(view_name, method, stage, func))
+
+    total = registry.histogram(view_name, method, "total")
+    serialization = registry.histogram(view_name, method, "serialization") if staged else None
+    key = (view_name, method)
+    registry.in_flight.setdefault(key, 0)
+    is_coroutine = inspect.iscoroutinefunction(endpoint)
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any):
+        clock = [None, None]
+        token = _route_clock.set(clock)
+        registry.in_flight[key] += 1
+        start = time.perf_counter()
+        try:
+            if is_coroutine:
+                response = await endpoint(*args, **kwargs)
+            else:
+                response = await run_in_threadpool(endpoint, *args, **kwargs)
+        except BaseException as exc:
+            if clock[1] is not exc:
+                stage = "serialization" if staged and clock[0] is not None else "total"
+                registry.error(view_name, method, stage, exc)
+            raise
+        else:
+            if staged and clock[0] is not None:
+                serialization.observe(time.perf_counter() - clock[0])
+            return response
+        finally:
+            registry.in_flight[key] -= 1
+            total.observe(time.perf_counter() - start)
+            _route_clock.reset(token)
+
+    return wrapper
@@ -0,0 +1,256 @@
+"""
+This module moves CPU-bound work of the views off the event loop.
+
+Synchronous functions, hooks and custom view methods decorated with `offload`
+become coroutine functions that run the original body in an executor, so the
+event loop keeps serving other requests meanwhile:
+
+    class PostView(CreateOperation):
+        @offload(process=True)
+        def on_create(self, request, instance):
+            make_thumbnail(instance.image_path)
+
+Threads suit work that releases the GIL (hashing, compression, most C
+extensions such as Pillow). `process=True` runs pure-Python work in a process
+pool instead. There, the function, the view and the arguments are pickled:
+
+- the view instance is rebuilt from its class once per worker process (see
+  `BaseAPI.__reduce__`); its ORM cannot reach the database from a worker;
+- a `Request` is replaced by a `RequestSnapshot` of its method, URL, headers,
+  path and query parameters;
+- other arguments, e.g. model instances and schemas, must be picklable.
+
+The pools are created when the application starts and shut down with it. Their
+sizes come from the `OFFLOAD_EXECUTORS` dict of the project settings, e.g.:
+
+    OFFLOAD_EXECUTORS = {
+        "process_workers": 4,
+        "thread_workers": 8,
+        "start_method": "spawn",
+    }
+"""
+
+import asyncio
+import functools
+import inspect
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from starlette.requests import HTTPConnection
+
+
+class RequestSnapshot:
+    """
+    RequestSnapshot is the picklable stand-in of a `Request` sent to a worker process.
+
+    Attributes:
+        method (str): The HTTP method.
+        url (str): The full URL.
+        headers (Dict[str, str]): The request headers.
+        path_params (Dict[str, Any]): The path parameters.
+        query_params (Dict[str, str]): The query parameters (last value wins).
+        client (Optional[Tuple[str, int]]): The client host and port.
+    """
+
+    def __init__(self, request: HTTPConnection):
+        self.method = request.scope.get("method")
+        self.url = str(request.url)
+        self.headers = dict(request.headers)
+        self.path_params = dict(request.path_params)
+        self.query_params = dict(request.query_params)
+        self.client = tuple(request.client) if request.client else None
+
+    def __repr__(self):
+        return f"RequestSnapshot({self.method} {self.url})"
+
+
+class OffloadExecutors:
+    """
+    OffloadExecutors owns the thread and process pools used by `offload`.
+
+    Attributes:
+        process_workers (Optional[int]): The size of the process pool. None uses
+            the number of CPUs.
+        thread_workers (Optional[int]): The size of the thread pool. None uses the
+            `ThreadPoolExecutor` default.
+        start_method (str): How worker processes are started: "spawn" (default),
+            "forkserver" or "fork".
+
+    Methods:
+        configure(process_workers: int = None, thread_workers: int = None, start_method: str = "spawn"):
+            Changes the pool sizes, restarting pools already created.
+
+        start():
+            Creates the pools.
+
+        executor(process: bool = False) -> Executor:
+            Returns the pool of a kind, creating it if needed.
+
+        shutdown(wait: bool = True):
+            Shuts the pools down.
+    """
+
+    def __init__(
+        self,
+        process_workers: Optional[int] = None,
+        thread_workers: Optional[int] = None,
+        start_method: str = "spawn",
+    ):
+        self.process_workers = process_workers
+        self.thread_workers = thread_workers
+        self.start_method = start_method
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
+    def configure(
+        self,
+        process_workers: Optional[int] = None,
+        thread_workers: Optional[int] = None,
+        start_method: str = "spawn",
+    ):
+        """
+        Changes the pool sizes.
+
+        Args:
+            process_workers (int, optional): The size of the process pool.
+                Defaults to the number of CPUs.
+            thread_workers (int, optional): The size of the thread pool. Defaults
+                to the `ThreadPoolExecutor` default.
+            start_method (str, optional): The multiprocessing start method.
+                Defaults to "spawn", which is safe with a running event loop.
+
+        Raises:
+            ValueError: If the start method is not available on this platform.
+        """
+        if start_method not in multiprocessing.get_all_start_methods():
+            raise ValueError(
+                f"Unsupported start method '{start_method}', "
+                f"expected one of {multiprocessing.get_all_start_methods()}."
+            )
+        self.shutdown(wait=False)
+        self.process_workers = process_workers
+        self.thread_workers = thread_workers
+        self.start_method = start_method
+
+    def start(self):
+        """Creates the thread and process pools (worker processes start on first use)."""
+        self.executor(process=False)
+        self.executor(process=True)
+
+    def executor(self, process: bool = False) -> Executor:
+        """
+        Returns the pool running offloaded calls of a kind, creating it if needed.
+
+        Args:
+            process (bool, optional): Whether to return the process pool. Defaults
+                to the thread pool.
+
+        Returns:
+            Executor: The pool.
+        """
+        if process:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                )
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers, thread_name_prefix="fastapibig-offload"
+            )
+        return self._thread_pool
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts the pools down. They are recreated if `offload` is used again.
+
+        Args:
+            wait (bool, optional): Whether to wait for the running calls. Defaults to True.
+        """
+        for pool in (self._process_pool, self._thread_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=not wait)
+        self._process_pool = None
+        self._thread_pool = None
+
+    async def aclose(self):
+        """Shuts the pools down without blocking the event loop, e.g. on application shutdown."""
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+
+
+executors = OffloadExecutors()
+
+# Views rebuilt in this worker process, by class (see `rebuild_view`).
+_views: Dict[type, Any] = {}
+
+
+def rebuild_view(cls: type) -> Any:
+    """
+    Returns the instance of a view class in this process, creating it once.
+
+    Used to unpickle the views sent to worker processes.
+    """
+    view = _views.get(cls)
+    if view is None:
+        view = _views[cls] = cls()
+    return view
+
+
+def _call_offloaded(function: Callable, args: Tuple, kwargs: Dict) -> Any:
+    """Runs the original body of an offloaded function, in a worker process."""
+    return function.__wrapped__(*args, **kwargs)
+
+
+def offload(process: bool = False) -> Callable:
+    """
+    Marks a synchronous function or method as CPU-bound, so it runs in an executor.
+
+    The decorated callable becomes a coroutine function, so it can override the
+    async hooks of the operations (`pre_create`, `on_create`, ...) or serve as a
+    custom view method.
+
+    Args:
+        process (bool, optional): Whether to run in the process pool instead of
+            the thread pool. Defaults to False. The function must then be defined
+            at module or class level, so workers can import it.
+
+    Returns:
+        Callable: The decorator.
+
+    Raises:
+        TypeError: If the decorated function is already a coroutine function.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        if inspect.iscoroutinefunction(function):
+            raise TypeError(
+                f"offload expects a synchronous function, got coroutine function "
+                f"'{function.__qualname__}'."
+            )
+
+        @functools.wraps(function)
+        async def wrapper(*args: Any, **kwargs: Any):
+            loop = asyncio.get_running_loop()
+            if not process:
+                return await loop.run_in_executor(
+                    executors.executor(), functools.partial(function, *args, **kwargs)
+                )
+            args = tuple(_picklable(arg) for arg in args)
+            kwargs = {key: _picklable(value) for key, value in kwargs.items()}
+            return await loop.run_in_executor(
+                executors.executor(process=True), _call_offloaded, wrapper, args, kwargs
+            )
+
+        wrapper.__offload__ = "process" if process else "thread"
+        return wrapper
+
+    return decorator
+
+
+def _picklable(value: Any) -> Any:
+    """Replaces the arguments that cannot cross processes by their snapshot."""
+    if isinstance(value, HTTPConnection):
+        return RequestSnapshot(value)
+    return value
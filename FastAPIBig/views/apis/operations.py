@@ -6,14 +6,21 @@ Each operation class follows a structured execution flow:
 1. **Validation**: Ensures the input data or request meets required constraints.
 2. **Pre-processing**: Executes any necessary logic before performing the main operation.
 3. **Execution**: Performs the core operation (create, retrieve, list, update, or delete).
-4. **Post-processing**: Triggers asynchronous hooks after the operation is completed.
-5. **Response Handling**: Returns the processed instance(s) validated against the output schema.
+4. **Cache invalidation**: Writes invalidate the cached responses of the model
+   once their transaction commits (see `caching`).
+5. **Post-processing**: Triggers asynchronous hooks after the operation is completed,
+   run in the background under a bounded `TaskSupervisor` (see `tasks`). The hooks
+   of writes are submitted once their transaction commits, so they see the
+   committed data, and are skipped when it rolls back.
+6. **Response Handling**: Returns the processed instance(s) validated against the output schema,
+   encoded to JSON in the same pass (see `BaseAPI._serialize`).
 
 These operation classes are designed to provide a consistent and extensible
 approach to handling resource management in an asynchronous environment.
 """
 
-import asyncio
+import functools
+from typing import List
 from pydantic import BaseModel
 from FastAPIBig.views.apis.base import (
     RegisterCreate,
@@ -22,8 +29,14 @@ from FastAPIBig.views.apis.base import (
     RegisterDelete,
     RegisterPartialUpdate,
     RegisterUpdate,
+    RegisterBulkCreate,
+    RegisterBulkUpdate,
+    RegisterBulkDelete,
 )
 from fastapi import Request
+from FastAPIBig.views.apis.caching import invalidate_model
+from FastAPIBig.views.apis.streaming import streaming_response
+from FastAPIBig.views.apis.tasks import run_hook
 
 
 class CreateOperation(RegisterCreate):
@@ -39,15 +52,19 @@ class CreateOperation(RegisterCreate):
         await self.create_validation(request, data)
         await self.pre_create(request, data)
         instance = await self._create(request, data)
-        asyncio.create_task(self.on_create(request, instance))
-        return self._get_schema_out_class("create").model_validate(instance.__dict__)
+        await self._model.on_commit(
+            functools.partial(invalidate_model, self.model), self._model.database
+        )
+        await self._model.on_commit(
+            lambda: run_hook(self.on_create(request, instance)), self._model.database
+        )
+        return self._serialize("create", instance)
 
     async def create_validation(self, request: Request, data: BaseModel):
         """
         Asynchronously validates the provided data by performing relation and uniqueness checks.
         """
-        await self._model.validate_relations(data)
-        await self._model.validate_unique_fields(data)
+        await self._model.validate(data)
 
     async def pre_create(self, request: Request, data: BaseModel):
         """
@@ -81,8 +98,8 @@ class RetrieveOperation(RegisterRetrieve):
         await self.pre_get(request, pk)
         instance = await self._get(request, pk)
         await self.get_validation(request, pk, instance)
-        asyncio.create_task(self.on_get(request, instance))
-        return self._get_schema_out_class("get").model_validate(instance.__dict__)
+        await run_hook(self.on_get(request, instance))
+        return self._serialize("get", instance)
 
     async def pre_get(self, request: Request, pk: int):
         """Pre-processing hook that is executed before retrieving a resource."""
@@ -90,7 +107,7 @@ class RetrieveOperation(RegisterRetrieve):
 
     async def _get(self, request: Request, pk: int):
         """Asynchronously retrieves an instance from the database using the provided primary key."""
-        return await self._model.get(pk=pk)
+        return await self._model.get(pk=pk, **self._get_read_options("get"))
 
     async def get_validation(self, request: Request, pk: int, instance):
         """Asynchronously validates the retrieved instance, ensuring it exists."""
@@ -115,11 +132,17 @@ class ListOperation(RegisterList):
         await self.list_validation(request)
         await self.pre_list(request)
         instances = await self._list(request)
-        asyncio.create_task(self.on_list(request))
-        return [
-            self._get_schema_out_class("list").model_validate(instance.__dict__)
-            for instance in instances
-        ]
+        await run_hook(self.on_list(request))
+        if self.streaming:
+            return streaming_response(
+                instances,
+                self._get_schema_out_class("list"),
+                self.stream_format,
+                self.stream_chunk_size,
+            )
+        if self.paginator:
+            return self._serialize("list", self.paginator.get_body(instances))
+        return self._serialize("list", instances)
 
     async def list_validation(self, request: Request):
         """Asynchronously validates the request before listing instances."""
@@ -130,41 +153,41 @@ class ListOperation(RegisterList):
         pass
 
     async def _list(self, request: Request):
-        """Asynchronously retrieves all instances from the database."""
-        return await self._model.all()
+        """
+        Asynchronously retrieves the instances from the database, filtered and
+        ordered as requested by the client (see `filter_fields` and
+        `ordering_fields`) and limited to the requested page when pagination is
+        enabled. In streaming mode an async iterator over a server-side cursor is
+        returned instead; it reads through a session of its own, since the body is
+        streamed after the unit of work of the request committed.
+        """
+        options = self._get_read_options("list")
+        filters = self._get_filters(request)
+        ordering = self._get_ordering(request)
+        if self.streaming:
+            return self._model.stream(
+                chunk_size=self.stream_chunk_size,
+                prefetch_related=options["select_related"] + options["prefetch_related"],
+                fields=options["fields"],
+                order_by=ordering,
+                own_session=True,
+                **filters,
+            )
+        if self.paginator:
+            return await self.paginator.paginate(
+                self._model,
+                request,
+                ordering=ordering[0] if ordering else None,
+                **options,
+                **filters,
+            )
+        return await self._model.filter(order_by=ordering, **options, **filters)
 
     async def on_list(self, request: Request):
         """Handles the post-listing event after instances are retrieved."""
         pass
 
 
-class UpdateOperation(RegisterUpdate):
-
-    async def update(self, request: Request, pk: int, data: BaseModel):
-        await self.update_validation(request, pk, data)
-        await self.pre_update(request, pk, data)
-        instance = await self._update(request, pk, data)
-        asyncio.create_task(self.on_update(request, instance))
-        return self._get_schema_out_class("update").model_validate(instance.__dict__)
-
-    async def update_validation(self, request: Request, pk: int, data: BaseModel):
-        await self._model.validate_relations(data)
-        await self._model.validate_unique_fields(data)
-
-    async def pre_update(self, request: Request, pk: int, data: BaseModel):
-        pass
-
-    async def _update(self, request: Request, pk: int, data: BaseModel):
-        instance = await self._model.get(pk=pk)
-        for key, value in data.model_dump().items():
-            setattr(instance, key, value)
-        await self._model.save(instance)
-        return instance
-
-    async def on_update(self, request: Request, instance):
-        pass
-
-
 class UpdateOperation(RegisterUpdate):
     """
     A class that handles updating an operation with validation, pre-processing,
@@ -178,13 +201,17 @@ class UpdateOperation(RegisterUpdate):
         await self.update_validation(request, pk, data)
         await self.pre_update(request, pk, data)
         instance = await self._update(request, pk, data)
-        asyncio.create_task(self.on_update(request, instance))
-        return self._get_schema_out_class("update").model_validate(instance.__dict__)
+        await self._model.on_commit(
+            functools.partial(invalidate_model, self.model), self._model.database
+        )
+        await self._model.on_commit(
+            lambda: run_hook(self.on_update(request, instance)), self._model.database
+        )
+        return self._serialize("update", instance)
 
     async def update_validation(self, request: Request, pk: int, data: BaseModel):
         """Asynchronously validates the provided data by performing relation and uniqueness checks."""
-        await self._model.validate_relations(data)
-        await self._model.validate_unique_fields(data)
+        await self._model.validate(data, exclude_pk=pk)
 
     async def pre_update(self, request: Request, pk: int, data: BaseModel):
         """Pre-processing hook that is executed before updating a resource."""
@@ -194,10 +221,9 @@ class UpdateOperation(RegisterUpdate):
         """
         Asynchronously updates an existing instance in the database using the provided primary key and data.
         """
-        instance = await self._model.get(pk=pk)
-        for key, value in data.model_dump().items():
-            setattr(instance, key, value)
-        await self._model.save(instance)
+        instance = await self._model.update(pk, **data.model_dump())
+        if instance is None:
+            raise KeyError(f"Object({self.model}) with given id: {pk} not found. ")
         return instance
 
     async def on_update(self, request: Request, instance):
@@ -218,7 +244,12 @@ class DeleteOperation(RegisterDelete):
         await self.delete_validation(request, pk)
         await self.pre_delete(request, pk)
         deleted = await self._delete(request, pk)
-        asyncio.create_task(self.on_delete(request, pk, deleted))
+        await self._model.on_commit(
+            functools.partial(invalidate_model, self.model), self._model.database
+        )
+        await self._model.on_commit(
+            lambda: run_hook(self.on_delete(request, pk, deleted)), self._model.database
+        )
         return {"deleted": deleted}
 
     async def delete_validation(self, request: Request, pk: int):
@@ -231,9 +262,134 @@ class DeleteOperation(RegisterDelete):
 
     async def _delete(self, request: Request, pk: int):
         """Asynchronously deletes an instance from the database using the provided primary key."""
-        await self._model.get(pk=pk)
         return await self._model.delete(pk)
 
     async def on_delete(self, request: Request, pk: int, deleted: bool):
         """Handles the post-deletion event after an instance is deleted."""
         pass
+
+
+class BulkCreateOperation(RegisterBulkCreate):
+    """
+    A class that handles the creation of many instances in one request, with
+    validation, pre-processing and post-processing steps run once per batch.
+    """
+
+    async def bulk_create(self, request: Request, data: List[BaseModel]):
+        """
+        Handles the creation of a batch of new instances.
+        """
+        await self.bulk_create_validation(request, data)
+        await self.pre_bulk_create(request, data)
+        instances = await self._bulk_create(request, data)
+        await self._model.on_commit(
+            functools.partial(invalidate_model, self.model), self._model.database
+        )
+        await self._model.on_commit(
+            lambda: run_hook(self.on_bulk_create(request, instances)), self._model.database
+        )
+        return self._serialize("bulk_create", instances)
+
+    async def bulk_create_validation(self, request: Request, data: List[BaseModel]):
+        """
+        Asynchronously validates the relations and uniqueness of the whole batch in one query.
+        """
+        await self._model.validate_many(data)
+
+    async def pre_bulk_create(self, request: Request, data: List[BaseModel]):
+        """Pre-processing hook that is executed before creating the batch."""
+        pass
+
+    async def _bulk_create(self, request: Request, data: List[BaseModel]):
+        """
+        Asynchronously creates the records of the batch with multi-row inserts.
+        """
+        return await self._model.bulk_create([item.model_dump() for item in data])
+
+    async def on_bulk_create(self, request: Request, instances):
+        """Handles the creation event for the created instances."""
+        pass
+
+
+class BulkUpdateOperation(RegisterBulkUpdate):
+    """
+    A class that handles the update of many instances in one request, with
+    validation, pre-processing and post-processing steps run once per batch.
+    """
+
+    async def bulk_update(self, request: Request, data: List[BaseModel]):
+        """
+        Handles the update of a batch of instances by their primary keys.
+        Records that do not exist are returned as None.
+        """
+        await self.bulk_update_validation(request, data)
+        await self.pre_bulk_update(request, data)
+        instances = await self._bulk_update(request, data)
+        await self._model.on_commit(
+            functools.partial(invalidate_model, self.model), self._model.database
+        )
+        await self._model.on_commit(
+            lambda: run_hook(self.on_bulk_update(request, instances)), self._model.database
+        )
+        return self._serialize("bulk_update", instances)
+
+    async def bulk_update_validation(self, request: Request, data: List[BaseModel]):
+        """Asynchronously validates the relations and uniqueness of the whole batch in one query."""
+        await self._model.validate_many(
+            [item.data for item in data], exclude_pks=[item.pk for item in data]
+        )
+
+    async def pre_bulk_update(self, request: Request, data: List[BaseModel]):
+        """Pre-processing hook that is executed before updating the batch."""
+        pass
+
+    async def _bulk_update(self, request: Request, data: List[BaseModel]):
+        """
+        Asynchronously updates the records of the batch by primary key.
+        """
+        pk_key = self._model.meta.pk_attribute.key
+        return await self._model.bulk_update(
+            [{**item.data.model_dump(), pk_key: item.pk} for item in data]
+        )
+
+    async def on_bulk_update(self, request: Request, instances):
+        """Handles the post-update event for the updated instances."""
+        pass
+
+
+class BulkDeleteOperation(RegisterBulkDelete):
+    """
+    A class that handles the deletion of many instances in one request, with
+    validation, pre-processing and post-processing steps run once per batch.
+    """
+
+    async def bulk_delete(self, request: Request, data: List[int]):
+        """
+        Handles the deletion of a batch of instances by their primary keys.
+        """
+        await self.bulk_delete_validation(request, data)
+        await self.pre_bulk_delete(request, data)
+        deleted = await self._bulk_delete(request, data)
+        await self._model.on_commit(
+            functools.partial(invalidate_model, self.model), self._model.database
+        )
+        await self._model.on_commit(
+            lambda: run_hook(self.on_bulk_delete(request, data, deleted)), self._model.database
+        )
+        return {"deleted": deleted}
+
+    async def bulk_delete_validation(self, request: Request, data: List[int]):
+        """Asynchronously validates the request before deleting the batch."""
+        pass
+
+    async def pre_bulk_delete(self, request: Request, data: List[int]):
+        """Pre-processing hook that is executed before deleting the batch."""
+        pass
+
+    async def _bulk_delete(self, request: Request, data: List[int]):
+        """Asynchronously deletes the records of the batch with `IN` deletes."""
+        return await self._model.bulk_delete(data)
+
+    async def on_bulk_delete(self, request: Request, pks: List[int], deleted: List[bool]):
+        """Handles the post-deletion event after the batch is deleted."""
+        pass
@@ -0,0 +1,217 @@
+"""
+This module provides the pagination classes used by list views.
+
+A pagination class is attached to a list view through its `pagination_class`
+attribute. It documents and validates the `cursor`/`page_size` query parameters,
+fetches a single page through the view's ORM, and builds the response body of
+the page: its `results` alongside opaque `next`/`prev` cursors, serialized by
+the view against the schema returned by `response_schema`.
+"""
+
+import abc
+from typing import Optional, List, Type, Dict
+from fastapi import Query, Request, HTTPException, status
+from pydantic import BaseModel, create_model
+
+from FastAPIBig.orm.base.base_model import ORM
+from FastAPIBig.orm.base.pagination import Page
+
+
+class BasePagination(abc.ABC):
+    """
+    BasePagination defines the interface shared by all pagination classes.
+
+    Subclasses implement `_paginate`, which fetches a page from the ORM.
+
+    Attributes:
+        page_size (int): The number of records returned when the client does not
+            request a page size.
+        max_page_size (int): The upper bound accepted for the `page_size` query parameter.
+        ordering (Optional[str]): The column used to order records, prefixed with "-"
+            for descending order. Defaults to the primary key.
+
+    Methods:
+        query_params():
+            Returns a FastAPI dependency documenting and validating the query parameters.
+
+        response_schema(schema: Type[BaseModel]) -> Type[BaseModel]:
+            Returns the paginated response schema wrapping the given item schema.
+
+        paginate(orm: ORM, request: Request, ordering: str = None, **filters) -> Page:
+            Fetches the page requested by the client.
+
+        get_body(page: Page) -> dict:
+            Returns the unserialized response body of a page.
+    """
+
+    _response_schemas: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+    def __init__(
+        self, page_size: int = 100, max_page_size: int = 1000, ordering: str = None
+    ):
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.ordering = ordering
+
+    def query_params(self):
+        """
+        Builds a dependency declaring the pagination query parameters.
+
+        The dependency is registered on the list route so the parameters are
+        validated by FastAPI and appear in the OpenAPI schema; the values are read
+        back from the request in `paginate`.
+
+        Returns:
+            Callable: A FastAPI dependency.
+        """
+        max_page_size = self.max_page_size
+
+        def pagination_params(
+            cursor: Optional[str] = Query(
+                None, description="Opaque cursor returned as `next`/`prev`."
+            ),
+            page_size: Optional[int] = Query(
+                None, ge=1, le=max_page_size, description="Number of records per page."
+            ),
+        ):
+            return None
+
+        return pagination_params
+
+    def response_schema(self, schema: Type[BaseModel]) -> Type[BaseModel]:
+        """
+        Returns the paginated response schema for an item schema.
+
+        Args:
+            schema (Type[BaseModel]): The schema of a single record.
+
+        Returns:
+            Type[BaseModel]: A schema with `results`, `next` and `prev` fields.
+        """
+        if schema not in self._response_schemas:
+            self._response_schemas[schema] = create_model(
+                f"{schema.__name__}Page",
+                results=(List[schema], ...),
+                next=(Optional[str], None),
+                prev=(Optional[str], None),
+            )
+        return self._response_schemas[schema]
+
+    def get_page_size(self, request: Request) -> int:
+        """Returns the page size requested by the client, bounded by `max_page_size`."""
+        page_size = request.query_params.get("page_size")
+        if not page_size:
+            return self.page_size
+        return min(int(page_size), self.max_page_size)
+
+    def get_cursor(self, request: Request) -> Optional[str]:
+        """Returns the cursor sent by the client, if any."""
+        return request.query_params.get("cursor") or None
+
+    async def paginate(
+        self, orm: ORM, request: Request, ordering: Optional[str] = None, **filters
+    ) -> Page:
+        """
+        Fetches the page requested by the client.
+
+        Args:
+            orm (ORM): The ORM instance of the view.
+            request (Request): The incoming request.
+            ordering (str, optional): The ordering requested by the client, which
+                takes precedence over `self.ordering`.
+            **filters: Arbitrary keyword arguments representing the filter conditions.
+
+        Returns:
+            Page: The requested page.
+
+        Raises:
+            HTTPException: If the cursor sent by the client is invalid.
+        """
+        try:
+            return await self._paginate(
+                orm,
+                self.get_page_size(request),
+                self.get_cursor(request),
+                ordering=ordering or self.ordering,
+                **filters,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    @abc.abstractmethod
+    async def _paginate(
+        self,
+        orm: ORM,
+        page_size: int,
+        cursor: Optional[str],
+        ordering: Optional[str] = None,
+        **filters,
+    ) -> Page:
+        """
+        Fetches a page of records from the ORM.
+
+        Args:
+            orm (ORM): The ORM instance of the view.
+            page_size (int): The maximum number of records to return.
+            cursor (Optional[str]): The cursor sent by the client, if any.
+            ordering (str, optional): The column to order by, prefixed with "-" for
+                descending order.
+            **filters: Arbitrary keyword arguments representing the filter conditions.
+
+        Returns:
+            Page: The requested page.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+
+    def get_body(self, page: Page) -> dict:
+        """
+        Returns the unserialized response body of a page, to be validated against
+        the paginated response schema (see `response_schema`).
+
+        Args:
+            page (Page): The page.
+
+        Returns:
+            dict: The page records under `results`, with the `next` and `prev` cursors.
+        """
+        return {"results": page.items, "next": page.next, "prev": page.prev}
+
+
+class CursorPagination(BasePagination):
+    """
+    Keyset pagination: each page seeks past the boundary row of the previous one,
+    so latency stays flat regardless of how deep the client pages.
+    """
+
+    async def _paginate(
+        self,
+        orm: ORM,
+        page_size: int,
+        cursor: Optional[str],
+        ordering: Optional[str] = None,
+        **filters,
+    ) -> Page:
+        return await orm.paginate(
+            page_size, cursor=cursor, ordering=ordering, **filters
+        )
+
+
+class LimitOffsetPagination(BasePagination):
+    """
+    Offset/limit pagination, for orderings that cannot be expressed as a keyset.
+    Cursors have the same shape as `CursorPagination`, but deep pages are slower.
+    """
+
+    async def _paginate(
+        self,
+        orm: ORM,
+        page_size: int,
+        cursor: Optional[str],
+        ordering: Optional[str] = None,
+        **filters,
+    ) -> Page:
+        return await orm.paginate_offset(
+            page_size, cursor=cursor, ordering=ordering, **filters
+        )
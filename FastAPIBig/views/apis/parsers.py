@@ -0,0 +1,110 @@
+"""
+This module provides the single-pass request body parsing used by views with
+`raw_body = True`.
+
+FastAPI normally decodes a JSON body with `json.loads` into Python objects and
+then validates them against the body annotation, building the payload twice.
+`json_body_dependency` reads the raw bytes instead and hands them to the cached
+type adapter of the annotation (`validate_json`), which parses and validates in
+one pass without the intermediate objects. Validation errors are reported in
+FastAPI's format (422, with locations under "body"), and `json_body_openapi`
+documents the body in the OpenAPI schema like a regular body parameter.
+"""
+
+from typing import Annotated, Any, Callable, Dict, get_args, get_origin
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from FastAPIBig.views.apis.serializers import get_type_adapter
+
+
+def body_type(annotation: Any) -> Any:
+    """Strips the FastAPI metadata (e.g. `Body()`) of an `Annotated` body annotation."""
+    if get_origin(annotation) is Annotated:
+        return get_args(annotation)[0]
+    return annotation
+
+
+def json_body_dependency(annotation: Any) -> Callable:
+    """
+    Builds a dependency validating the raw JSON body of a request in one pass.
+
+    Args:
+        annotation (Any): The body annotation, e.g. a schema or `List[schema]`.
+
+    Returns:
+        Callable: A FastAPI dependency returning the validated body.
+    """
+    adapter = get_type_adapter(body_type(annotation))
+
+    async def json_body(request: Request):
+        body = await request.body()
+        if not body:
+            raise RequestValidationError(
+                [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+            )
+        try:
+            return adapter.validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(_body_errors(e), body=body)
+
+    return json_body
+
+
+def _body_errors(error: ValidationError) -> list:
+    """Converts pydantic errors into FastAPI's request errors, located under "body"."""
+    errors = []
+    for item in error.errors(include_url=False):
+        if item["type"] == "json_invalid":
+            errors.append(
+                {
+                    "type": "json_invalid",
+                    "loc": ("body",),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": item["msg"]},
+                }
+            )
+        else:
+            errors.append({**item, "loc": ("body", *item["loc"])})
+    return errors
+
+
+def json_body_openapi(annotation: Any) -> Dict[str, Any]:
+    """
+    Documents a JSON body in the `openapi_extra` of a route.
+
+    The schema is inlined, since models only used through the dependency are not
+    part of the OpenAPI components.
+
+    Args:
+        annotation (Any): The body annotation.
+
+    Returns:
+        Dict[str, Any]: The `requestBody` entry of the operation.
+    """
+    schema = get_type_adapter(body_type(annotation)).json_schema(mode="validation")
+    definitions = schema.pop("$defs", {})
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline(schema, definitions)}},
+        }
+    }
+
+
+def _inline(schema: Any, definitions: dict, seen: frozenset = frozenset()) -> Any:
+    """Replaces the local `$ref`s of a JSON schema by their definitions; recursive ones are left untyped."""
+    if isinstance(schema, list):
+        return [_inline(item, definitions, seen) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    ref = schema.get("$ref", "")
+    if ref.startswith("#/$defs/"):
+        name = ref[len("#/$defs/") :]
+        if name in definitions and name not in seen:
+            return _inline(definitions[name], definitions, seen | {name})
+        return {key: value for key, value in schema.items() if key != "$ref"}
+    return {key: _inline(value, definitions, seen) for key, value in schema.items()}
@@ -0,0 +1,47 @@
+"""
+This module provides the helpers turning ORM results into output schemas.
+
+Read operations return either model instances or, when the view projects its
+output schema onto columns (`projection = True`), plain row mappings. Both are
+validated the same way, so operations, paginators and streaming responses do
+not need to know which one they got.
+
+Validation goes through one cached `TypeAdapter` per annotation (a schema, a
+`List[schema]`, a paginated schema, ...), returned by `get_type_adapter`, and
+reads the values with `from_attributes`, so instances are not copied into dicts
+first. `to_json` validates and encodes to JSON bytes in a single call into
+pydantic-core.
+"""
+
+import functools
+from typing import Any
+from pydantic import TypeAdapter
+
+
+@functools.lru_cache(maxsize=None)
+def get_type_adapter(annotation: Any) -> TypeAdapter:
+    """
+    Returns the type adapter of an annotation, building it once.
+
+    Args:
+        annotation (Any): A schema class or a typing construct such as `List[schema]`.
+
+    Returns:
+        TypeAdapter: The cached adapter.
+    """
+    return TypeAdapter(annotation)
+
+
+def to_json(annotation: Any, data: Any) -> bytes:
+    """
+    Validates ORM results against an output annotation and encodes them as JSON.
+
+    Args:
+        annotation (Any): The output schema, or e.g. `List[schema]`.
+        data (Any): Model instances, row mappings, or containers of them.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    adapter = get_type_adapter(annotation)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
@@ -0,0 +1,103 @@
+"""
+This module provides helpers for streaming list responses.
+
+Records are serialized one by one as they are read from the database and
+flushed to the client in chunks, so the peak memory of a response is bounded by
+the chunk size instead of the size of the result set.
+"""
+
+from typing import AsyncIterator, Type
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from FastAPIBig.views.apis.serializers import to_json
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+async def iter_ndjson(
+    instances: AsyncIterator, schema: Type[BaseModel], chunk_size: int = 1000
+) -> AsyncIterator[bytes]:
+    """
+    Serializes instances as newline-delimited JSON, one object per line.
+
+    Args:
+        instances (AsyncIterator): The model instances (or row mappings) to serialize.
+        schema (Type[BaseModel]): The output schema used for each instance.
+        chunk_size (int, optional): The number of lines buffered before a write.
+
+    Yields:
+        bytes: Chunks of the response body.
+    """
+    buffer = []
+    async for instance in instances:
+        buffer.append(to_json(schema, instance))
+        if len(buffer) >= chunk_size:
+            yield b"\n".join(buffer) + b"\n"
+            buffer.clear()
+    if buffer:
+        yield b"\n".join(buffer) + b"\n"
+
+
+async def iter_json_array(
+    instances: AsyncIterator, schema: Type[BaseModel], chunk_size: int = 1000
+) -> AsyncIterator[bytes]:
+    """
+    Serializes instances as a single JSON array written in chunks.
+
+    Args:
+        instances (AsyncIterator): The model instances (or row mappings) to serialize.
+        schema (Type[BaseModel]): The output schema used for each instance.
+        chunk_size (int, optional): The number of items buffered before a write.
+
+    Yields:
+        bytes: Chunks of the response body.
+    """
+    buffer = []
+    separator = b"["
+    async for instance in instances:
+        buffer.append(to_json(schema, instance))
+        if len(buffer) >= chunk_size:
+            yield separator + b",".join(buffer)
+            separator = b","
+            buffer.clear()
+    if buffer:
+        yield separator + b",".join(buffer) + b"]"
+    else:
+        yield b"[]" if separator == b"[" else b"]"
+
+
+def streaming_response(
+    instances: AsyncIterator,
+    schema: Type[BaseModel],
+    stream_format: str = "ndjson",
+    chunk_size: int = 1000,
+) -> StreamingResponse:
+    """
+    Builds a `StreamingResponse` serializing instances in the requested format.
+
+    Args:
+        instances (AsyncIterator): The model instances (or row mappings) to serialize.
+        schema (Type[BaseModel]): The output schema used for each instance.
+        stream_format (str, optional): Either "ndjson" or "json". Defaults to "ndjson".
+        chunk_size (int, optional): The number of items buffered before a write.
+
+    Returns:
+        StreamingResponse: The streaming response.
+
+    Raises:
+        ValueError: If the stream format is not supported.
+    """
+    if stream_format not in STREAM_MEDIA_TYPES:
+        raise ValueError(
+            f"Unsupported stream format '{stream_format}', "
+            f"expected one of {list(STREAM_MEDIA_TYPES)}."
+        )
+    serializer = iter_ndjson if stream_format == "ndjson" else iter_json_array
+    return StreamingResponse(
+        serializer(instances, schema, chunk_size),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+    )
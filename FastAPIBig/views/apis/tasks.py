@@ -0,0 +1,307 @@
+"""
+This module runs the post-processing hooks of the operations (`on_create`,
+`on_get`, `on_list`, ...) in the background under a `TaskSupervisor`.
+
+The supervisor keeps a reference to every hook it runs, so tasks are never
+garbage-collected mid-flight, and at most `concurrency` hooks run at a time so
+they cannot starve request handling of the event loop or the connection pool.
+Hooks beyond that limit wait in a queue of `queue_size` entries; once the queue
+is full, `policy` decides what happens to new hooks:
+
+- "block": the request submitting the hook waits for a free queue slot;
+- "drop": the hook is discarded and counted as dropped;
+- "spill": the hook is queued past the bound and counted as spilled, so nothing
+  is lost but the queue may grow while hooks are slower than requests.
+
+Failed hooks are logged on the "FastAPIBig.tasks" logger. When the application
+shuts down, the queued and running hooks are given `shutdown_timeout` seconds
+to finish before they are cancelled.
+
+The supervisor is configured from the `BACKGROUND_TASKS` dict of the project
+settings, e.g.:
+
+    BACKGROUND_TASKS = {
+        "concurrency": 100,
+        "queue_size": 1000,
+        "policy": "block",
+        "shutdown_timeout": 30,
+    }
+"""
+
+import asyncio
+import collections
+import contextvars
+import logging
+import time
+from typing import Coroutine, Deque, Optional, Set, Tuple
+
+from FastAPIBig.orm.base.session_manager import detach_unit_of_work
+
+logger = logging.getLogger("FastAPIBig.tasks")
+
+BACKPRESSURE_POLICIES = ("block", "drop", "spill")
+
+
+class TaskSupervisor:
+    """
+    TaskSupervisor owns the background tasks of the operation hooks.
+
+    Attributes:
+        concurrency (int): The maximum number of hooks running at a time.
+        queue_size (int): The number of hooks waiting for a slot before `policy` applies.
+        policy (str): What happens to hooks submitted to a full queue: "block",
+            "drop" or "spill".
+        shutdown_timeout (float): Seconds `drain` waits for pending hooks before
+            cancelling them.
+        submitted (int): The number of hooks submitted.
+        completed (int): The number of hooks that returned.
+        failed (int): The number of hooks that raised.
+        cancelled (int): The number of hooks cancelled, or discarded by `drain`.
+        dropped (int): The number of hooks discarded by the "drop" policy.
+        spilled (int): The number of hooks queued past `queue_size`.
+        blocked (int): The number of submissions that waited for a queue slot.
+
+    Methods:
+        configure(concurrency: int = 100, queue_size: int = 1000, policy: str = "block", shutdown_timeout: float = 30):
+            Changes the limits and backpressure policy.
+
+        submit(coro: Coroutine, name: str = None) -> bool:
+            Runs a hook in the background, or queues it.
+
+        drain(timeout: float = None):
+            Waits for every pending hook, then cancels those still running.
+
+        stats() -> dict:
+            Returns the supervisor counters.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 100,
+        queue_size: int = 1000,
+        policy: str = "block",
+        shutdown_timeout: float = 30,
+    ):
+        self.configure(concurrency, queue_size, policy, shutdown_timeout)
+        self._running: Set[asyncio.Task] = set()
+        self._queue: Deque[Tuple[Coroutine, str, contextvars.Context]] = (
+            collections.deque()
+        )
+        self._waiters: Deque[asyncio.Future] = collections.deque()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.blocked = 0
+
+    def configure(
+        self,
+        concurrency: int = 100,
+        queue_size: int = 1000,
+        policy: str = "block",
+        shutdown_timeout: float = 30,
+    ):
+        """
+        Changes the limits and backpressure policy of the supervisor.
+
+        Args:
+            concurrency (int, optional): The maximum number of hooks running at a
+                time. Defaults to 100.
+            queue_size (int, optional): The number of hooks waiting for a slot
+                before `policy` applies. Defaults to 1000.
+            policy (str, optional): "block" (default), "drop" or "spill".
+            shutdown_timeout (float, optional): Seconds `drain` waits for pending
+                hooks. Defaults to 30.
+
+        Raises:
+            ValueError: If the policy is not supported or a limit is not positive.
+        """
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unsupported backpressure policy '{policy}', "
+                f"expected one of {list(BACKPRESSURE_POLICIES)}."
+            )
+        if concurrency < 1 or queue_size < 0:
+            raise ValueError(
+                "Background tasks need a concurrency of at least 1 "
+                "and a non-negative queue size."
+            )
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.policy = policy
+        self.shutdown_timeout = shutdown_timeout
+
+    async def submit(self, coro: Coroutine, name: Optional[str] = None) -> bool:
+        """
+        Runs a hook in the background, or queues it when `concurrency` hooks are running.
+
+        The hook runs in a copy of the caller's context without its unit of work,
+        since the request's session is committed and closed as soon as the
+        response is sent (see `detach_unit_of_work`).
+
+        Args:
+            coro (Coroutine): The hook coroutine, e.g. `self.on_create(request, instance)`.
+            name (str, optional): The name used in logs. Defaults to the qualified
+                name of the coroutine.
+
+        Returns:
+            bool: False if the hook was dropped, True otherwise.
+        """
+        name = name or getattr(coro, "__qualname__", repr(coro))
+        context = detach_unit_of_work(contextvars.copy_context)
+        self.submitted += 1
+        if len(self._queue) >= self.queue_size and not self._has_free_slot():
+            if self.policy == "drop":
+                coro.close()
+                self.dropped += 1
+                logger.warning("Background task %s dropped: the queue is full.", name)
+                return False
+            if self.policy == "spill":
+                self.spilled += 1
+            else:
+                self.blocked += 1
+                await self._wait_for_slot(coro)
+        if self._has_free_slot():
+            self._start(coro, name, context)
+        else:
+            self._queue.append((coro, name, context))
+        return True
+
+    def _has_free_slot(self) -> bool:
+        """Tells whether a hook can start right away, without jumping the queue."""
+        return len(self._running) < self.concurrency and not self._queue
+
+    async def _wait_for_slot(self, coro: Coroutine):
+        """Waits until the queue has room, closing the hook if the wait is cancelled."""
+        loop = asyncio.get_running_loop()
+        while len(self._queue) >= self.queue_size and not self._has_free_slot():
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                coro.close()
+                self.cancelled += 1
+                # Pass the wake-up on, in case this waiter was the one notified.
+                self._wake_waiter()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _wake_waiter(self):
+        """Wakes the oldest submission waiting for a queue slot."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _start(self, coro: Coroutine, name: str, context: contextvars.Context):
+        """Starts a hook in its captured context and keeps a reference to it."""
+        task = context.run(asyncio.create_task, self._run(coro, name), name=name)
+        self._running.add(task)
+        task.add_done_callback(self._on_done)
+
+    async def _run(self, coro: Coroutine, name: str):
+        """Awaits a hook, recording and logging its outcome."""
+        start = time.perf_counter()
+        try:
+            await coro
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        except Exception:
+            self.failed += 1
+            logger.exception(
+                "Background task %s failed after %.1f ms.",
+                name,
+                (time.perf_counter() - start) * 1000,
+            )
+        else:
+            self.completed += 1
+
+    def _on_done(self, task: asyncio.Task):
+        """Frees the slot of a finished hook and starts the next queued one."""
+        self._running.discard(task)
+        while self._queue and len(self._running) < self.concurrency:
+            self._start(*self._queue.popleft())
+        if len(self._queue) < self.queue_size or self._has_free_slot():
+            self._wake_waiter()
+
+    async def drain(self, timeout: Optional[float] = None):
+        """
+        Waits for the queued and running hooks, e.g. when the application shuts down.
+
+        Hooks still pending after the timeout are cancelled (running ones) or
+        discarded (queued ones), and counted as cancelled.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to `shutdown_timeout`.
+        """
+        timeout = self.shutdown_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while self._running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.wait(set(self._running), timeout=remaining)
+
+        for coro, name, _ in self._queue:
+            coro.close()
+            self.cancelled += 1
+            logger.warning("Background task %s discarded at shutdown.", name)
+        self._queue.clear()
+        pending = set(self._running)
+        for task in pending:
+            logger.warning("Background task %s cancelled at shutdown.", task.get_name())
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.cancel()
+
+    def stats(self) -> dict:
+        """
+        Returns the supervisor counters.
+
+        Returns:
+            dict: running, queued, waiting (blocked submissions), concurrency,
+            queue_size, policy, submitted, completed, failed, cancelled, dropped,
+            spilled and blocked.
+        """
+        return {
+            "running": len(self._running),
+            "queued": len(self._queue),
+            "waiting": sum(not waiter.done() for waiter in self._waiters),
+            "concurrency": self.concurrency,
+            "queue_size": self.queue_size,
+            "policy": self.policy,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "blocked": self.blocked,
+        }
+
+
+supervisor = TaskSupervisor()
+
+
+async def run_hook(coro: Coroutine, name: Optional[str] = None) -> bool:
+    """
+    Runs a post-processing hook under the shared supervisor.
+
+    Args:
+        coro (Coroutine): The hook coroutine.
+        name (str, optional): The name used in logs.
+
+    Returns:
+        bool: False if the hook was dropped, True otherwise.
+    """
+    return await supervisor.submit(coro, name)
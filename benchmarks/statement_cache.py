@@ -0,0 +1,110 @@
+"""
+Benchmark of the ORM statement cache (`FastAPIBig.orm.base.statements`).
+
+Runs the hot, fixed-shape ORM queries (get by primary key, first, exists, count
+and the relation/unique checks of `validate`) against a SQLite database, with
+the statement cache disabled and then enabled, and prints the time per call.
+The difference is the Python time spent building the `select(...)` construct
+and deriving its SQLAlchemy cache key on every call.
+
+Usage:
+
+    python benchmarks/statement_cache.py [--iterations 5000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from pydantic import BaseModel
+from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy.orm import DeclarativeBase, relationship
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FastAPIBig.orm.base.base_model import ORM, ORMSession  # noqa: E402
+from FastAPIBig.orm.base.session_manager import DataBaseSessionManager  # noqa: E402
+from FastAPIBig.orm.base.statements import statement_cache  # noqa: E402
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Author(Base):
+    __tablename__ = "author"
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True)
+    books = relationship("Book", back_populates="author")
+
+
+class Book(Base):
+    __tablename__ = "book"
+    id = Column(Integer, primary_key=True)
+    title = Column(String, unique=True)
+    author_id = Column(Integer, ForeignKey("author.id"))
+    author = relationship("Author", back_populates="books")
+
+
+class BookIn(BaseModel):
+    title: str
+    author_id: int
+
+
+async def measure(call, iterations: int) -> float:
+    """Returns the mean time of a call in microseconds, after a warm-up."""
+    for _ in range(50):
+        await call()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main(iterations: int):
+    directory = tempfile.mkdtemp()
+    manager = DataBaseSessionManager(
+        f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.sqlite3')}"
+    )
+    ORMSession.initialize(manager)
+    await manager.create_all_tables(Base)
+
+    authors, books = ORM(Author), ORM(Book)
+    await authors.bulk_create([{"name": f"author-{i}"} for i in range(100)])
+    await books.bulk_create(
+        [{"title": f"book-{i}", "author_id": i % 100 + 1} for i in range(1000)]
+    )
+    payload = BookIn(title="new book", author_id=7)
+
+    cases = {
+        "get(pk)": lambda: books.get(42),
+        "first(**filters)": lambda: books.first(title="book-42"),
+        "exists(**filters)": lambda: authors.exists(name="author-7"),
+        "count()": lambda: books.count(),
+        "validate(data)": lambda: books.validate(payload),
+    }
+
+    print(f"{'query':<20}{'uncached µs':>14}{'cached µs':>12}{'saved µs':>11}{'saved':>8}")
+    for name, call in cases.items():
+        statement_cache.configure(enabled=False)
+        uncached = await measure(call, iterations)
+        statement_cache.configure(enabled=True)
+        cached = await measure(call, iterations)
+        saved = uncached - cached
+        print(
+            f"{name:<20}{uncached:>14.1f}{cached:>12.1f}{saved:>11.1f}"
+            f"{saved / uncached:>8.1%}"
+        )
+
+    stats = statement_cache.stats()
+    print(f"\nstatement cache: {stats['hits']} hits, {stats['misses']} misses")
+    await manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    asyncio.run(main(parser.parse_args().iterations))
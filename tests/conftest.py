@@ -0,0 +1,57 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from FastAPIBig.management.middlewares import ReadReplicaMiddleware, UnitOfWorkMiddleware
+from FastAPIBig.orm.base.base_model import ORM, ORMSession
+from FastAPIBig.orm.base.session_manager import DataBaseSessionManager
+
+from tests.models import Author, Base, Book
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """A session manager of a fresh SQLite database holding the test models."""
+    manager = DataBaseSessionManager(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    ORMSession.initialize(manager)
+    await manager.create_all_tables(Base)
+    yield manager
+    await manager.close()
+
+
+@pytest.fixture
+def authors(db_manager) -> ORM:
+    return ORM(Author)
+
+
+@pytest.fixture
+def books(db_manager) -> ORM:
+    return ORM(Book)
+
+
+@pytest.fixture
+async def make_client(db_manager):
+    """
+    Returns a factory of HTTP clients serving the given views, in a unit of work
+    per request (as with `ATOMIC_REQUESTS`) unless `atomic=False`, and routing
+    reads per request (as with `DATABASE_REPLICA_URLS`) if `routing=True`.
+    """
+    clients = []
+
+    def factory(*views, atomic: bool = True, routing: bool = False) -> httpx.AsyncClient:
+        app = FastAPI()
+        for view in views:
+            app.include_router(view.as_router(prefix=""))
+        if atomic:
+            app.add_middleware(UnitOfWorkMiddleware, db_manager=db_manager)
+        if routing:
+            app.add_middleware(ReadReplicaMiddleware, db_manager=db_manager)
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy.orm import DeclarativeBase, relationship
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Author(Base):
+    __tablename__ = "author"
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    email = Column(String, unique=True)
+
+    books = relationship("Book", back_populates="author")
+
+
+class Book(Base):
+    __tablename__ = "book"
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    rating = Column(Integer, nullable=False, default=0)
+    author_id = Column(Integer, ForeignKey("author.id"))
+
+    author = relationship("Author", back_populates="books")
+
+
+class AuthorIn(BaseModel):
+    name: str
+    email: Optional[str] = None
+
+
+class AuthorOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    email: Optional[str] = None
+
+
+class BookIn(BaseModel):
+    title: str
+    rating: int = 0
+    author_id: Optional[int] = None
+
+
+class BookOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    rating: int
+    author_id: Optional[int] = None
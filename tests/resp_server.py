@@ -0,0 +1,105 @@
+"""
+A minimal in-process server speaking the Redis protocol (RESP), standing in for
+Redis in the tests of `RedisBackend`. It implements the commands the backend
+sends: AUTH, SELECT, GET, SET (with PX), MGET and INCR.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class RespServer:
+    """
+    RespServer serves RESP commands from an in-memory dict.
+
+    Attributes:
+        password (Optional[str]): The password required by AUTH, if any.
+        port (int): The port the server listens on, once started.
+        connections (int): The number of connections accepted.
+        commands (List[list]): The commands received, as lists of bytes.
+        databases (List[int]): The databases selected by the clients.
+    """
+
+    def __init__(self, password: Optional[str] = None):
+        self.password = password
+        self.port = 0
+        self.connections = 0
+        self.commands: List[list] = []
+        self.databases: List[int] = []
+        self._data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    @property
+    def url(self) -> str:
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}127.0.0.1:{self.port}/0"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        authenticated = self.password is None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                args = []
+                for _ in range(int(line[1:-2])):
+                    size = int((await reader.readline())[1:-2])
+                    args.append((await reader.readexactly(size + 2))[:-2])
+                self.commands.append(args)
+                name = args[0].upper()
+                if name == b"AUTH":
+                    authenticated = args[-1].decode() == self.password
+                    reply = b"+OK\r\n" if authenticated else b"-WRONGPASS invalid password\r\n"
+                elif not authenticated:
+                    reply = b"-NOAUTH Authentication required.\r\n"
+                else:
+                    reply = self._execute(name, args[1:])
+                writer.write(reply)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _execute(self, name: bytes, args: list) -> bytes:
+        if name == b"SELECT":
+            self.databases.append(int(args[0]))
+            return b"+OK\r\n"
+        if name == b"GET":
+            return _bulk(self._get(args[0]))
+        if name == b"SET":
+            expires_at = None
+            if len(args) == 4 and args[2].upper() == b"PX":
+                expires_at = time.monotonic() + int(args[3]) / 1000
+            self._data[args[0]] = (args[1], expires_at)
+            return b"+OK\r\n"
+        if name == b"MGET":
+            return b"*%d\r\n" % len(args) + b"".join(_bulk(self._get(key)) for key in args)
+        if name == b"INCR":
+            value = int(self._get(args[0]) or 0) + 1
+            self._data[args[0]] = (str(value).encode(), None)
+            return b":%d\r\n" % value
+        return b"-ERR unknown command '%s'\r\n" % name
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        value, expires_at = self._data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from FastAPIBig.orm.base import batching
+from FastAPIBig.orm.base.batching import forget, memo_scope, stats
+
+
+@pytest.fixture
+async def shelf(books):
+    return [await books.create(title=f"book-{i}") for i in range(3)]
+
+
+@pytest.fixture
+def max_batch():
+    yield batching.configure
+    batching.configure()
+
+
+async def test_concurrent_loads_run_one_query(books, shelf):
+    batches, keys = stats.batches, stats.keys
+
+    loaded = await asyncio.gather(books.load(1), books.load("2"), books.load(1), books.load(9))
+
+    assert [book and book.title for book in loaded] == ["book-0", "book-1", "book-0", None]
+    assert stats.batches == batches + 1
+    assert stats.keys == keys + 3
+
+
+async def test_callers_of_a_batch_get_their_own_copy(books, shelf):
+    first, second = await asyncio.gather(books.load(1), books.load(1))
+
+    first.title = "changed"
+
+    assert first is not second
+    assert second.title == "book-0"
+
+
+async def test_load_many_keeps_the_order_of_the_keys(books, shelf):
+    loaded = await books.load_many([3, 9, 1])
+
+    assert [book and book.id for book in loaded] == [3, None, 1]
+
+
+async def test_max_batch_splits_the_batches(books, shelf, max_batch):
+    max_batch(max_batch=2)
+    batches = stats.batches
+
+    await books.load_many([1, 2, 3])
+
+    assert stats.batches == batches + 2
+
+
+async def test_the_memo_returns_loaded_records_until_they_are_written(books, shelf):
+    with memo_scope() as memo:
+        first = await books.load(1)
+        hits = stats.memo_hits
+        assert await books.load("1") is first
+        assert stats.memo_hits == hits + 1
+
+        forget(type(first), "1")
+        assert memo == {}
+
+        await books.load_many([1, 2])
+        await books.update("2", title="new")
+        assert list(memo) == [(type(first), 1)]
+        assert (await books.load(2)).title == "new"
+
+
+async def test_loads_after_a_write_bypass_the_batch(db_manager, books, shelf):
+    direct, batches = stats.direct, stats.batches
+
+    async with db_manager.unit_of_work():
+        await books.update(1, title="new")
+        assert (await books.load(1)).title == "new"
+
+    assert stats.direct == direct + 1
+    assert stats.batches == batches
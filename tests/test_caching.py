@@ -0,0 +1,218 @@
+import asyncio
+
+import pytest
+
+from FastAPIBig.views.apis.caching import (
+    CacheBackend,
+    CacheConfig,
+    MemoryBackend,
+    RedisBackend,
+    RedisError,
+    stats,
+)
+from FastAPIBig.views.apis.operations import RetrieveOperation, UpdateOperation
+
+from tests.models import Book, BookIn, BookOut
+from tests.resp_server import RespServer
+
+
+@pytest.fixture
+async def resp_server():
+    server = RespServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def redis(resp_server):
+    backend = RedisBackend(resp_server.url, prefix="test:")
+    yield backend
+    await backend.close()
+
+
+class FakeWriter:
+    """Collects the bytes written by `RedisBackend._command`."""
+
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data: bytes):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+def reader_of(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def test_commands_are_encoded_as_arrays_of_bulk_strings():
+    writer = FakeWriter()
+
+    reply = await RedisBackend()._command(
+        reader_of(b"+OK\r\n"), writer, ("SET", "key", b"a\r\nb", "PX", 1500)
+    )
+
+    assert reply == "OK"
+    assert writer.data == (
+        b"*5\r\n$3\r\nSET\r\n$3\r\nkey\r\n$4\r\na\r\nb\r\n$2\r\nPX\r\n$4\r\n1500\r\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "data, reply",
+    [
+        (b"+PONG\r\n", "PONG"),
+        (b":42\r\n", 42),
+        (b"$5\r\nhello\r\n", b"hello"),
+        (b"$4\r\na\r\nb\r\n", b"a\r\nb"),
+        (b"$0\r\n\r\n", b""),
+        (b"$-1\r\n", None),
+        (b"*-1\r\n", None),
+        (b"*3\r\n$1\r\na\r\n$-1\r\n*1\r\n:1\r\n", [b"a", None, [1]]),
+    ],
+)
+async def test_replies_are_parsed(data, reply):
+    assert await RedisBackend()._read_reply(reader_of(data)) == reply
+
+
+async def test_error_and_malformed_replies_raise():
+    with pytest.raises(RedisError, match="ERR boom"):
+        await RedisBackend()._read_reply(reader_of(b"-ERR boom\r\n"))
+    with pytest.raises(RedisError):
+        await RedisBackend()._read_reply(reader_of(b"?\r\n"))
+    with pytest.raises(ConnectionError):
+        await RedisBackend()._read_reply(reader_of(b"+OK"))
+
+
+async def test_redis_backend_stores_bodies_and_generations(redis, resp_server):
+    assert await redis.get("missing") is None
+
+    await redis.set("key", b"{\"a\":\r\n1}", ttl=60)
+    assert await redis.get("key") == b"{\"a\":\r\n1}"
+
+    assert await redis.generations(["book", "author"]) == [0, 0]
+    await redis.bump("book")
+    await redis.bump("book")
+    assert await redis.generations(["book", "author"]) == [2, 0]
+
+    assert [b"SET", b"test:key", b"{\"a\":\r\n1}", b"PX", b"60000"] in resp_server.commands
+    assert resp_server.connections == 1
+
+
+async def test_redis_entries_expire(redis):
+    await redis.set("key", b"body", ttl=0.01)
+    await asyncio.sleep(0.05)
+
+    assert await redis.get("key") is None
+
+
+async def test_redis_backend_authenticates_and_selects_the_database():
+    server = RespServer(password="secret")
+    await server.start()
+    try:
+        backend = RedisBackend(f"redis://:secret@127.0.0.1:{server.port}/3")
+        await backend.set("key", b"body", ttl=60)
+        assert await backend.get("key") == b"body"
+        assert server.commands[0] == [b"AUTH", b"secret"]
+        assert server.databases == [3]
+        await backend.close()
+
+        backend = RedisBackend(f"redis://:wrong@127.0.0.1:{server.port}/0")
+        with pytest.raises(RedisError, match="WRONGPASS"):
+            await backend.get("key")
+    finally:
+        await server.stop()
+
+
+async def test_error_replies_close_the_connection(redis, resp_server):
+    with pytest.raises(RedisError, match="unknown command"):
+        await redis.execute("FLUSHALL")
+    assert await redis.get("key") is None
+
+    assert resp_server.connections == 2
+
+
+def test_backends_must_implement_the_interface():
+    class Incomplete(CacheBackend):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def make_view(backend, seen=None):
+    class CachedBookView(RetrieveOperation, UpdateOperation):
+        model = Book
+        schema_in = BookIn
+        schema_out = BookOut
+        methods = ["get", "update"]
+        prefix = "/books"
+        cache = CacheConfig(ttl=60, backend=backend)
+
+        async def _update(self, request, pk, data):
+            instance = await super()._update(request, pk, data)
+            if seen is not None:
+                seen.append(await backend.generations(["book"]))
+            return instance
+
+    return CachedBookView
+
+
+@pytest.fixture
+async def book(authors, books):
+    author = await authors.create(name="author")
+    return await books.create(title="old", author_id=author.id)
+
+
+async def get_title(client, pk):
+    response = await client.get(f"/books/{pk}")
+    return response.json()["title"], response.headers.get("X-Cache")
+
+
+@pytest.mark.parametrize("backend_name", ["memory", "redis"])
+async def test_writes_invalidate_the_cached_responses(make_client, book, redis, backend_name):
+    backend = redis if backend_name == "redis" else MemoryBackend()
+    client = make_client(make_view(backend))
+
+    assert await get_title(client, book.id) == ("old", "MISS")
+    assert await get_title(client, book.id) == ("old", "HIT")
+    generations = await backend.generations(["book"])
+
+    response = await client.put(
+        f"/books/{book.id}", json={"title": "new", "author_id": book.author_id}
+    )
+    assert response.status_code == 200
+
+    assert await backend.generations(["book"]) == [generations[0] + 1]
+    assert await get_title(client, book.id) == ("new", "MISS")
+    assert await get_title(client, book.id) == ("new", "HIT")
+
+
+async def test_generations_are_bumped_once_the_write_commits(make_client, book):
+    backend, seen = MemoryBackend(), []
+    client = make_client(make_view(backend, seen))
+
+    response = await client.put(
+        f"/books/{book.id}", json={"title": "new", "author_id": book.author_id}
+    )
+
+    assert response.status_code == 200
+    assert seen == [[0]]
+    assert await backend.generations(["book"]) == [1]
+
+
+async def test_requests_are_served_when_the_backend_is_down(make_client, book, resp_server):
+    await resp_server.stop()
+    backend = RedisBackend(resp_server.url, timeout=0.2)
+    client = make_client(make_view(backend))
+    errors = stats.errors
+
+    assert await get_title(client, book.id) == ("old", None)
+    assert stats.errors == errors + 1
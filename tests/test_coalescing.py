@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import pytest
+
+from FastAPIBig.views.apis.operations import RetrieveOperation
+
+from tests.models import Book, BookOut
+
+
+@pytest.fixture
+async def book(authors, books):
+    author = await authors.create(name="author")
+    return await books.create(title="title", author_id=author.id)
+
+
+def make_view(executions):
+    class CoalescedBookView(RetrieveOperation):
+        model = Book
+        schema_out = BookOut
+        methods = ["get"]
+        prefix = "/books"
+        coalesce = True
+
+        async def _get(self, request, pk):
+            executions.append(pk)
+            await asyncio.sleep(0.05)
+            return await super()._get(request, pk)
+
+    return CoalescedBookView
+
+
+async def test_identical_requests_share_one_execution(make_client, book):
+    executions = []
+    client = make_client(make_view(executions), routing=True)
+
+    responses = await asyncio.gather(*(client.get(f"/books/{book.id}") for _ in range(3)))
+
+    assert [response.json()["title"] for response in responses] == ["title"] * 3
+    assert executions == [book.id]
+
+
+async def test_pinned_requests_are_not_coalesced(make_client, book):
+    executions = []
+    client = make_client(make_view(executions), routing=True)
+    pinned = {"cookie": f"fastapibig_primary={time.time() + 60:.3f}"}
+
+    responses = await asyncio.gather(
+        client.get(f"/books/{book.id}"),
+        client.get(f"/books/{book.id}", headers=pinned),
+        client.get(f"/books/{book.id}", headers=pinned),
+    )
+
+    assert [response.status_code for response in responses] == [200] * 3
+    assert executions == [book.id] * 3
@@ -0,0 +1,61 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from FastAPIBig.views.apis.metrics import registry
+from FastAPIBig.views.apis.operations import CreateOperation
+
+from tests.models import Author, AuthorIn, AuthorOut
+
+
+class MetricsAuthorView(CreateOperation):
+    model = Author
+    schema_in = AuthorIn
+    schema_out = AuthorOut
+    methods = ["create"]
+    prefix = "/authors"
+
+
+@pytest.fixture
+def metrics_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "metrics"
+    directory.mkdir()
+    monkeypatch.setattr(registry, "directory", str(directory))
+    monkeypatch.setattr(registry, "flush_interval", 0.05)
+    return directory
+
+
+def worker_file(directory):
+    return directory / f"{os.getpid()}.json"
+
+
+async def test_requests_are_recorded_without_touching_the_disk(make_client, metrics_dir):
+    client = make_client(MetricsAuthorView)
+
+    response = await client.post("/authors/", json={"name": "a"})
+
+    assert response.status_code == 200
+    assert not worker_file(metrics_dir).exists()
+    assert (
+        'fastapibig_route_duration_seconds_count{view="MetricsAuthorView",'
+        'method="create",stage="total"}'
+    ) in registry.render()
+
+
+async def test_snapshots_are_written_in_the_background(make_client, metrics_dir):
+    client = make_client(MetricsAuthorView)
+    await client.post("/authors/", json={"name": "a"})
+
+    await registry.start()
+    try:
+        for _ in range(100):
+            if worker_file(metrics_dir).exists():
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await registry.stop()
+
+    snapshot = json.loads(worker_file(metrics_dir).read_text())
+    assert ["MetricsAuthorView", "create", 0] in snapshot["in_flight"]
@@ -0,0 +1,117 @@
+import pytest
+
+from FastAPIBig.orm.base.pagination import encode_cursor
+from FastAPIBig.views.apis.operations import ListOperation
+from FastAPIBig.views.apis.pagination import BasePagination, CursorPagination
+
+from tests.models import Book, BookOut
+
+
+@pytest.fixture
+async def shelf(books):
+    # Ratings repeat, so orderings on them need the primary key to break ties.
+    for i, rating in enumerate([3, 1, 3, 2, 3, 1, 2]):
+        await books.create(title=f"book-{i}", rating=rating)
+
+
+async def walk(books, page_size, ordering=None):
+    """Follows the `next` cursors from the first page, then the `prev` ones back."""
+    pages = [await books.paginate(page_size, ordering=ordering)]
+    while pages[-1].next:
+        pages.append(await books.paginate(page_size, cursor=pages[-1].next, ordering=ordering))
+    backward = [pages[-1]]
+    while backward[-1].prev:
+        backward.append(
+            await books.paginate(page_size, cursor=backward[-1].prev, ordering=ordering)
+        )
+    return pages, backward[::-1]
+
+
+def ids(page):
+    return [book.id for book in page]
+
+
+async def test_pk_ordering_forward_and_backward(books, shelf):
+    pages, backward = await walk(books, 3)
+
+    assert [ids(page) for page in pages] == [[1, 2, 3], [4, 5, 6], [7]]
+    assert [ids(page) for page in backward] == [ids(page) for page in pages]
+    assert pages[0].prev is None
+    assert pages[-1].next is None
+
+
+async def test_ties_are_broken_on_the_primary_key(books, shelf):
+    pages, backward = await walk(books, 2, ordering="rating")
+
+    walked = [book.id for page in pages for book in page]
+    assert walked == [2, 6, 4, 7, 1, 3, 5]
+    assert [ids(page) for page in backward] == [ids(page) for page in pages]
+
+
+async def test_descending_ordering(books, shelf):
+    pages, backward = await walk(books, 3, ordering="-rating")
+
+    walked = [book.id for page in pages for book in page]
+    assert walked == [5, 3, 1, 7, 4, 6, 2]
+    assert [ids(page) for page in backward] == [ids(page) for page in pages]
+
+
+async def test_filters_apply_to_every_page(books, shelf):
+    first = await books.paginate(2, rating=3)
+    second = await books.paginate(2, cursor=first.next, rating=3)
+
+    assert ids(first) == [1, 3]
+    assert ids(second) == [5]
+    assert second.next is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        encode_cursor(["k"]),
+        encode_cursor({"k": [1]}),
+        encode_cursor({"k": ["x", 1]}),
+        encode_cursor({"k": [1, "1"]}),
+        encode_cursor({"k": [True, 1]}),
+        encode_cursor({"k": [{"a": 1}, 1]}),
+    ],
+)
+async def test_invalid_cursors_are_rejected(books, shelf, cursor):
+    with pytest.raises(ValueError):
+        await books.paginate(2, cursor=cursor, ordering="rating")
+
+
+async def test_list_endpoint_pages_and_rejects_bad_cursors(make_client, books, shelf):
+    class BookList(ListOperation):
+        model = Book
+        schema_out = BookOut
+        methods = ["list"]
+        prefix = "/books"
+        pagination_class = CursorPagination
+        page_size = 4
+        ordering_fields = ["rating"]
+
+    client = make_client(BookList)
+
+    first = (await client.get("/books/", params={"ordering": "-rating"})).json()
+    second = (
+        await client.get("/books/", params={"ordering": "-rating", "cursor": first["next"]})
+    ).json()
+    assert [book["id"] for book in first["results"] + second["results"]] == [
+        5, 3, 1, 7, 4, 6, 2,
+    ]
+    assert second["next"] is None
+
+    response = await client.get(
+        "/books/", params={"ordering": "rating", "cursor": encode_cursor({"k": ["x", 1]})}
+    )
+    assert response.status_code == 400
+
+
+def test_pagination_classes_must_implement_paginate():
+    class Incomplete(BasePagination):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,125 @@
+import pytest
+from sqlalchemy.dialects import sqlite
+
+from FastAPIBig.orm.base.queryset import Q
+from FastAPIBig.orm.base.statements import statement_cache
+
+
+@pytest.fixture
+async def library(authors, books):
+    ada = await authors.create(name="Ada", email="ada@example.com")
+    bob = await authors.create(name="Bob")
+    for title, rating, author in [
+        ("How to cook", 4, ada),
+        ("How to code", 5, ada),
+        ("Gardening", 2, bob),
+        ("How not to", 1, bob),
+    ]:
+        await books.create(title=title, rating=rating, author_id=author.id)
+    return ada, bob
+
+
+def titles(records):
+    return [record.title for record in records]
+
+
+def sql(queryset, kind="select"):
+    statement, params = queryset._statement(kind)
+    return str(statement.compile(dialect=sqlite.dialect())), params
+
+
+def test_values_are_bound_so_equal_shapes_share_a_statement(books):
+    first, first_params = sql(books.query().filter(Q(rating__gte=3) | ~Q(title="x")))
+    second, second_params = sql(books.query().filter(Q(rating__gte=1) | ~Q(title="y")))
+
+    assert first == second
+    assert first_params == {"p0": 3, "p1": "x"}
+    assert second_params == {"p0": 1, "p1": "y"}
+    assert " OR " in first
+
+
+def test_null_checks_change_the_statement(books):
+    is_null, _ = sql(books.query().filter(author_id__isnull=True))
+    not_null, _ = sql(books.query().filter(author_id__isnull=False))
+
+    assert "IS NULL" in is_null
+    assert "IS NOT NULL" in not_null
+
+
+def test_statements_are_reused_from_the_cache(books):
+    queryset = books.query().filter(title__startswith="How").order_by("-rating")
+    queryset._statement("select")
+    hits = statement_cache.hits
+
+    books.query().filter(title__startswith="Why").order_by("-rating")._statement("select")
+
+    assert statement_cache.hits == hits + 1
+
+
+def test_querysets_are_immutable(books):
+    base = books.query().filter(rating__gte=2)
+    refined = base.order_by("title").limit(1)
+
+    assert base._order == () and base._limit is None
+    assert refined._order == ("title",) and refined._limit == 1
+
+
+def test_unknown_columns_are_rejected(books):
+    with pytest.raises(AttributeError):
+        books.query().filter(missing=1)._statement("select")
+
+
+async def test_filters_combine_with_q_objects(books, library):
+    ada, bob = library
+    queryset = books.query().filter(
+        Q(title__startswith="How") & (Q(rating__gte=5) | Q(author_id=bob.id))
+    )
+
+    assert titles(await queryset.order_by("id").all()) == ["How to code", "How not to"]
+    assert titles(await books.query().exclude(author_id=ada.id).order_by("id").all()) == [
+        "Gardening",
+        "How not to",
+    ]
+    queryset = books.query().filter(author_id__in=[bob.id]).order_by("-rating")
+    assert titles(await queryset.all()) == ["Gardening", "How not to"]
+
+
+async def test_ordering_and_paging(books, library):
+    queryset = books.query().order_by("-rating")
+
+    assert titles(await queryset.limit(2).all()) == ["How to code", "How to cook"]
+    assert titles(await queryset.offset(1).limit(2).all()) == ["How to cook", "Gardening"]
+    assert (await queryset.first()).title == "How to code"
+    assert await books.query().filter(rating__gt=10).first() is None
+
+
+async def test_count_and_exists(books, library):
+    assert await books.query().count() == 4
+    assert await books.query().filter(title__contains="to").count() == 3
+    assert await books.query().limit(2).count() == 2
+    assert await books.query().offset(3).count() == 1
+    assert await books.query().filter(rating=5).exists()
+    assert not await books.query().filter(rating=3).exists()
+
+
+async def test_projection_returns_row_mappings(books, library):
+    rows = await books.query().only("id", "title").order_by("id").limit(1).all()
+
+    assert dict(rows[0]) == {"id": 1, "title": "How to cook"}
+
+
+async def test_prefetch_loads_relationships(authors, books, library):
+    book = await books.query().prefetch("author").filter(title="Gardening").first()
+    author = await authors.query().prefetch("books").filter(name="Ada").first()
+
+    assert book.author.name == "Bob"
+    assert sorted(titles(author.books)) == ["How to code", "How to cook"]
+
+
+async def test_async_iteration_streams_every_record(books, library):
+    queryset = books.query().order_by("id")
+
+    assert titles([book async for book in queryset]) == titles(await queryset.all())
+    assert titles([book async for book in queryset.iterator(chunk_size=1)]) == titles(
+        await queryset.all()
+    )
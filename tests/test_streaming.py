@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from FastAPIBig.orm.base.base_model import ORM
+from FastAPIBig.views.apis.operations import CreateOperation, ListOperation
+
+from tests.models import Book, BookIn, BookOut
+
+
+def make_views(stream_format):
+    class BookView(CreateOperation):
+        model = Book
+        schema_in = BookIn
+        schema_out = BookOut
+        methods = ["create"]
+        prefix = "/books"
+
+    class BookExport(ListOperation):
+        model = Book
+        schema_out = BookOut
+        methods = ["list"]
+        prefix = "/export"
+        streaming = True
+        stream_chunk_size = 2
+
+    BookExport.stream_format = stream_format
+    return BookView, BookExport
+
+
+@pytest.mark.parametrize("stream_format", ["ndjson", "json"])
+async def test_streams_every_record_under_atomic_requests(
+    make_client, authors, stream_format
+):
+    author = await authors.create(name="author")
+    client = make_client(*make_views(stream_format))
+    for i in range(5):
+        response = await client.post(
+            "/books/", json={"title": f"book-{i}", "author_id": author.id}
+        )
+        assert response.status_code == 200
+
+    response = await client.get("/export/")
+
+    assert response.status_code == 200
+    if stream_format == "ndjson":
+        records = [json.loads(line) for line in response.text.splitlines()]
+    else:
+        records = response.json()
+    assert [record["title"] for record in records] == [f"book-{i}" for i in range(5)]
+
+
+async def test_streams_of_an_empty_table(make_client):
+    client = make_client(*make_views("json"))
+
+    response = await client.get("/export/")
+
+    assert response.json() == []
+
+
+async def test_stream_on_its_own_session_leaves_the_unit_of_work_alone(books):
+    await books.create(title="a")
+    await books.create(title="b")
+
+    async with ORM.unit_of_work() as session:
+        titles = [book.title async for book in books.stream(own_session=True)]
+        assert not session.in_transaction()
+        assert titles == ["a", "b"]
+
+        titles = [book.title async for book in books.stream()]
+        assert session.in_transaction()
+        assert titles == ["a", "b"]
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from FastAPIBig.views.apis.tasks import TaskSupervisor
+
+
+async def hook(started: list, release: asyncio.Event, name: str):
+    started.append(name)
+    await release.wait()
+
+
+async def saturate(supervisor, started, release, count):
+    for i in range(count):
+        assert await supervisor.submit(hook(started, release, f"hook-{i}"))
+    await asyncio.sleep(0)
+
+
+async def test_concurrency_is_bounded_and_queued_hooks_run_in_order():
+    supervisor = TaskSupervisor(concurrency=2, queue_size=10)
+    started, release = [], asyncio.Event()
+
+    await saturate(supervisor, started, release, 4)
+    assert started == ["hook-0", "hook-1"]
+    assert supervisor.stats()["queued"] == 2
+
+    release.set()
+    await supervisor.drain()
+    assert started == ["hook-0", "hook-1", "hook-2", "hook-3"]
+    assert supervisor.stats()["completed"] == 4
+
+
+async def test_drop_policy_discards_hooks_submitted_to_a_full_queue():
+    supervisor = TaskSupervisor(concurrency=1, queue_size=1, policy="drop")
+    started, release = [], asyncio.Event()
+    await saturate(supervisor, started, release, 2)
+
+    dropped = hook(started, release, "dropped")
+    assert not await supervisor.submit(dropped)
+    assert dropped.cr_frame is None  # closed, so no "never awaited" warning
+
+    release.set()
+    await supervisor.drain()
+    assert "dropped" not in started
+    assert supervisor.stats()["dropped"] == 1
+
+
+async def test_spill_policy_queues_past_the_bound():
+    supervisor = TaskSupervisor(concurrency=1, queue_size=1, policy="spill")
+    started, release = [], asyncio.Event()
+    await saturate(supervisor, started, release, 2)
+
+    assert await supervisor.submit(hook(started, release, "spilled"))
+    assert supervisor.stats()["queued"] == 2
+
+    release.set()
+    await supervisor.drain()
+    assert started[-1] == "spilled"
+    assert supervisor.stats()["spilled"] == 1
+
+
+async def test_block_policy_waits_for_a_free_slot():
+    supervisor = TaskSupervisor(concurrency=1, queue_size=1, policy="block")
+    started, release = [], asyncio.Event()
+    await saturate(supervisor, started, release, 2)
+
+    submission = asyncio.ensure_future(
+        supervisor.submit(hook(started, release, "blocked"))
+    )
+    await asyncio.sleep(0.01)
+    assert not submission.done()
+    assert supervisor.stats()["waiting"] == 1
+
+    release.set()
+    assert await asyncio.wait_for(submission, 1)
+    await supervisor.drain()
+    assert started[-1] == "blocked"
+    assert supervisor.stats()["blocked"] == 1
+
+
+async def test_failures_are_counted_and_logged(caplog):
+    supervisor = TaskSupervisor()
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    await supervisor.submit(failing(), name="failing")
+    await supervisor.drain()
+
+    assert supervisor.stats()["failed"] == 1
+    assert "Background task failing failed" in caplog.text
+
+
+async def test_drain_cancels_hooks_past_the_timeout():
+    supervisor = TaskSupervisor(concurrency=1, queue_size=1)
+    started, release = [], asyncio.Event()
+    await saturate(supervisor, started, release, 2)
+
+    await supervisor.drain(timeout=0.01)
+
+    assert started == ["hook-0"]
+    assert supervisor.stats()["cancelled"] == 2
+    assert supervisor.stats()["running"] == 0
+
+
+def test_unknown_policies_are_rejected():
+    with pytest.raises(ValueError):
+        TaskSupervisor(policy="ignore")
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from FastAPIBig.orm.base.base_model import ORM
+from FastAPIBig.views.apis.operations import CreateOperation
+from FastAPIBig.views.apis.tasks import supervisor
+
+from tests.models import Author, AuthorIn, AuthorOut
+
+
+async def test_calls_share_one_session_and_commit_on_exit(db_manager, authors):
+    async with ORM.unit_of_work() as session:
+        await authors.create(name="a")
+        await authors.create(name="b")
+        assert db_manager.current_session() is session
+        assert session.in_transaction()
+
+    assert db_manager.current_session() is None
+    assert await authors.count() == 2
+
+
+async def test_errors_roll_the_unit_of_work_back(authors):
+    with pytest.raises(RuntimeError):
+        async with ORM.unit_of_work():
+            await authors.create(name="a")
+            raise RuntimeError
+
+    assert await authors.count() == 0
+
+
+async def test_failed_savepoint_keeps_the_rest_of_the_unit_of_work(authors):
+    async with ORM.unit_of_work():
+        await authors.create(name="kept")
+        with pytest.raises(RuntimeError):
+            async with ORM.atomic():
+                await authors.create(name="discarded")
+                raise RuntimeError
+        async with ORM.atomic():
+            await authors.create(name="saved")
+
+    assert sorted(author.name for author in await authors.all()) == ["kept", "saved"]
+
+
+async def test_on_commit_callbacks_wait_for_the_commit(authors):
+    seen = []
+
+    async def callback():
+        seen.append(await authors.count())
+
+    async with ORM.unit_of_work():
+        await authors.create(name="a")
+        await ORM.on_commit(callback)
+        assert seen == []
+    assert seen == [1]
+
+    with pytest.raises(RuntimeError):
+        async with ORM.unit_of_work():
+            await ORM.on_commit(callback)
+            raise RuntimeError
+    assert seen == [1]
+
+
+def make_view(fail_after_write: bool = False):
+    hooks = []
+
+    class AuthorView(CreateOperation):
+        model = Author
+        schema_in = AuthorIn
+        schema_out = AuthorOut
+        methods = ["create"]
+        prefix = "/authors"
+
+        async def on_create(self, request, instance):
+            # Read through a connection of its own: only committed rows are visible.
+            hooks.append(await self._model.exists(id=instance.id))
+
+        def _serialize(self, method, data):
+            if fail_after_write:
+                raise HTTPException(status_code=409)
+            return super()._serialize(method, data)
+
+    return AuthorView, hooks
+
+
+async def test_requests_commit_before_their_hooks_run(make_client, authors):
+    view, hooks = make_view()
+    client = make_client(view)
+
+    response = await client.post("/authors/", json={"name": "a"})
+    await supervisor.drain()
+
+    assert response.status_code == 200
+    assert hooks == [True]
+
+
+async def test_error_responses_roll_back_and_skip_the_hooks(make_client, authors):
+    view, hooks = make_view(fail_after_write=True)
+    client = make_client(view)
+
+    response = await client.post("/authors/", json={"name": "a"})
+    await asyncio.sleep(0)
+    await supervisor.drain()
+
+    assert response.status_code == 409
+    assert hooks == []
+    assert await authors.count() == 0